@@ -0,0 +1,362 @@
+'''The introspector benchmark suite.
+Measure the strict decorator call overhead against undecorated functions
+and the Introspector.inspect throughput across typing shapes, container
+sizes, for both passing and failing values.
+
+Usage:
+    python benchmarks/bench.py [--sizes 10 1000] [--filter list]
+        [--output results.json] [--compare baseline.json]
+'''
+
+from typing import Any, Callable
+from datetime import datetime, timezone
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'),
+)
+
+from introspector import strict  # noqa: E402
+from introspector.introspector import Introspector  # noqa: E402
+
+DEFAULT_SIZES: list[int] = [10, 1_000, 100_000, 1_000_000]
+MIN_DURATION: float = 0.2
+
+
+def measure(fx: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    '''Time a function.
+    The number of calls per run is scaled so each run lasts at least
+    MIN_DURATION seconds.
+
+    Args:
+        fx (Callable[[], Any]): The function to time.
+        repeat (int): The number of runs.
+
+    Returns:
+        dict[str, Any]: The number of calls per run and the best and
+            median durations of a call, in nanoseconds.
+    '''
+
+    number: int = 1
+
+    while True:
+        start: int = time.perf_counter_ns()
+
+        for _ in range(number):
+            fx()
+
+        duration: int = time.perf_counter_ns() - start
+
+        if duration >= MIN_DURATION * 1e9 or number >= 1_000_000:
+            break
+
+        number *= 10 if duration < MIN_DURATION * 1e8 else 2
+
+    timings: list[float] = [duration / number]
+
+    for _ in range(repeat - 1):
+        start = time.perf_counter_ns()
+
+        for _ in range(number):
+            fx()
+
+        timings.append((time.perf_counter_ns() - start) / number)
+
+    return {
+        'number': number,
+        'best_ns': min(timings),
+        'median_ns': statistics.median(timings),
+    }
+
+
+def inspecting(type_: Any, value: Any) -> Callable[[], None]:
+    '''Build a function inspecting a value.
+    The expected mismatches are swallowed.
+
+    Args:
+        type_ (Any): The typing tree.
+        value (Any): The value to inspect.
+
+    Returns:
+        Callable[[], None]: The inspecting function.
+    '''
+
+    def run() -> None:
+        try:
+            Introspector(type_, value).inspect()
+        except TypeError:
+            pass
+
+    return run
+
+
+# Each shape builds a passing value of the given size, and the failing
+# value is the same with its last item replaced by a mismatching one.
+SHAPES: dict[str, tuple[Any, Callable[[int], Any], Callable[[int], Any]]] = {
+    'list[int]': (
+        list[int],
+        lambda n: list(range(n)),
+        lambda n: list(range(n - 1)) + ['x'],
+    ),
+    'list[int | float | str | None]': (
+        list[int | float | str | None],
+        lambda n: [(i, float(i), str(i), None)[i % 4] for i in range(n)],
+        lambda n: [(i, float(i), str(i), None)[i % 4] for i in range(n - 1)]
+        + [b'x'],
+    ),
+    'list[list[int]]': (
+        list[list[int]],
+        lambda n: [list(range(10)) for _ in range(max(1, n // 10))],
+        lambda n: [list(range(10)) for _ in range(max(1, n // 10) - 1)]
+        + [list(range(9)) + ['x']],
+    ),
+    'set[int]': (
+        set[int],
+        lambda n: set(range(n)),
+        lambda n: set(range(n - 1)) | {'x'},
+    ),
+    'tuple[int, ...]': (
+        tuple[int, ...],
+        lambda n: tuple(range(n)),
+        lambda n: tuple(range(n - 1)) + ('x',),
+    ),
+    'tuple[int, str, float]': (
+        list[tuple[int, str, float]],
+        lambda n: [(i, 'a', 1.0) for i in range(n)],
+        lambda n: [(i, 'a', 1.0) for i in range(n - 1)] + [(1, 'a', 'x')],
+    ),
+    'dict[str, int]': (
+        dict[str, int],
+        lambda n: {str(i): i for i in range(n)},
+        lambda n: {**{str(i): i for i in range(n - 1)}, 'x': 'x'},
+    ),
+    'list[dict[str, int | str | None]]': (
+        list[dict[str, int | str | None]],
+        lambda n: [
+            {'a': i, 'b': 'b', 'c': None} for i in range(max(1, n // 3))
+        ],
+        lambda n: [
+            {'a': i, 'b': 'b', 'c': None} for i in range(max(1, n // 3) - 1)
+        ]
+        + [{'a': 1, 'b': 'b', 'c': 1.5}],
+    ),
+    'dict[str, list[int | None]]': (
+        dict[str, list[int | None]],
+        lambda n: {str(i): [i, None] for i in range(max(1, n // 2))},
+        lambda n: {
+            **{str(i): [i, None] for i in range(max(1, n // 2) - 1)},
+            'x': [1, 'x'],
+        },
+    ),
+}
+
+
+def bench_inspect(
+    sizes: list[int],
+    repeat: int,
+    pattern: str | None,
+) -> list[dict[str, Any]]:
+    '''Measure the Introspector.inspect throughput.
+
+    Args:
+        sizes (list[int]): The containers sizes.
+        repeat (int): The number of runs.
+        pattern (str | None): Only run the shapes containing it.
+
+    Returns:
+        list[dict[str, Any]]: The results.
+    '''
+
+    results: list[dict[str, Any]] = []
+
+    for shape, (type_, passing, failing) in SHAPES.items():
+        if pattern and pattern not in shape:
+            continue
+
+        for size in sizes:
+            for outcome, build in (('pass', passing), ('fail', failing)):
+                result: dict[str, Any] = measure(
+                    inspecting(type_, build(size)),
+                    repeat,
+                )
+                result.update(
+                    name=f'inspect {shape} [{size}] {outcome}',
+                    group='inspect',
+                    shape=shape,
+                    size=size,
+                    outcome=outcome,
+                    items_per_s=size / result['best_ns'] * 1e9,
+                )
+                results.append(result)
+                report(result)
+
+    return results
+
+
+def f0() -> None:
+    return None
+
+
+def f3(a: int, b: str, c: float) -> int:
+    return a
+
+
+def f8(
+    a: int,
+    b: str,
+    c: float,
+    d: bool,
+    e: list[int],
+    f: dict[str, int],
+    g: int | None = None,
+    h: str = 'h',
+) -> int:
+    return a
+
+
+def bench_calls(repeat: int, pattern: str | None) -> list[dict[str, Any]]:
+    '''Measure the strict decorator call overhead.
+
+    Args:
+        repeat (int): The number of runs.
+        pattern (str | None): Only run the calls containing it.
+
+    Returns:
+        list[dict[str, Any]]: The results.
+    '''
+
+    calls: dict[str, tuple[Callable[..., Any], tuple, dict]] = {
+        'f0()': (f0, (), {}),
+        'f3(a, b, c)': (f3, (1, 'b', 1.0), {}),
+        'f3(a, b=, c=)': (f3, (1,), {'b': 'b', 'c': 1.0}),
+        'f8(a, b, c, d, e, f)': (f8, (1, 'b', 1.0, True, [1], {'f': 1}), {}),
+        'f8(a, ..., h=)': (
+            f8,
+            (1, 'b', 1.0, True, [1], {'f': 1}, 2),
+            {'h': 'h'},
+        ),
+    }
+    results: list[dict[str, Any]] = []
+
+    for call, (fx, args, kwargs) in calls.items():
+        if pattern and pattern not in call:
+            continue
+
+        decorated: Callable[..., Any] = strict(fx)
+        baseline: dict[str, Any] = measure(lambda: fx(*args, **kwargs), repeat)
+        result: dict[str, Any] = measure(
+            lambda: decorated(*args, **kwargs),
+            repeat,
+        )
+        result.update(
+            name=f'call {call}',
+            group='call',
+            baseline_ns=baseline['best_ns'],
+            overhead_ns=result['best_ns'] - baseline['best_ns'],
+        )
+        results.append(result)
+        report(result)
+
+    return results
+
+
+def report(result: dict[str, Any]) -> None:
+    '''Print a result.
+
+    Args:
+        result (dict[str, Any]): The result.
+    '''
+
+    line: str = f'{result["name"]:<60} {result["best_ns"]:>14,.0f} ns'
+
+    if 'overhead_ns' in result:
+        line += f'  (+{result["overhead_ns"]:,.0f} ns)'
+
+    print(line, file=sys.stderr)
+
+
+def compare(results: list[dict[str, Any]], baseline_path: str) -> None:
+    '''Print the ratio of each result duration to a previous run.
+
+    Args:
+        results (list[dict[str, Any]]): The results.
+        baseline_path (str): The previous run results file.
+    '''
+
+    with open(baseline_path) as file:
+        baseline: dict[str, float] = {
+            result['name']: result['best_ns']
+            for result in json.load(file)['results']
+        }
+
+    print(f'\nCompared with {baseline_path}:', file=sys.stderr)
+
+    for result in results:
+        if result['name'] in baseline:
+            ratio: float = result['best_ns'] / baseline[result['name']]
+            print(f'{result["name"]:<60} x{ratio:.2f}', file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Run the introspector benchmark suite.'
+    )
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=DEFAULT_SIZES,
+        help='The containers sizes.',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='The number of runs of each benchmark.',
+    )
+    parser.add_argument(
+        '--filter',
+        help='Only run the benchmarks whose shape or call contains it.',
+    )
+    parser.add_argument(
+        '--output',
+        help='Write the results as JSON to this file (default to stdout).',
+    )
+    parser.add_argument(
+        '--compare',
+        help='A previous results file to compare with.',
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    results: list[dict[str, Any]] = bench_calls(args.repeat, args.filter)
+    results += bench_inspect(args.sizes, args.repeat, args.filter)
+    document: dict[str, Any] = {
+        'meta': {
+            'date': datetime.now(timezone.utc).isoformat(),
+            'python': sys.version,
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(document, file, indent=2)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,24 @@
 from typing import Any, Callable
-from .strict import Strict
+from . import config, memo, metrics, observe
+from .batch import validate_many
+from .containers import CheckedDict, CheckedList, CheckedSet
+from .sample import Sample
+from .strict import Strict, warmup
+
+__all__: list[str] = [
+    'CheckedDict',
+    'CheckedList',
+    'CheckedSet',
+    'Sample',
+    'Strict',
+    'config',
+    'memo',
+    'metrics',
+    'observe',
+    'strict',
+    'validate_many',
+    'warmup',
+]
 
 
 def strict(*args: Any, **kwargs: Any) -> None:
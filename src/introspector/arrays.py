@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+class Constraint:
+    '''The constraint base class of the annotated typings.
+    The constraints are given as `Annotated` metadata and are checked
+    from the value metadata only, in O(1), without reading the data.
+
+    Examples:
+        Annotated[np.ndarray, Dtype('float64'), Shape(None, 3)]
+        Annotated[array.array, Typecode('d')]
+        Annotated[memoryview, Format('B'), Ndim(1)]
+    '''
+
+    def check(self, value: Any) -> bool:
+        '''Tell if the value satisfies the constraint.
+
+        Args:
+            value (Any): The value to analyze.
+
+        Returns:
+            bool: True if the value satisfies the constraint, False
+                otherwise.
+        '''
+
+        raise NotImplementedError
+
+    def describe(self, value: Any) -> str:
+        '''Describe the value property checked by the constraint.
+
+        Args:
+            value (Any): The value.
+
+        Returns:
+            str: The description.
+        '''
+
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class Dtype(Constraint):
+    '''The data type constraint of the NumPy arrays.
+    A scalar type (np.float64, np.floating...) matches its subtypes,
+    other dtypes ('float64', np.dtype('<f8')...) must be equal.
+
+    Attributes:
+        dtype (Any): The expected data type.
+    '''
+
+    dtype: Any
+
+    def check(self, value: Any) -> bool:
+        dtype: Any = getattr(value, 'dtype', None)
+
+        if dtype is None:
+            return False
+
+        if isinstance(self.dtype, type):
+            return issubclass(dtype.type, self.dtype)
+
+        return dtype == self.dtype
+
+    def describe(self, value: Any) -> str:
+        return f'dtype {getattr(value, "dtype", None)}'
+
+
+@dataclass(frozen=True, init=False)
+class Shape(Constraint):
+    '''The shape constraint of the arrays.
+    A None dimension matches any size. The `array.array` values are
+    one dimensional.
+
+    Attributes:
+        dims (tuple[int | None, ...]): The expected dimensions.
+    '''
+
+    dims: tuple[int | None, ...]
+
+    def __init__(self, *dims: int | None) -> None:
+        '''The constructor.
+
+        Args:
+            *dims (int | None): The expected dimensions.
+        '''
+
+        object.__setattr__(self, 'dims', dims)
+
+    def check(self, value: Any) -> bool:
+        shape: tuple[int, ...] = _shape(value)
+
+        return len(shape) == len(self.dims) and all(
+            dim is None or dim == size for dim, size in zip(self.dims, shape)
+        )
+
+    def describe(self, value: Any) -> str:
+        return f'shape {_shape(value)}'
+
+
+@dataclass(frozen=True)
+class Ndim(Constraint):
+    '''The number of dimensions constraint of the arrays.
+
+    Attributes:
+        ndim (int): The expected number of dimensions.
+    '''
+
+    ndim: int
+
+    def check(self, value: Any) -> bool:
+        return len(_shape(value)) == self.ndim
+
+    def describe(self, value: Any) -> str:
+        return f'ndim {len(_shape(value))}'
+
+
+@dataclass(frozen=True)
+class Typecode(Constraint):
+    '''The type code constraint of the `array.array` values.
+
+    Attributes:
+        typecode (str): The expected type code.
+    '''
+
+    typecode: str
+
+    def check(self, value: Any) -> bool:
+        return getattr(value, 'typecode', None) == self.typecode
+
+    def describe(self, value: Any) -> str:
+        return f'typecode {getattr(value, "typecode", None)!r}'
+
+
+@dataclass(frozen=True)
+class Format(Constraint):
+    '''The format constraint of the `memoryview` values (see the
+    `struct` module syntax).
+
+    Attributes:
+        format (str): The expected format.
+    '''
+
+    format: str
+
+    def check(self, value: Any) -> bool:
+        return getattr(value, 'format', None) == self.format
+
+    def describe(self, value: Any) -> str:
+        return f'format {getattr(value, "format", None)!r}'
+
+
+def _shape(value: Any) -> tuple[int, ...]:
+    '''Get the shape of an array.
+
+    Args:
+        value (Any): The array.
+
+    Returns:
+        tuple[int, ...]: The array shape.
+    '''
+
+    shape: tuple[int, ...] | None = getattr(value, 'shape', None)
+
+    if shape is None:
+        return (len(value),) if hasattr(value, '__len__') else ()
+
+    return tuple(shape)
+
+
+def ndarray_dtype(origin: Any, args: tuple[Any, ...]) -> Dtype | None:
+    '''Get the data type constraint of a NumPy array generic typing,
+    such as `numpy.typing.NDArray[np.float64]`, without importing NumPy.
+
+    Args:
+        origin (Any): The typing main type.
+        args (tuple[Any, ...]): The typing subtypes.
+
+    Returns:
+        Dtype | None: The data type constraint, None if the typing is
+            not a NumPy array or its data type is not a class.
+    '''
+
+    if (
+        getattr(origin, '__module__', None) != 'numpy'
+        or getattr(origin, '__name__', None) != 'ndarray'
+        or len(args) != 2
+    ):
+        return None
+
+    scalars: tuple[Any, ...] = getattr(args[1], '__args__', ())
+
+    if len(scalars) == 1 and isinstance(scalars[0], type):
+        return Dtype(scalars[0])
+
+    return None
@@ -0,0 +1,204 @@
+from typing import Any, Iterator, TypeVar
+from collections import abc, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from .result import ValidationResult
+from .sample import Sample
+from .validator import Validator, compile_type
+
+DEFAULT_CHUNK_SIZE: int = 1_000
+
+
+def validate_many(
+    type_: TypeVar,
+    values: abc.Iterable[Any],
+    sample: Sample | None = None,
+    max_errors: int | None = None,
+    details: bool = True,
+    workers: int | Executor | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ValidationResult | bool]:
+    '''Validate a stream of values against a typing, yielding one result
+    per value, in order.
+    The typing is compiled once. The values are consumed as the results
+    are consumed, so a stream of any length is validated in constant
+    memory.
+
+    Examples:
+        for result in validate_many(dict[str, int], records):
+            if not result:
+                print(result)
+
+        # Fan the chunks of 10_000 values out to 8 processes.
+        validate_many(Record, records, workers=8, chunk_size=10_000)
+
+    Args:
+        type_ (TypeVar): The typing tree.
+        values (abc.Iterable[Any]): The values to validate.
+        sample (Optional, Sample | None): The sampling policy of the
+            containers items. Default to None.
+        max_errors (Optional, int | None): The maximum number of
+            mismatches collected by value. All of them if None.
+            Default to None.
+        details (Optional, bool): Whether a ValidationResult is yielded
+            by value, or only a bool telling if it matches.
+            Default to True.
+        workers (Optional, int | Executor | None): The number of worker
+            processes validating the chunks of values, or the executor
+            running them. The values are validated in the calling
+            thread if None. Default to None.
+        chunk_size (Optional, int): The number of values sent at once
+            to a worker. Default to DEFAULT_CHUNK_SIZE.
+
+    Raises:
+        TypeError: If the typing tree is malformed.
+        ValueError: If max_errors or chunk_size is lower than 1.
+
+    Returns:
+        Iterator[ValidationResult | bool]: The result of each value.
+    '''
+
+    if chunk_size < 1:
+        raise ValueError('Expected a positive chunk size.')
+
+    # Fail fast on a malformed typing or max_errors, before consuming
+    # any value.
+    validator: Validator = compile_type(type_, sample)
+    ValidationResult(max_errors)
+
+    if workers is None:
+        return _validate(validator, values, max_errors, details)
+
+    return _fan_out(
+        type_,
+        values,
+        sample,
+        max_errors,
+        details,
+        workers,
+        chunk_size,
+    )
+
+
+def _validate(
+    validator: Validator,
+    values: abc.Iterable[Any],
+    max_errors: int | None,
+    details: bool,
+) -> Iterator[ValidationResult | bool]:
+    '''Validate the values in the calling thread.
+
+    Args:
+        validator (Validator): The compiled typing.
+        values (abc.Iterable[Any]): The values to validate.
+        max_errors (int | None): The maximum number of mismatches
+            collected by value.
+        details (bool): Whether a ValidationResult is yielded by value.
+
+    Returns:
+        Iterator[ValidationResult | bool]: The result of each value.
+    '''
+
+    if not details:
+        yield from map(validator.check, values)
+        return
+
+    for value in values:
+        yield validator.report(value, max_errors)
+
+
+def _fan_out(
+    type_: TypeVar,
+    values: abc.Iterable[Any],
+    sample: Sample | None,
+    max_errors: int | None,
+    details: bool,
+    workers: int | Executor,
+    chunk_size: int,
+) -> Iterator[ValidationResult | bool]:
+    '''Validate the chunks of values in an executor.
+    The number of chunks in flight is bounded, so the memory used
+    doesn't depend on the number of values.
+
+    Args:
+        type_ (TypeVar): The typing tree.
+        values (abc.Iterable[Any]): The values to validate.
+        sample (Sample | None): The sampling policy of the containers
+            items.
+        max_errors (int | None): The maximum number of mismatches
+            collected by value.
+        details (bool): Whether a ValidationResult is yielded by value.
+        workers (int | Executor): The number of worker processes, or
+            the executor.
+        chunk_size (int): The number of values by chunk.
+
+    Returns:
+        Iterator[ValidationResult | bool]: The result of each value.
+    '''
+
+    executor: Executor = (
+        workers
+        if isinstance(workers, Executor)
+        else ProcessPoolExecutor(workers)
+    )
+    in_flight: int = 2 * getattr(executor, '_max_workers', 1)
+    futures: deque[Future] = deque()
+    iterator: abc.Iterator[Any] = iter(values)
+
+    try:
+        while True:
+            while len(futures) < in_flight:
+                chunk: list[Any] = list(islice(iterator, chunk_size))
+
+                if not chunk:
+                    break
+
+                futures.append(
+                    executor.submit(
+                        _validate_chunk,
+                        type_,
+                        chunk,
+                        sample,
+                        max_errors,
+                        details,
+                    )
+                )
+
+            if not futures:
+                return
+
+            yield from futures.popleft().result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+        if executor is not workers:
+            executor.shutdown()
+
+
+def _validate_chunk(
+    type_: TypeVar,
+    chunk: list[Any],
+    sample: Sample | None,
+    max_errors: int | None,
+    details: bool,
+) -> list[ValidationResult | bool]:
+    '''Validate a chunk of values, in a worker.
+    The typing is compiled once by worker process, on its first chunk.
+
+    Args:
+        type_ (TypeVar): The typing tree.
+        chunk (list[Any]): The values to validate.
+        sample (Sample | None): The sampling policy of the containers
+            items.
+        max_errors (int | None): The maximum number of mismatches
+            collected by value.
+        details (bool): Whether a ValidationResult is returned by value.
+
+    Returns:
+        list[ValidationResult | bool]: The result of each value.
+    '''
+
+    return list(
+        _validate(compile_type(type_, sample), chunk, max_errors, details)
+    )
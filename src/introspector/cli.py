@@ -0,0 +1,393 @@
+'''The command line validator of the JSON and JSONL files.
+
+Usage:
+    python -m introspector 'list[dict[str, int | None]]' data.json
+    python -m introspector 'dict[str, Any]' data.jsonl --workers 4
+    cat data.jsonl | python -m introspector app.models:Record -
+
+The typing applies to each line of the JSONL files. A JSON file is
+validated as a single document, except if the typing is a list and the
+document an array: its items are then streamed and validated one by one.
+'''
+
+from typing import IO, Any, Callable, Iterator, TypeVar
+from collections import deque
+import argparse
+import importlib
+import json
+import re
+import sys
+import time
+import typing
+from .batch import DEFAULT_CHUNK_SIZE, validate_many
+from .result import ValidationResult
+from .validator import compile_type, get_origin
+
+# The names available in the typing expressions.
+NAMESPACE: dict[str, Any] = {
+    **{name: getattr(typing, name) for name in typing.__all__},
+    **{
+        cls.__name__: cls
+        for cls in (int, float, complex, str, bytes, bool, list, dict)
+        + (tuple, set, frozenset, type)
+    },
+    'None': None,
+    'typing': typing,
+}
+
+_REFERENCE: re.Pattern = re.compile(r'^[A-Za-z_][\w.]*(:[A-Za-z_][\w.]*)?$')
+_READ_SIZE: int = 1 << 16
+
+
+def parse_type(expression: str) -> TypeVar:
+    '''Get the typing of a typing expression.
+
+    Args:
+        expression (str): A typing expression, such as
+            "list[dict[str, int | None]]", or the reference to a typing
+            defined in a module, such as "app.models:Record" or
+            "app.models.Record".
+
+    Raises:
+        ValueError: If the expression is not a valid typing.
+
+    Returns:
+        TypeVar: The typing.
+    '''
+
+    if _REFERENCE.match(expression) and expression not in NAMESPACE:
+        return _import(expression)
+
+    try:
+        return eval(expression, {'__builtins__': {}}, NAMESPACE)
+    except Exception as e:
+        raise ValueError(f'Invalid typing expression {expression!r}: {e}')
+
+
+def _import(reference: str) -> TypeVar:
+    '''Import a typing defined in a module.
+
+    Args:
+        reference (str): The typing reference, "module:name" or
+            "module.name".
+
+    Raises:
+        ValueError: If the typing can't be imported.
+
+    Returns:
+        TypeVar: The typing.
+    '''
+
+    if ':' in reference:
+        module, _, name = reference.partition(':')
+    else:
+        module, _, name = reference.rpartition('.')
+
+    try:
+        target: Any = importlib.import_module(module)
+
+        for attribute in name.split('.'):
+            target = getattr(target, attribute)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise ValueError(f'Can\'t import the typing {reference!r}: {e}')
+
+    return target
+
+
+def read_jsonl(
+    file: IO[str],
+    on_error: Callable[[int, str], None],
+) -> Iterator[tuple[int, Any]]:
+    '''Read the records of a JSONL file, one by line.
+
+    Args:
+        file (IO[str]): The file.
+        on_error (Callable[[int, str], None]): Called with the line
+            number and the error of the invalid JSON lines.
+
+    Returns:
+        Iterator[tuple[int, Any]]: The line number and value of each
+            record.
+    '''
+
+    for line_number, line in enumerate(file, 1):
+        if line.strip():
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                on_error(line_number, f'Invalid JSON. {e}')
+
+
+def read_json(
+    file: IO[str],
+    stream: bool,
+) -> tuple[bool, Iterator[tuple[int, Any]]]:
+    '''Read a JSON file.
+    The items of a top-level array are decoded one by one when
+    streamed, the file is never loaded at once.
+
+    Args:
+        file (IO[str]): The file.
+        stream (bool): Whether the items of a top-level array are read
+            as records.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+
+    Returns:
+        tuple[bool, Iterator[tuple[int, Any]]]: Whether the items are
+            streamed, and the index and value of each record, or the 0
+            index and the document if not streamed.
+    '''
+
+    buffer: str = file.read(_READ_SIZE)
+
+    if not stream or buffer.lstrip()[:1] != '[':
+        return False, iter([(0, json.loads(buffer + file.read()))])
+
+    return True, _read_array(file, buffer)
+
+
+def _read_array(file: IO[str], buffer: str) -> Iterator[tuple[int, Any]]:
+    '''Read the items of a top-level JSON array one by one.
+
+    Args:
+        file (IO[str]): The file.
+        buffer (str): The beginning of the file, already read.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+
+    Returns:
+        Iterator[tuple[int, Any]]: The index and value of each item.
+    '''
+
+    decoder: json.JSONDecoder = json.JSONDecoder()
+    position: int = buffer.index('[') + 1
+    index: int = 0
+    eof: bool = False
+
+    while True:
+        position = _skip_blank(buffer, position)
+        item_start: int = position
+
+        if position < len(buffer) and buffer[position] == ']':
+            return
+
+        if index and position < len(buffer):
+            if buffer[position] != ',':
+                raise json.JSONDecodeError(
+                    'Expected , or ]',
+                    buffer,
+                    position,
+                )
+
+            item_start = _skip_blank(buffer, position + 1)
+
+        try:
+            item, end = decoder.raw_decode(buffer, item_start)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+
+            end = len(buffer)
+
+        # An item must be followed by a delimiter in the buffer, so a
+        # number cut by the read size is not decoded.
+        if _skip_blank(buffer, end) >= len(buffer) and not eof:
+            chunk: str = file.read(_READ_SIZE)
+            eof = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+            continue
+
+        yield index, item
+        index += 1
+        position = end
+
+
+def _skip_blank(buffer: str, position: int) -> int:
+    '''Get the position of the next non blank character.
+
+    Args:
+        buffer (str): The text.
+        position (int): The starting position.
+
+    Returns:
+        int: The position, the text length if there is none.
+    '''
+
+    while position < len(buffer) and buffer[position] in ' \t\n\r':
+        position += 1
+
+    return position
+
+
+def main(argv: list[str] | None = None) -> int:
+    '''Run the command line validator.
+
+    Args:
+        argv (Optional, list[str] | None): The command line arguments.
+            Default to sys.argv.
+
+    Returns:
+        int: The exit code: 0 if all the records match, 1 otherwise.
+    '''
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog='python -m introspector',
+        description='Validate a JSON or JSONL file against a typing.',
+    )
+    parser.add_argument(
+        'type',
+        help='A typing expression such as "list[dict[str, int | None]]", '
+        'or a typing reference such as "app.models:Record".',
+    )
+    parser.add_argument(
+        'file',
+        nargs='?',
+        default='-',
+        help='The file to validate, "-" for stdin (default).',
+    )
+    parser.add_argument(
+        '--format',
+        choices=('json', 'jsonl'),
+        help='The file format (default to jsonl for the .jsonl and '
+        '.ndjson files and stdin, json otherwise).',
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='The number of worker processes.',
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help='The number of records sent at once to a worker.',
+    )
+    parser.add_argument(
+        '--max-errors',
+        type=int,
+        default=10,
+        help='The maximum number of errors reported by record.',
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only print the summary.',
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    for option in ('workers', 'chunk_size', 'max_errors'):
+        if getattr(args, option) is not None and getattr(args, option) < 1:
+            parser.error(
+                f'Expected at least 1 for --{option.replace("_", "-")}.'
+            )
+
+    try:
+        type_: TypeVar = parse_type(args.type)
+        compile_type(type_)
+    except (TypeError, ValueError) as e:
+        parser.error(str(e))
+
+    format_: str = args.format or (
+        'jsonl'
+        if args.file == '-' or args.file.endswith(('.jsonl', '.ndjson'))
+        else 'json'
+    )
+    label: str = 'line' if format_ == 'jsonl' else 'item'
+    counts: dict[str, int] = {'records': 0, 'invalid': 0, 'errors': 0}
+
+    def report(offset: int, message: str) -> None:
+        counts['records'] += 1
+        counts['invalid'] += 1
+        counts['errors'] += 1
+
+        if not args.quiet:
+            print(f'{label} {offset}: {message}')
+
+    try:
+        file: IO[str] = (
+            sys.stdin
+            if args.file == '-'
+            else open(args.file, encoding='utf-8')
+        )
+    except OSError as e:
+        parser.error(str(e))
+
+    start: float = time.perf_counter()
+
+    try:
+        if format_ == 'jsonl':
+            records: Iterator[tuple[int, Any]] = read_jsonl(file, report)
+        else:
+            stream: bool = get_origin(type_) is list and bool(
+                getattr(type_, '__args__', None)
+            )
+            stream, records = read_json(file, stream)
+
+            if stream:
+                type_ = type_.__args__[0]
+            else:
+                label = 'document'
+
+        offsets: deque[int] = deque()
+
+        def values() -> Iterator[Any]:
+            for offset, value in records:
+                offsets.append(offset)
+                yield value
+
+        for result in validate_many(
+            type_,
+            values(),
+            max_errors=args.max_errors,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        ):
+            offset: int = offsets.popleft()
+            counts['records'] += 1
+
+            if not result:
+                _report_result(label, offset, result, counts, args.quiet)
+    except json.JSONDecodeError as e:
+        print(f'Invalid JSON. {e}', file=sys.stderr)
+        return 1
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+    duration: float = time.perf_counter() - start
+    print(
+        f'{counts["records"]} records, {counts["invalid"]} invalid, '
+        f'{counts["errors"]} errors in {duration:.3f}s '
+        f'({counts["records"] / max(duration, 1e-9):,.0f} records/s)',
+        file=sys.stderr,
+    )
+    return 1 if counts['invalid'] else 0
+
+
+def _report_result(
+    label: str,
+    offset: int,
+    result: ValidationResult,
+    counts: dict[str, int],
+    quiet: bool,
+) -> None:
+    '''Count and print the errors of an invalid record.
+
+    Args:
+        label (str): The kind of offset (line, item...).
+        offset (int): The record offset.
+        result (ValidationResult): The record validation result.
+        counts (dict[str, int]): The counters.
+        quiet (bool): Whether the errors are not printed.
+    '''
+
+    counts['invalid'] += 1
+    counts['errors'] += len(result.mismatches)
+
+    if not quiet:
+        for line in str(result).splitlines():
+            print(f'{label} {offset}: {line}')
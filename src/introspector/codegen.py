@@ -0,0 +1,831 @@
+'''The source code generation backend.
+
+The validators interpret the typing tree node by node, paying an
+attribute lookup and a method call by node and by value. The generator
+turns a compiled typing into the source of straight-line check
+functions instead, with inlined `type(x) is int` checks, unrolled tuple
+positions and fields, and a loop by container. The source is executed
+once by validator, and once by strict function for the function
+signature check.
+
+The generated functions only tell if a value matches: on mismatch, the
+interpreted validators are run to build the error, so the messages are
+the same with both backends. The nodes the generator doesn't handle
+(sampled containers, iterators, constraints...) call their validator.
+
+Example:
+    print(dump_source(dict[str, list[int]]))
+'''
+
+from typing import Any, Callable, TypeVar
+from collections import abc
+import builtins
+import inspect
+import random
+from . import config
+from .proxy import Reporter
+from .result import ValidationResult
+from .sample import Sample
+from .validator import (
+    AnyValidator,
+    CallableValidator,
+    ClassValidator,
+    DataclassValidator,
+    DictValidator,
+    ListValidator,
+    NamedTupleValidator,
+    SetValidator,
+    TupleValidator,
+    TypedDictValidator,
+    UnionValidator,
+    Validator,
+    compile_type,
+)
+
+# The validation backends: 'interpreted' runs the validators, 'codegen'
+# runs the generated check functions.
+BACKENDS: tuple[str, ...] = ('interpreted', 'codegen')
+
+# The marker of the parameters not given to a strict function.
+_MISSING: object = object()
+
+# The generated check function and source, by validator.
+_GENERATED: dict[Validator, tuple[Callable[[Any], bool], str]] = {}
+
+# The generated signature check and wrapper source, by strict function
+# name.
+_SIGNATURES: dict[str, str] = {}
+
+
+class _Generator:
+    '''The source code generator of a set of check functions.
+
+    Attributes:
+        namespace (dict[str, Any]): The globals of the generated source:
+            the classes, constants and validators it refers to.
+        lines (list[str]): The generated source lines.
+        _functions (dict[Validator, str]): The check function name of
+            each generated validator.
+        _names (dict[int, str]): The namespace name of each object, by
+            object id.
+    '''
+
+    def __init__(self) -> None:
+        '''The constructor.'''
+
+        self.namespace: dict[str, Any] = {
+            '_MISSING': _MISSING,
+            '_type': type,
+            '_len': len,
+            '_map': map,
+            '_all': all,
+            '_callable': callable,
+        }
+        self.lines: list[str] = []
+        self._functions: dict[Validator, str] = {}
+        self._names: dict[int, str] = {}
+
+    @property
+    def source(self) -> str:
+        '''Get the generated source.
+
+        Returns:
+            str: The source.
+        '''
+
+        return '\n'.join(self.lines).lstrip('\n') + '\n'
+
+    def name(self, obj: Any, hint: str) -> str:
+        '''Get the namespace name of an object, binding it on first use.
+        The builtin classes keep their name.
+
+        Args:
+            obj (Any): The object.
+            hint (str): The name prefix.
+
+        Returns:
+            str: The namespace name.
+        '''
+
+        if id(obj) in self._names:
+            return self._names[id(obj)]
+
+        if isinstance(obj, type) and getattr(builtins, obj.__name__, None) is (
+            obj
+        ):
+            name: str = f'_{obj.__name__}'
+        else:
+            name = f'_{hint}{len(self._names)}'
+
+        self._names[id(obj)] = name
+        self.namespace[name] = obj
+        return name
+
+    def expr(self, validator: Validator, var: str) -> str:
+        '''Get the check expression of a value.
+        The plain nodes are inlined, the others call their check
+        function.
+
+        Args:
+            validator (Validator): The value validator.
+            var (str): The value expression, a variable name.
+
+        Returns:
+            str: The boolean expression.
+        '''
+
+        if type(validator) is GeneratedValidator:
+            validator = validator._validator
+
+        if type(validator) is AnyValidator:
+            return 'True'
+
+        if type(validator) is ClassValidator:
+            origin: str = self.name(validator._origin, 'class')
+            return f'({var} is None or _type({var}) is {origin})'
+
+        if type(validator) is CallableValidator:
+            return f'({var} is None or _callable({var}))'
+
+        if type(validator) is UnionValidator and validator._any:
+            return 'True'
+
+        if (
+            type(validator) is UnionValidator
+            and not validator._dispatch
+            and not validator._fallbacks
+        ):
+            leaves: str = self.name(validator._leaves, 'leaves')
+            return f'_type({var}) in {leaves}'
+
+        return f'{self.function(validator)}({var})'
+
+    def many(self, validator: Validator, var: str) -> str | None:
+        '''Get the check expression of all the items of a collection,
+        if the items are plain values checked at once by type.
+
+        Args:
+            validator (Validator): The items validator.
+            var (str): The collection expression.
+
+        Returns:
+            str | None: The boolean expression, None if the items must
+                be checked one by one.
+        '''
+
+        if type(validator) is GeneratedValidator:
+            validator = validator._validator
+
+        if self.expr(validator, 'x') == 'True':
+            return 'True'
+
+        if type(validator) is ClassValidator:
+            accepted: str = self.name(validator._accepted, 'accepted')
+            return f'{accepted}.issuperset(_map(_type, {var}))'
+
+        if type(validator) is UnionValidator and not (
+            validator._dispatch or validator._fallbacks
+        ):
+            leaves: str = self.name(validator._leaves, 'leaves')
+            return f'{leaves}.issuperset(_map(_type, {var}))'
+
+        return None
+
+    def function(self, validator: Validator) -> str:
+        '''Get the name of the check function of a validator, generating
+        it on first use.
+
+        Args:
+            validator (Validator): The validator.
+
+        Returns:
+            str: The function name.
+        '''
+
+        if validator in self._functions:
+            return self._functions[validator]
+
+        name: str = f'check_{len(self._functions)}'
+        self._functions[validator] = name
+        body: list[str] | None = self._body(validator)
+
+        if body is None:
+            # The node is not generated, its validator is called.
+            self.namespace[name] = validator.check
+            return name
+
+        self.lines.extend(('', '', f'def {name}(v):'))
+        self.lines.extend(f'    {line}' for line in body)
+        return name
+
+    def _body(self, validator: Validator) -> list[str] | None:
+        '''Generate the body of a check function.
+
+        Args:
+            validator (Validator): The validator.
+
+        Returns:
+            list[str] | None: The function body lines, None if the
+                validator is not generated.
+        '''
+
+        kind: type = type(validator)
+
+        if kind in (ListValidator, SetValidator) and not validator._sample:
+            return self._container(validator, ((validator._item, 'v'),))
+
+        if kind is DictValidator and not validator._sample:
+            return self._container(
+                validator,
+                ((validator._key, 'v'), (validator._val, 'v.values()')),
+            )
+
+        if kind is TupleValidator and not validator._sample:
+            return self._tuple(validator)
+
+        if kind in (DataclassValidator, NamedTupleValidator):
+            return self._struct(validator)
+
+        if kind is TypedDictValidator:
+            return self._typed_dict(validator)
+
+        if kind is UnionValidator:
+            return self._union(validator)
+
+        return None
+
+    def _container(
+        self,
+        validator: ListValidator | DictValidator,
+        items: tuple[tuple[Validator, str], ...],
+    ) -> list[str]:
+        '''Generate the check of a list, set or dict.
+
+        Args:
+            validator (ListValidator | DictValidator): The validator.
+            items (tuple[tuple[Validator, str], ...]): The validator and
+                collection expression of each kind of items (the dict
+                keys and values).
+
+        Returns:
+            list[str]: The function body lines.
+        '''
+
+        origin: str = self.name(validator._origin, 'class')
+        body: list[str] = [
+            'if v is None:',
+            '    return True',
+            f'if _type(v) is not {origin}:',
+            # The checked containers are recognized by the validator.
+            f'    return {self.name(validator, "validator")}._checked(v)',
+        ]
+
+        for item, collection in items:
+            many: str | None = self.many(item, collection)
+
+            if many == 'True':
+                continue
+            elif many:
+                body.extend((f'if not {many}:', '    return False'))
+            else:
+                body.extend(
+                    (
+                        f'for x in {collection}:',
+                        f'    if not {self.expr(item, "x")}:',
+                        '        return False',
+                    )
+                )
+
+        body.append('return True')
+        return body
+
+    def _tuple(self, validator: TupleValidator) -> list[str]:
+        '''Generate the check of a tuple, unrolled by position.
+
+        Args:
+            validator (TupleValidator): The validator.
+
+        Returns:
+            list[str]: The function body lines.
+        '''
+
+        if validator._variadic:
+            return self._container(validator, ((validator._variadic, 'v'),))
+
+        size: int = len(validator._items)
+        body: list[str] = [
+            'if v is None:',
+            '    return True',
+            f'if _type(v) is not _tuple or _len(v) != {size}:',
+            '    return False',
+        ]
+        self.name(tuple, 'class')
+
+        if size:
+            body.append(f'{", ".join(f"x{i}" for i in range(size))}, = v')
+
+        return body + self._all(
+            self.expr(item, f'x{i}') for i, item in enumerate(validator._items)
+        )
+
+    def _struct(
+        self,
+        validator: DataclassValidator | NamedTupleValidator,
+    ) -> list[str] | None:
+        '''Generate the check of a dataclass or named tuple, unrolled by
+        field.
+
+        Args:
+            validator (DataclassValidator | NamedTupleValidator): The
+                validator.
+
+        Returns:
+            list[str] | None: The function body lines, None if the
+                fields typings can't be resolved.
+        '''
+
+        try:
+            fields: tuple[tuple[str, Validator], ...] = validator._plan()
+        except TypeError:
+            return None
+
+        body: list[str] = [
+            'if v is None:',
+            '    return True',
+            f'if _type(v) is not {self.name(validator._origin, "class")}:',
+            '    return False',
+        ]
+        body.extend(
+            f'x{i} = v.{name}' for i, (name, _) in enumerate(fields)
+        )
+        return body + self._all(
+            self.expr(item, f'x{i}') for i, (_, item) in enumerate(fields)
+        )
+
+    def _typed_dict(self, validator: TypedDictValidator) -> list[str] | None:
+        '''Generate the check of a typed dict, unrolled by key.
+
+        Args:
+            validator (TypedDictValidator): The validator.
+
+        Returns:
+            list[str] | None: The function body lines, None if the keys
+                typings can't be resolved.
+        '''
+
+        try:
+            fields: tuple[tuple[str, Validator], ...] = validator._plan()
+        except TypeError:
+            return None
+
+        required: str = self.name(validator._required, 'keys')
+        keys: str = self.name(validator._keys, 'keys')
+        self.name(dict, 'class')
+        body: list[str] = [
+            'if v is None:',
+            '    return True',
+            f'if _type(v) is not _dict or not {required} <= v.keys() <= '
+            f'{keys}:',
+            '    return False',
+        ]
+
+        for name, item in fields:
+            expr: str = self.expr(item, 'x')
+
+            if expr == 'True':
+                continue
+            elif name in validator._required:
+                body.extend(
+                    (
+                        f'x = v[{name!r}]',
+                        f'if not {expr}:',
+                        '    return False',
+                    )
+                )
+            else:
+                body.extend(
+                    (
+                        f'if {name!r} in v:',
+                        f'    x = v[{name!r}]',
+                        f'    if not {expr}:',
+                        '        return False',
+                    )
+                )
+
+        body.append('return True')
+        return body
+
+    def _union(self, validator: UnionValidator) -> list[str]:
+        '''Generate the check of a union, dispatched on the value type.
+
+        Args:
+            validator (UnionValidator): The validator.
+
+        Returns:
+            list[str]: The function body lines.
+        '''
+
+        if validator._any:
+            return ['return True']
+
+        fallbacks: list[str] = [
+            self.expr(member, 'v') for member in validator._fallbacks
+        ]
+        body: list[str] = [
+            't = _type(v)',
+            f'if t in {self.name(validator._leaves, "leaves")}:',
+            '    return True',
+        ]
+
+        for origin, members in validator._dispatch.items():
+            body.extend(
+                (
+                    f'if t is {self.name(origin, "class")}:',
+                    '    return '
+                    + ' or '.join(
+                        [self.expr(member, 'v') for member in members]
+                        + fallbacks
+                    ),
+                )
+            )
+
+        # The fallbacks and the checked containers are left to the
+        # validator.
+        body.append(f'return {self.name(validator, "validator")}.check(v)')
+        return body
+
+    def _all(self, exprs: abc.Iterable[str]) -> list[str]:
+        '''Generate the return of a conjunction.
+
+        Args:
+            exprs (abc.Iterable[str]): The boolean expressions.
+
+        Returns:
+            list[str]: The return lines.
+        '''
+
+        exprs = [expr for expr in exprs if expr != 'True']
+
+        if not exprs:
+            return ['return True']
+
+        return (
+            ['return (']
+            + [f'    {expr}' for expr in exprs[:1]]
+            + [f'    and {expr}' for expr in exprs[1:]]
+            + [')']
+        )
+
+    def execute(self) -> None:
+        '''Execute the generated source into the namespace.'''
+
+        exec(compile(self.source, '<introspector>', 'exec'), self.namespace)
+
+
+def generate(validator: Validator) -> Callable[[Any], bool]:
+    '''Get the generated check function of a validator.
+    The source is generated and executed once by validator.
+
+    Args:
+        validator (Validator): The validator.
+
+    Returns:
+        Callable[[Any], bool]: The check function, telling if a value
+            matches.
+    '''
+
+    try:
+        return _GENERATED[validator][0]
+    except KeyError:
+        pass
+
+    generator: _Generator = _Generator()
+    name: str = generator.function(validator)
+    generator.execute()
+    _GENERATED[validator] = (generator.namespace[name], generator.source)
+    return generator.namespace[name]
+
+
+def _bind_sign(
+    generator: _Generator,
+    signature: inspect.Signature,
+    validators: dict[str, Validator | None],
+    bad_defaults: abc.Collection[str],
+    defaults: bool = False,
+) -> tuple[list[str], list[str], list[str]]:
+    '''Generate the parameters of a strict function signature, and the
+    checks of its arguments.
+
+    Args:
+        generator (_Generator): The source generator.
+        signature (inspect.Signature): The strict function signature.
+        validators (dict[str, Validator | None]): The validator of each
+            parameter, None if ignored.
+        bad_defaults (abc.Collection[str]): The parameters which default
+            value does not match with their typing.
+        defaults (Optional, bool): Whether the parameters keep their
+            default value, so the arguments can be forwarded to the
+            strict function, instead of the missing marker.
+            Default to False.
+
+    Returns:
+        tuple[list[str], list[str], list[str]]: The parameters, the
+            check expressions and the arguments forwarding the
+            parameters.
+    '''
+
+    params: list[str] = []
+    exprs: list[str] = []
+    forward: list[str] = []
+    positional_only: bool = False
+
+    for param in signature.parameters.values():
+        validator: Validator | None = validators.get(param.name)
+        missing: str = '_MISSING'
+
+        if defaults and param.default is not inspect._empty:
+            missing = generator.name(param.default, 'default')
+
+        if param.kind is param.POSITIONAL_ONLY:
+            positional_only = True
+        elif positional_only:
+            params.append('/')
+            positional_only = False
+
+        if param.kind is param.KEYWORD_ONLY and '*' not in ''.join(params):
+            params.append('*')
+
+        if param.kind is param.VAR_POSITIONAL:
+            params.append(f'*{param.name}')
+            forward.append(f'*{param.name}')
+        elif param.kind is param.VAR_KEYWORD:
+            params.append(f'**{param.name}')
+            forward.append(f'**{param.name}')
+        else:
+            params.append(
+                param.name
+                if param.default is inspect._empty
+                else f'{param.name}={missing}'
+            )
+            forward.append(
+                f'{param.name}={param.name}'
+                if param.kind is param.KEYWORD_ONLY
+                else param.name
+            )
+
+        if validator is None:
+            continue
+
+        expr: str = generator.expr(validator, param.name)
+
+        if param.kind is param.VAR_POSITIONAL:
+            expr = generator.many(validator, param.name) or (
+                f'_all({generator.expr(validator, "x")} '
+                f'for x in {param.name})'
+            )
+        elif param.kind is param.VAR_KEYWORD:
+            values: str = f'{param.name}.values()'
+            expr = generator.many(validator, values) or (
+                f'_all({generator.expr(validator, "x")} for x in {values})'
+            )
+        elif param.name in bad_defaults:
+            expr = f'({param.name} is not {missing} and {expr})'
+        elif param.default is not inspect._empty:
+            expr = f'({param.name} is {missing} or {expr})'
+
+        exprs.append(expr)
+
+    if positional_only:
+        params.append('/')
+
+    return params, exprs, forward
+
+
+def generate_sign(
+    name: str,
+    signature: inspect.Signature,
+    validators: dict[str, Validator | None],
+    bad_defaults: abc.Collection[str],
+) -> Callable[..., bool] | None:
+    '''Generate the check function of a strict function arguments.
+    The function has the parameters of the strict function, so the
+    arguments are bound natively, and its checks are inlined.
+
+    Args:
+        name (str): The strict function full name.
+        signature (inspect.Signature): The strict function signature.
+        validators (dict[str, Validator | None]): The validator of each
+            parameter, None if ignored. The validator of the *args
+            parameter checks each extra positional argument, the one of
+            the **kwargs parameter each extra named argument.
+        bad_defaults (abc.Collection[str]): The parameters which default
+            value does not match with their typing.
+
+    Returns:
+        Callable[..., bool] | None: The check function, telling if the
+            arguments match, None if the parameters names collide with
+            the generated globals.
+    '''
+
+    generator: _Generator = _Generator()
+    params, exprs, _ = _bind_sign(
+        generator,
+        signature,
+        validators,
+        bad_defaults,
+    )
+
+    # A parameter named like a generated global would shadow it.
+    if generator.namespace.keys() & signature.parameters.keys():
+        return None
+
+    generator.lines.extend(('', '', f'def check_sign({", ".join(params)}):'))
+    generator.lines.extend(f'    {line}' for line in generator._all(exprs))
+    generator.execute()
+    _SIGNATURES[name] = generator.source
+    return generator.namespace['check_sign']
+
+
+def generate_wrapper(
+    fx: Callable[..., Any],
+    signature: inspect.Signature,
+    validators: dict[str, Validator | None],
+    bad_defaults: abc.Collection[str],
+    retval_validator: Validator,
+    rate: float,
+    controls: tuple[Callable[..., None], Callable[[Any], Any]],
+) -> Callable[..., Any] | None:
+    '''Generate the wrapper of a strict function: the switch and rate
+    checks, the inlined arguments checks, the direct call of the
+    function and the inlined return value check, in a single function
+    with the parameters of the strict function.
+    The parameters keep their default value, so the arguments are
+    forwarded as is. On mismatch, the interpreted controls raise the
+    error.
+
+    Args:
+        fx (Callable[..., Any]): The strict function.
+        signature (inspect.Signature): The strict function signature.
+        validators (dict[str, Validator | None]): The validator of each
+            parameter, None if ignored.
+        bad_defaults (abc.Collection[str]): The parameters which default
+            value does not match with their typing.
+        retval_validator (Validator): The return value validator.
+        rate (float): The fraction of the calls that are controlled.
+        controls (tuple[Callable[..., None], Callable[[Any], Any]]): The
+            interpreted arguments control, and return value control.
+
+    Returns:
+        Callable[..., Any] | None: The wrapper, None if the parameters
+            names collide with the generated globals.
+    '''
+
+    generator: _Generator = _Generator()
+    generator.namespace.update(
+        {
+            '_config': config,
+            '_fx': fx,
+            '_inspect_sign': controls[0],
+            '_inspect_retval': controls[1],
+        }
+    )
+    params, exprs, forward = _bind_sign(
+        generator,
+        signature,
+        validators,
+        bad_defaults,
+        defaults=True,
+    )
+    retval: str = generator.expr(retval_validator, '_retval')
+    condition: str = 'not _config.enabled'
+
+    if rate != 1:
+        generator.namespace['_random'] = random.random
+        condition += f' or _random() >= {rate!r}'
+
+    if (generator.namespace.keys() | {'_ok', '_retval'}) & (
+        signature.parameters.keys()
+    ):
+        return None
+
+    call: str = f'_fx({", ".join(forward)})'
+    # The conjunction of the checks is assigned instead of returned.
+    checks: list[str] = generator._all(exprs)
+    checks[0] = checks[0].replace('return', '_ok =', 1)
+    generator.lines.extend(
+        (
+            '',
+            '',
+            f'def wrapper({", ".join(params)}):',
+            f'    if {condition}:',
+            f'        return {call}',
+            '',
+            '    try:',
+            *(f'        {line}' for line in checks),
+            '    except RecursionError:',
+            '        _ok = False',
+            '',
+            '    if not _ok:',
+            f'        _inspect_sign({", ".join(forward)})',
+            '',
+            f'    _retval = {call}',
+            '',
+            '    try:',
+            f'        if {retval}:',
+            '            return _retval',
+            '    except RecursionError:',
+            '        pass',
+            '',
+            '    return _inspect_retval(_retval)',
+        )
+    )
+    generator.execute()
+    name: str = f'{fx.__module__}.{fx.__qualname__}'
+    _SIGNATURES[name] = f'{_SIGNATURES.get(name, "")}\n\n{generator.source}'
+    wrapper: Callable[..., Any] = generator.namespace['wrapper']
+    wrapper.__name__ = fx.__name__
+    wrapper.__qualname__ = fx.__qualname__
+    return wrapper
+
+
+def dump_source(target: TypeVar | str, sample: Sample | None = None) -> str:
+    '''Get the generated source of a typing, or of the arguments check
+    and the wrapper of a strict function, for debugging.
+
+    Args:
+        target (TypeVar | str): The typing, or the strict function full
+            name ('module.qualname').
+        sample (Optional, Sample | None): The sampling policy of the
+            containers items of the typing. Default to None.
+
+    Raises:
+        ValueError: If no source was generated for the function.
+
+    Returns:
+        str: The generated source.
+    '''
+
+    if isinstance(target, str):
+        try:
+            return _SIGNATURES[target]
+        except KeyError:
+            raise ValueError(f'No generated source for {target!r}.')
+
+    validator: Validator = compile_type(target, sample)
+    generate(validator)
+    return _GENERATED[validator][1]
+
+
+class GeneratedValidator(Validator):
+    '''The validator running the generated check function of another
+    validator. The other validator builds the errors.
+
+    Attributes:
+        _validator (Validator): The generated validator.
+        _check (Callable[[Any], bool]): The generated check function.
+    '''
+
+    def __init__(self, validator: Validator) -> None:
+        '''The constructor.
+
+        Args:
+            validator (Validator): The generated validator.
+        '''
+
+        super().__init__(validator._type)
+        self._validator: Validator = validator
+        self._check: Callable[[Any], bool] = generate(validator)
+        self.lazy = validator.lazy
+        self.immutable = validator.immutable
+        self.flat = validator.flat
+
+    def validate(self, value: Any) -> None:
+        try:
+            if self._check(value):
+                return
+        except RecursionError:
+            pass
+
+        self._validator.validate(value)
+
+    def check(self, value: Any) -> bool:
+        return self._check(value)
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        self._validator.collect(value, path, result)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        return ((self._validator, value),)
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        return self._validator.wrap(value, label, report)
@@ -0,0 +1,39 @@
+import os
+
+# The environment variable which turns the typing controls off when set
+# to a false value, read once at import time.
+ENV_VAR: str = 'INTROSPECTOR_STRICT'
+
+enabled: bool = os.environ.get(ENV_VAR, '1').strip().lower() not in (
+    '0',
+    'false',
+    'no',
+    'off',
+)
+
+
+def enable() -> None:
+    '''Turn the typing controls on for the whole process.'''
+
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    '''Turn the typing controls off for the whole process.
+    The functions decorated while the controls are off are not wrapped
+    at all. The functions decorated before are called without control.
+    '''
+
+    global enabled
+    enabled = False
+
+
+def is_enabled() -> bool:
+    '''Tell if the typing controls are on.
+
+    Returns:
+        bool: True if the controls are on, False otherwise.
+    '''
+
+    return enabled
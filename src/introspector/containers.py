@@ -0,0 +1,352 @@
+'''The checked containers, validating their items on mutation.
+
+A long-lived container passed to the strict functions on every call is
+traversed by each call. A checked container validates its items once,
+when they are inserted, and is accepted as is by the validators of its
+typing, so the validation cost moves from O(size) by call to O(delta)
+by mutation.
+
+Example:
+    cache: CheckedDict[str, Item] = CheckedDict[str, Item](load())
+    cache['a'] = Item(...)  # validated
+    cache['b'] = 'b'  # TypeError
+
+    @strict
+    def handle(cache: dict[str, Item]) -> None:  # O(1) control
+        ...
+
+Only the container own mutations are controlled: the mutable items
+(lists, dicts...) must not be mutated once inserted, or be checked
+containers themselves.
+'''
+
+from typing import Any, ClassVar, Iterable, TypeVar
+from collections import abc
+from .validator import Validator, compile_type
+
+# The parameterized checked classes, by base class and typing.
+_CLASSES: dict[tuple[type, TypeVar], type] = {}
+
+
+def _parameterize(cls: type, typing: TypeVar) -> type:
+    '''Get the checked class of a typing.
+    The classes are built once by typing, so the instances of the same
+    typing share their class.
+
+    Args:
+        cls (type): The unparameterized checked class.
+        typing (TypeVar): The container typing, such as list[int].
+
+    Raises:
+        TypeError: If the class is already parameterized or the typing
+            is malformed.
+
+    Returns:
+        type: The checked class.
+    '''
+
+    if hasattr(cls, '__checked__'):
+        raise TypeError(f'{cls.__name__} is already parameterized.')
+
+    try:
+        return _CLASSES[cls, typing]
+    except KeyError:
+        pass
+
+    validators: tuple[Validator, ...] = tuple(
+        compile_type(arg) for arg in typing.__args__
+    )
+    name: str = f'{cls.__name__}[{", ".join(map(_name, typing.__args__))}]'
+    checked: type = type(
+        name,
+        (cls,),
+        {
+            '__checked__': typing,
+            '__module__': cls.__module__,
+            '__qualname__': name,
+            '_validators': validators,
+        },
+    )
+    _CLASSES[cls, typing] = checked
+    return checked
+
+
+def _name(typing: TypeVar) -> str:
+    '''Get the name of a typing, as written.
+
+    Args:
+        typing (TypeVar): The typing.
+
+    Returns:
+        str: The typing name.
+    '''
+
+    if isinstance(typing, type) and not hasattr(typing, '__origin__'):
+        return typing.__qualname__
+
+    return repr(typing).replace('typing.', '')
+
+
+def _restore(cls: type, typing: TypeVar, items: Any) -> Any:
+    '''Rebuild a pickled checked container.
+
+    Args:
+        cls (type): The unparameterized checked class.
+        typing (TypeVar): The container typing.
+        items (Any): The container items.
+
+    Returns:
+        Any: The checked container.
+    '''
+
+    return _parameterize(cls, typing)(items)
+
+
+class _Checked:
+    '''The checked containers base class.
+
+    Attributes:
+        __checked__ (ClassVar[TypeVar]): The container typing, such as
+            list[int]. The validators of this typing accept the
+            container without checking its items.
+        _validators (ClassVar[tuple[Validator, ...]]): The validator of
+            each typing argument (the items, or the keys and values).
+    '''
+
+    __checked__: ClassVar[TypeVar]
+    _validators: ClassVar[tuple[Validator, ...]]
+
+    def _check(self, validator: Validator, items: Iterable[Any]) -> None:
+        '''Validate the inserted items.
+
+        Args:
+            validator (Validator): The items validator.
+            items (Iterable[Any]): The inserted items.
+
+        Raises:
+            TypeError: If an item does not match with the typing.
+        '''
+
+        if validator.check_many(items):
+            return
+
+        for item in items:
+            try:
+                validator.validate(item)
+            except TypeError as e:
+                raise TypeError(f'[{type(self).__name__}] Item error. {e}')
+
+    def _ensure_parameterized(self) -> None:
+        '''Ensure the container class is parameterized.
+
+        Raises:
+            TypeError: If the class is not parameterized.
+        '''
+
+        if not hasattr(type(self), '__checked__'):
+            raise TypeError(
+                f'Expected a parameterized {type(self).__name__}, such as '
+                f'{type(self).__name__}[int].'
+            )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            _restore,
+            (
+                type(self).__base__,
+                self.__checked__,
+                self._items(),
+            ),
+        )
+
+    def _items(self) -> Any:
+        '''Get the container items, as a builtin container.
+
+        Returns:
+            Any: The items.
+        '''
+
+        raise NotImplementedError
+
+
+class CheckedList(_Checked, list):
+    '''A list validating its items when they are inserted.
+    Example:
+        - CheckedList[int]([1, 2]): accepted as is by list[int]
+    '''
+
+    def __class_getitem__(cls, item: TypeVar) -> type:
+        return _parameterize(cls, list[item])
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        '''The constructor.
+
+        Args:
+            iterable (Optional, Iterable[Any]): The items.
+                Default to ().
+
+        Raises:
+            TypeError: If the class is not parameterized, or an item
+                does not match with the typing.
+        '''
+
+        self._ensure_parameterized()
+        items: list[Any] = list(iterable)
+        self._check(self._validators[0], items)
+        super().__init__(items)
+
+    def append(self, item: Any) -> None:
+        self._check(self._validators[0], (item,))
+        super().append(item)
+
+    def insert(self, index: int, item: Any) -> None:
+        self._check(self._validators[0], (item,))
+        super().insert(index, item)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        items: list[Any] = list(iterable)
+        self._check(self._validators[0], items)
+        super().extend(items)
+
+    def __iadd__(self, iterable: Iterable[Any]) -> 'CheckedList':
+        self.extend(iterable)
+        return self
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            self._check(self._validators[0], value)
+        else:
+            self._check(self._validators[0], (value,))
+
+        super().__setitem__(index, value)
+
+    def copy(self) -> 'CheckedList':
+        checked: CheckedList = list.__new__(type(self))
+        list.extend(checked, self)
+        return checked
+
+    def _items(self) -> list[Any]:
+        return list(self)
+
+
+class CheckedDict(_Checked, dict):
+    '''A dict validating its keys and values when they are inserted.
+    Example:
+        - CheckedDict[str, int]({'a': 1}): accepted as is by
+            dict[str, int]
+    '''
+
+    def __class_getitem__(cls, params: tuple[TypeVar, TypeVar]) -> type:
+        if not isinstance(params, tuple) or len(params) != 2:
+            raise TypeError('Missing key/val in dict type definition.')
+
+        return _parameterize(cls, dict[params])
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        '''The constructor.
+
+        Args:
+            *args (Any): A mapping or an iterable of key/value pairs.
+            **kwargs (Any): Named items.
+
+        Raises:
+            TypeError: If the class is not parameterized, or an item
+                does not match with the typing.
+        '''
+
+        self._ensure_parameterized()
+        super().__init__()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._check(self._validators[0], (key,))
+        self._check(self._validators[1], (value,))
+        super().__setitem__(key, value)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        # The items are validated before any is inserted, so a
+        # mismatching update leaves the dict unchanged.
+        items: dict[Any, Any] = dict(*args, **kwargs)
+        self._check(self._validators[0], items.keys())
+        self._check(self._validators[1], items.values())
+        super().update(items)
+
+    def __ior__(self, other: Any) -> 'CheckedDict':
+        self.update(other)
+        return self
+
+    def copy(self) -> 'CheckedDict':
+        checked: CheckedDict = dict.__new__(type(self))
+        dict.update(checked, self)
+        return checked
+
+    @classmethod
+    def fromkeys(cls, iterable: Iterable[Any], value: Any = None) -> Any:
+        return cls(dict.fromkeys(iterable, value))
+
+    def _items(self) -> dict[Any, Any]:
+        return dict(self)
+
+
+class CheckedSet(_Checked, set):
+    '''A set validating its items when they are inserted.
+    Example:
+        - CheckedSet[str]({'a', 'b'}): accepted as is by set[str]
+    '''
+
+    def __class_getitem__(cls, item: TypeVar) -> type:
+        return _parameterize(cls, set[item])
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        '''The constructor.
+
+        Args:
+            iterable (Optional, Iterable[Any]): The items.
+                Default to ().
+
+        Raises:
+            TypeError: If the class is not parameterized, or an item
+                does not match with the typing.
+        '''
+
+        self._ensure_parameterized()
+        items: set[Any] = set(iterable)
+        self._check(self._validators[0], items)
+        super().__init__(items)
+
+    def add(self, item: Any) -> None:
+        self._check(self._validators[0], (item,))
+        super().add(item)
+
+    def update(self, *iterables: Iterable[Any]) -> None:
+        items: set[Any] = set().union(*iterables)
+        self._check(self._validators[0], items)
+        super().update(items)
+
+    def symmetric_difference_update(self, iterable: Iterable[Any]) -> None:
+        items: set[Any] = set(iterable)
+        self._check(self._validators[0], items - self)
+        super().symmetric_difference_update(items)
+
+    def __ior__(self, other: abc.Set) -> 'CheckedSet':
+        self.update(other)
+        return self
+
+    def __ixor__(self, other: abc.Set) -> 'CheckedSet':
+        self.symmetric_difference_update(other)
+        return self
+
+    def copy(self) -> 'CheckedSet':
+        checked: CheckedSet = set.__new__(type(self))
+        set.update(checked, self)
+        return checked
+
+    def _items(self) -> set[Any]:
+        return set(self)
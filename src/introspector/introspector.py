@@ -1,36 +1,78 @@
-from types import UnionType
-from typing import Any, TypeVar, Union
-from collections import abc
+from typing import Any, TypeVar
 import inspect
+from . import walker
+from .codegen import BACKENDS, GeneratedValidator
+from .result import ValidationResult
+from .sample import Sample
+from .validator import Validator, compile_type, get_origin
 
 
 class Introspector:
     '''The inspector class implementation.
     Offer tool to compare a typing to a value.
+    The typing tree is compiled once into a validator (see
+    `validator.compile_type`) which is shared by every inspection of
+    the same typing.
 
     Attributes:
         _type (TypeVar): The type tree.
         _value (Any): The data structure root value.
+        _sample (Sample | None): The sampling policy of the containers
+            items.
+        _engine (str): The validation engine, see `walker.ENGINES`.
+        _backend (str): The validation backend, see `codegen.BACKENDS`.
     '''
 
-    def __init__(self, type_: TypeVar, value: Any) -> None:
+    def __init__(
+        self,
+        type_: TypeVar,
+        value: Any,
+        sample: Sample | None = None,
+        engine: str = 'auto',
+        backend: str = 'interpreted',
+    ) -> None:
         '''The constructor.
 
         Args:
             type_ (TypeVar): The type tree.
             _value (Any): The data structure root value.
+            sample (Optional, Sample | None): The sampling policy of the
+                containers items. All the items are analyzed if None.
+                Default to None.
+            engine (Optional, str): The validation engine: 'auto' runs
+                the recursive validators and falls back on the iterative
+                walker if the value is too deeply nested, 'iterative'
+                always runs the walker. Default to 'auto'.
+            backend (Optional, str): The validation backend:
+                'interpreted' runs the validators, 'codegen' runs their
+                generated source (see `codegen`).
+                Default to 'interpreted'.
+
+        Raises:
+            ValueError: If the engine or the backend is unknown.
         '''
 
+        if engine not in walker.ENGINES:
+            raise ValueError(f'Expected an engine in {walker.ENGINES}.')
+        if backend not in BACKENDS:
+            raise ValueError(f'Expected a backend in {BACKENDS}.')
+
         self._type: TypeVar = type_
         self._value: Any = value
+        self._sample: Sample | None = sample
+        self._engine: str = engine
+        self._backend: str = backend
 
     def inspect(
         self,
         type_: TypeVar | inspect._empty = inspect._empty,
         value: Any | inspect._empty = inspect._empty,
-    ) -> None:
+    ) -> Any:
         '''Analyze the typing tree and compare each typing node
         with the given value.
+        The iterators, iterables and generators can't be analyzed
+        without being consumed, they are returned wrapped into a proxy
+        which controls their items while they are consumed.
 
         Args:
             type_ (Optional, TypeVar): The typing tree.
@@ -41,19 +83,47 @@ class Introspector:
         Raises:
             TypeError: If the value data structure does not match
                 with the given typing.
+
+        Returns:
+            Any: The value, or its controlling proxy.
         '''
 
         if type_ is inspect._empty or value is inspect._empty:
             type_ = self._type
             value = self._value
 
-        origin: TypeVar = self._get_origin(type_)
+        validator: Validator = compile_type(type_, self._sample)
+
+        if self._backend == 'codegen':
+            validator = GeneratedValidator(validator)
 
-        if origin != Any and value is not None and type(origin) is not TypeVar:
-            self._inspect_origin(type_, value)
+        walker.run(validator, value, self._engine)
+        return validator.wrap(value)
 
-            if hasattr(type_, '__args__') and type_.__args__:
-                self._inspect_subtypes(type_, value)
+    def collect(self, max_errors: int | None = None) -> ValidationResult:
+        '''Compare the value with the typing tree, collecting all the
+        mismatches instead of raising the first one.
+        Each mismatch has the path of the mismatching value from the
+        root value, such as "[3]['x'][1]".
+
+        Args:
+            max_errors (Optional, int | None): The maximum number of
+                mismatches collected. All of them if None.
+                Default to None.
+
+        Raises:
+            TypeError: If the typing tree is malformed.
+            ValueError: If max_errors is lower than 1.
+
+        Returns:
+            ValidationResult: The validation result, true if the value
+                matches.
+        '''
+
+        return compile_type(self._type, self._sample).report(
+            self._value,
+            max_errors,
+        )
 
     def _get_origin(self, type_: TypeVar) -> TypeVar:
         '''Get the original typing class.
@@ -65,10 +135,7 @@ class Introspector:
             TypeVar: The original typing class.
         '''
 
-        if hasattr(type_, '__origin__'):
-            return type_.__origin__
-
-        return type_
+        return get_origin(type_)
 
     def _inspect_origin(self, type_: TypeVar, value: Any) -> None:
         '''Analyze the main type.
@@ -85,37 +152,7 @@ class Introspector:
                 with the given typing.
         '''
 
-        origin: TypeVar = self._get_origin(type_)
-
-        if type(origin) is UnionType or origin == Union:
-            match: bool = False
-            args: list[TypeVar] = (
-                origin.__args__
-                if hasattr(origin, '__args__')
-                else type_.__args__
-            )
-
-            for sub_type in args:
-                try:
-                    self.inspect(sub_type, value)
-                    match = True
-                    break
-                except TypeError:
-                    pass
-
-            if not match:
-                raise TypeError(
-                    f'Expected {self._type}. Mismatch on {type(value)}'
-                )
-        elif (
-            origin is not abc.Callable
-            and origin is not type(value)
-            or origin is abc.Callable
-            and not isinstance(value, abc.Callable)
-        ):
-            raise TypeError(
-                f'Expected {self._type}. Mismatch on {type(value)}'
-            )
+        compile_type(type_, self._sample).validate_origin(value)
 
     def _inspect_subtypes(self, type_: TypeVar, value: Any) -> None:
         '''Analyze the subtypes of the main type.
@@ -132,24 +169,4 @@ class Introspector:
                 with the given typing.
         '''
 
-        origin: TypeVar = self._get_origin(type_)
-
-        if origin is list:
-            for item in value:
-                self.inspect(type_.__args__[0], item)
-        elif origin is tuple:
-            if len(type_.__args__) != len(value):
-                raise TypeError('Tuple sizes doesn\'t matches.')
-
-            for i, sub_type in enumerate(type_.__args__):
-                self.inspect(sub_type, value[i])
-        elif origin is set:
-            for item in value:
-                self.inspect(type_.__args__[0], item)
-        elif origin is dict:
-            if len(type_.__args__) != 2:
-                raise TypeError('Missing key/val in dict type definition.')
-
-            for key, val in value.items():
-                self.inspect(type_.__args__[0], key)
-                self.inspect(type_.__args__[1], val)
+        compile_type(type_, self._sample).validate_items(value)
@@ -0,0 +1,216 @@
+from typing import Any
+from collections import OrderedDict, abc
+from .proxy import Reporter
+from .result import ValidationResult
+from .validator import Validator
+
+_REGISTRY: dict[str, 'ResultCache'] = {}
+
+
+class ResultCache:
+    '''The bounded LRU cache of the successful validations of a
+    decorated function.
+    The values are keyed by identity, not by equality: equal values of
+    different types (1, True, 1.0) must not share a result. The value is
+    kept by the cache, so its id can't be reused by another object while
+    cached. Only the deeply immutable values can be cached, a cached
+    value can't change.
+
+    Attributes:
+        name (str): The function qualified name.
+        maxsize (int): The maximum number of cached values.
+        hits (int): The number of validations skipped.
+        misses (int): The number of validations run.
+        evictions (int): The number of values evicted from the cache.
+        _entries (OrderedDict[tuple[Validator, int], Any]): The
+            validated values, by validator and value id, from the least
+            to the most recently used.
+    '''
+
+    def __init__(self, name: str, maxsize: int) -> None:
+        '''The constructor.
+
+        Args:
+            name (str): The function qualified name.
+            maxsize (int): The maximum number of cached values.
+        '''
+
+        self.name: str = name
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[tuple[Validator, int], Any] = (
+            OrderedDict()
+        )
+
+    def get(self, validator: Validator, value: Any) -> bool:
+        '''Tell if a value was already validated, and count the hit or
+        miss.
+
+        Args:
+            validator (Validator): The validator of the value typing.
+            value (Any): The value.
+
+        Returns:
+            bool: True if the value is cached, False otherwise.
+        '''
+
+        key: tuple[Validator, int] = (validator, id(value))
+
+        try:
+            if self._entries[key] is value:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+        except KeyError:
+            # Missing, or evicted by a concurrent call.
+            pass
+
+        self.misses += 1
+        return False
+
+    def add(self, validator: Validator, value: Any) -> None:
+        '''Cache a validated value, evicting the least recently used one
+        if the cache is full.
+
+        Args:
+            validator (Validator): The validator of the value typing.
+            value (Any): The validated value.
+        '''
+
+        self._entries[(validator, id(value))] = value
+
+        while len(self._entries) > self.maxsize:
+            try:
+                self._entries.popitem(last=False)
+            except KeyError:
+                break
+
+            self.evictions += 1
+
+    def clear(self) -> None:
+        '''Empty the cache and reset its counters.'''
+
+        self.__init__(self.name, self.maxsize)
+
+    def snapshot(self) -> dict[str, int]:
+        '''Get a copy of the counters.
+
+        Returns:
+            dict[str, int]: The counters.
+        '''
+
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class CachedValidator(Validator):
+    '''The validator skipping the values found in a result cache.
+
+    Attributes:
+        _validator (Validator): The wrapped validator.
+        _cache (ResultCache): The result cache.
+        _key (Validator): The validator of the value typing, shared by
+            the functions (see `validator.compile_type`).
+    '''
+
+    def __init__(
+        self,
+        validator: Validator,
+        cache: ResultCache,
+        key: Validator | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            validator (Validator): The wrapped validator.
+            cache (ResultCache): The result cache.
+            key (Optional, Validator | None): The validator of the value
+                typing, shared by the functions, if the wrapped one is
+                specific to a function (iterative, generated...).
+                Default to None (the wrapped validator).
+        '''
+
+        super().__init__(validator._type)
+        self._validator: Validator = validator
+        self._cache: ResultCache = cache
+        self._key: Validator = key or validator
+        self.lazy = validator.lazy
+        self.immutable = validator.immutable
+        self.flat = validator.flat
+
+    def validate(self, value: Any) -> None:
+        if value is not None and not self._cache.get(self._key, value):
+            self._validator.validate(value)
+            self._cache.add(self._key, value)
+
+    def check(self, value: Any) -> bool:
+        return self._cache.get(self._key, value) or (
+            self._validator.check(value)
+        )
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        self._validator.collect(value, path, result)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if self._cache.get(self._key, value):
+            return ()
+
+        return ((self._validator, value),)
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        return self._validator.wrap(value, label, report)
+
+
+def register(name: str, maxsize: int) -> ResultCache:
+    '''Get the result cache of a function, created on first call or if
+    its size changed.
+
+    Args:
+        name (str): The function qualified name.
+        maxsize (int): The maximum number of cached values.
+
+    Returns:
+        ResultCache: The function result cache.
+    '''
+
+    cache: ResultCache | None = _REGISTRY.get(name)
+
+    if cache is None or cache.maxsize != maxsize:
+        cache = _REGISTRY[name] = ResultCache(name, maxsize)
+
+    return cache
+
+
+def snapshot() -> dict[str, dict[str, int]]:
+    '''Get the counters of all the result caches.
+
+    Returns:
+        dict[str, dict[str, int]]: The counters by function qualified
+            name.
+    '''
+
+    return {name: cache.snapshot() for name, cache in _REGISTRY.items()}
+
+
+def clear() -> None:
+    '''Empty all the result caches and reset their counters.'''
+
+    for cache in _REGISTRY.values():
+        cache.clear()
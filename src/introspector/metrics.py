@@ -0,0 +1,167 @@
+from typing import Any, ClassVar
+
+_REGISTRY: dict[str, 'Metrics'] = {}
+
+# The number of partial controls (see the strict budget options), by
+# function qualified name.
+_PARTIAL: dict[str, int] = {}
+
+
+class Metrics:
+    '''The validation telemetry of a decorated function.
+    The counters are plain integers updated without lock, a concurrent
+    update may rarely be lost.
+
+    Attributes:
+        name (str): The function qualified name.
+        calls (int): The number of controlled calls.
+        sign_ns (int): The time spent controlling the parameters,
+            in nanoseconds.
+        retval_ns (int): The time spent controlling the return values,
+            in nanoseconds.
+        sign_histogram (list[int]): The number of parameters controls
+            by duration bucket. The bucket i counts the durations lower
+            than 2 ** i nanoseconds.
+        retval_histogram (list[int]): The number of return value
+            controls by duration bucket.
+        mismatches (dict[str, int]): The number of mismatches by
+            argument name ('return' for the return value).
+        BUCKETS (ClassVar[int]): The number of histogram buckets.
+    '''
+
+    BUCKETS: ClassVar[int] = 40
+
+    def __init__(self, name: str) -> None:
+        '''The constructor.
+
+        Args:
+            name (str): The function qualified name.
+        '''
+
+        self.name: str = name
+        self.calls: int = 0
+        self.sign_ns: int = 0
+        self.retval_ns: int = 0
+        self.sign_histogram: list[int] = [0] * self.BUCKETS
+        self.retval_histogram: list[int] = [0] * self.BUCKETS
+        self.mismatches: dict[str, int] = {}
+
+    def record_sign(self, duration: int) -> None:
+        '''Record a parameters control.
+
+        Args:
+            duration (int): The control duration, in nanoseconds.
+        '''
+
+        self.calls += 1
+        self.sign_ns += duration
+        self.sign_histogram[
+            min(duration.bit_length(), self.BUCKETS - 1)
+        ] += 1
+
+    def record_retval(self, duration: int) -> None:
+        '''Record a return value control.
+
+        Args:
+            duration (int): The control duration, in nanoseconds.
+        '''
+
+        self.retval_ns += duration
+        self.retval_histogram[
+            min(duration.bit_length(), self.BUCKETS - 1)
+        ] += 1
+
+    def record_mismatch(self, arg_name: str) -> None:
+        '''Record a typing mismatch.
+
+        Args:
+            arg_name (str): The mismatching argument name ('return' for
+                the return value).
+        '''
+
+        self.mismatches[arg_name] = self.mismatches.get(arg_name, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        '''Get a copy of the counters.
+        The histograms are given as {bucket upper bound (ns): count},
+        without the empty buckets.
+
+        Returns:
+            dict[str, Any]: The counters.
+        '''
+
+        return {
+            'calls': self.calls,
+            'sign_ns': self.sign_ns,
+            'retval_ns': self.retval_ns,
+            'sign_histogram': self._buckets(self.sign_histogram),
+            'retval_histogram': self._buckets(self.retval_histogram),
+            'mismatches': dict(self.mismatches),
+        }
+
+    @staticmethod
+    def _buckets(histogram: list[int]) -> dict[int, int]:
+        '''Get the non empty buckets of an histogram.
+
+        Args:
+            histogram (list[int]): The histogram.
+
+        Returns:
+            dict[int, int]: The count by bucket upper bound.
+        '''
+
+        return {2**i: count for i, count in enumerate(histogram) if count}
+
+
+def register(name: str) -> Metrics:
+    '''Get the telemetry of a function, created on first call.
+
+    Args:
+        name (str): The function qualified name.
+
+    Returns:
+        Metrics: The function telemetry.
+    '''
+
+    return _REGISTRY.setdefault(name, Metrics(name))
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    '''Get the telemetry of all the functions recording it.
+
+    Returns:
+        dict[str, dict[str, Any]]: The counters by function qualified
+            name.
+    '''
+
+    return {name: metrics.snapshot() for name, metrics in _REGISTRY.items()}
+
+
+def record_partial(name: str) -> None:
+    '''Record a control stopped by its budget.
+
+    Args:
+        name (str): The function qualified name.
+    '''
+
+    _PARTIAL[name] = _PARTIAL.get(name, 0) + 1
+
+
+def partial() -> dict[str, int]:
+    '''Get the number of controls stopped by their budget.
+
+    Returns:
+        dict[str, int]: The number of partial controls by function
+            qualified name.
+    '''
+
+    return dict(_PARTIAL)
+
+
+def reset() -> None:
+    '''Reset the counters of all the functions.'''
+
+    for name, metrics in _REGISTRY.items():
+        metrics.__init__(name)
+
+    _PARTIAL.clear()
@@ -0,0 +1,291 @@
+'''The reporter of the observe mode.
+
+In observe mode (`strict(mode='observe')`), the strict functions never
+raise: the mismatching values are pushed on a bounded queue, and a
+background thread builds their error messages, deduplicates them and
+reports them to the "introspector" logger, or to a callback. The
+controlled call only pays for the check, and an append on mismatch.
+
+Example:
+    @strict(mode='observe', on_mismatch=sentry_report)
+    def handle(request: Request) -> Response:
+        ...
+'''
+
+from dataclasses import dataclass
+from typing import Any, Callable
+from collections import deque
+import logging
+import threading
+import time
+from . import walker
+from .validator import Validator
+
+# The controls modes: 'raise' raises the mismatches, 'observe' reports
+# them from the background thread.
+MODES: tuple[str, ...] = ('raise', 'observe')
+
+_LOGGER: logging.Logger = logging.getLogger('introspector')
+
+# The pending events: the function name, the argument name, the
+# validator, the mismatching value and the callback.
+_QUEUE: deque[tuple[str, str, Validator, Any, Callable | None]] = deque()
+_STATS: dict[str, int] = {
+    'observed': 0,
+    'dropped': 0,
+    'reported': 0,
+    'suppressed': 0,
+    'failed': 0,
+}
+# The time of the last report and the number of suppressed events, by
+# function, argument and message.
+_SEEN: dict[tuple[str, str, str], list[float | int]] = {}
+_SETTINGS: dict[str, float] = {
+    'max_queue': 10_000,
+    'interval': 0.1,
+    'repeat_interval': 60,
+}
+_FLUSHING: threading.Lock = threading.Lock()
+_STARTING: threading.Lock = threading.Lock()
+_WAKE: threading.Event = threading.Event()
+_WORKER: threading.Thread | None = None
+
+
+@dataclass(frozen=True)
+class Observation:
+    '''A typing mismatch observed in observe mode.
+
+    Attributes:
+        function (str): The function qualified name.
+        argument (str): The mismatching argument name, 'return' for
+            the return value.
+        message (str): The mismatch error message.
+        count (int): The number of occurrences of the mismatch since it
+            was last reported.
+    '''
+
+    function: str
+    argument: str
+    message: str
+    count: int = 1
+
+    def __str__(self) -> str:
+        label: str = (
+            'Return value error.'
+            if self.argument == 'return'
+            else f'Arg \'{self.argument}\' error.'
+        )
+        repeated: str = f' ({self.count} times)' if self.count > 1 else ''
+        return f'[{self.function}] {label} {self.message}{repeated}'
+
+
+def configure(
+    max_queue: int | None = None,
+    interval: float | None = None,
+    repeat_interval: float | None = None,
+) -> None:
+    '''Configure the reporter.
+
+    Args:
+        max_queue (Optional, int | None): The maximum number of pending
+            mismatches, the others are dropped and counted.
+            Default to None (unchanged, initially 10000).
+        interval (Optional, float | None): The period of the background
+            thread, in seconds. Default to None (unchanged, initially
+            0.1).
+        repeat_interval (Optional, float | None): The minimum delay
+            between two reports of the same mismatch, in seconds. The
+            occurrences in between are counted in the next report.
+            Default to None (unchanged, initially 60).
+
+    Raises:
+        ValueError: If a setting is not positive.
+    '''
+
+    settings: dict[str, float | None] = {
+        'max_queue': max_queue,
+        'interval': interval,
+        'repeat_interval': repeat_interval,
+    }
+
+    for name, value in settings.items():
+        if value is not None:
+            if value <= 0:
+                raise ValueError(f'Expected a positive {name}.')
+
+            _SETTINGS[name] = value
+
+    # The background thread applies the new period right away.
+    _WAKE.set()
+
+
+def push(
+    function: str,
+    argument: str,
+    validator: Validator,
+    value: Any,
+    callback: Callable[[Observation], Any] | None = None,
+) -> None:
+    '''Push a mismatch to report, without blocking. The mismatch is
+    dropped and counted if the queue is full.
+    The message is built by the background thread from the value, the
+    value must not be mutated in between.
+
+    Args:
+        function (str): The function qualified name.
+        argument (str): The mismatching argument name, 'return' for the
+            return value.
+        validator (Validator): The argument validator.
+        value (Any): The mismatching value.
+        callback (Optional, Callable[[Observation], Any] | None): Called
+            with the observation, instead of logging it.
+            Default to None.
+    '''
+
+    if len(_QUEUE) >= _SETTINGS['max_queue']:
+        _STATS['dropped'] += 1
+        return
+
+    _STATS['observed'] += 1
+    _QUEUE.append((function, argument, validator, value, callback))
+
+    if _WORKER is None:
+        _start()
+
+
+def flush() -> int:
+    '''Report the pending mismatches now, in the calling thread.
+
+    Returns:
+        int: The number of reports sent.
+    '''
+
+    reported: int = 0
+
+    with _FLUSHING:
+        while _QUEUE:
+            event: tuple[str, str, Validator, Any, Callable | None] = (
+                _QUEUE.popleft()
+            )
+
+            # A value changed or broken since (a dict resized while
+            # walked, a raising property...) must not stop the reports.
+            try:
+                reported += _report(*event)
+            except Exception:
+                _STATS['failed'] += 1
+                _LOGGER.exception(
+                    'The mismatch of [%s] %s could not be reported.',
+                    event[0],
+                    event[1],
+                )
+
+    return reported
+
+
+def snapshot() -> dict[str, int]:
+    '''Get the reporter counters.
+
+    Returns:
+        dict[str, int]: The number of observed mismatches, dropped
+            because the queue was full, reported, suppressed as repeated,
+            failed to report and still pending.
+    '''
+
+    return {**_STATS, 'pending': len(_QUEUE)}
+
+
+def reset() -> None:
+    '''Drop the pending mismatches and reset the counters.'''
+
+    with _FLUSHING:
+        _QUEUE.clear()
+        _SEEN.clear()
+
+        for name in _STATS:
+            _STATS[name] = 0
+
+
+def _report(
+    function: str,
+    argument: str,
+    validator: Validator,
+    value: Any,
+    callback: Callable[[Observation], Any] | None,
+) -> int:
+    '''Build the message of a mismatch and report it, unless it was
+    reported lately.
+
+    Args:
+        function (str): The function qualified name.
+        argument (str): The mismatching argument name.
+        validator (Validator): The argument validator.
+        value (Any): The mismatching value.
+        callback (Callable[[Observation], Any] | None): The reporting
+            callback, the logger if None.
+
+    Returns:
+        int: 1 if the mismatch was reported, 0 otherwise.
+    '''
+
+    try:
+        walker.run(validator, value)
+        return 0  # The value was fixed since.
+    except TypeError as e:
+        message: str = str(e)
+
+    now: float = time.monotonic()
+    seen: list[float | int] | None = _SEEN.get((function, argument, message))
+
+    if seen and now - seen[0] < _SETTINGS['repeat_interval']:
+        seen[1] += 1
+        _STATS['suppressed'] += 1
+        return 0
+
+    observation: Observation = Observation(
+        function,
+        argument,
+        message,
+        seen[1] + 1 if seen else 1,
+    )
+    _SEEN[function, argument, message] = [now, 0]
+    _STATS['reported'] += 1
+
+    try:
+        if callback:
+            callback(observation)
+        else:
+            _LOGGER.warning('%s', observation)
+    except Exception:
+        _LOGGER.exception('The mismatch callback failed.')
+
+    return 1
+
+
+def _start() -> None:
+    '''Start the background thread, once.'''
+
+    global _WORKER
+
+    with _STARTING:
+        if _WORKER is None:
+            _WORKER = threading.Thread(
+                target=_run,
+                name='introspector-observer',
+                daemon=True,
+            )
+            _WORKER.start()
+
+
+def _run() -> None:
+    '''Report the pending mismatches periodically, forever.'''
+
+    while True:
+        _WAKE.wait(_SETTINGS['interval'])
+        _WAKE.clear()
+
+        if _QUEUE:
+            try:
+                flush()
+            except Exception:
+                _LOGGER.exception('The mismatches flush failed.')
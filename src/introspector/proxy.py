@@ -0,0 +1,379 @@
+from typing import TYPE_CHECKING, Any
+from collections import abc
+
+if TYPE_CHECKING:
+    from .validator import Validator
+
+# The mismatches reporter of the proxies: called with the validator and
+# the mismatching value, instead of raising (see `observe`).
+Reporter = abc.Callable[['Validator', Any], Any]
+
+
+class _ItemsController:
+    '''The base class of the proxies controlling items one by one.
+
+    Attributes:
+        _validator (Validator): The items validator.
+        _label (str): The prefix of the errors messages.
+        _report (Reporter | None): The mismatches reporter, if the
+            mismatches are reported instead of raised.
+        _index (int): The index of the next item.
+    '''
+
+    def __init__(
+        self,
+        validator: 'Validator',
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            validator (Validator): The items validator.
+            label (Optional, str): The prefix of the errors messages.
+                Default to ''.
+            report (Optional, Reporter | None): Called with the
+                validator and the value of the mismatches, instead of
+                raising. Default to None.
+        '''
+
+        self._validator: 'Validator' = validator
+        self._label: str = label
+        self._report: Reporter | None = report
+        self._index: int = 0
+
+    def _control(self, item: Any) -> Any:
+        '''Control an item produced by the wrapped object.
+
+        Args:
+            item (Any): The item.
+
+        Raises:
+            TypeError: If the item does not match with the typing.
+
+        Returns:
+            Any: The item.
+        '''
+
+        index: int = self._index
+        self._index += 1
+
+        if not self._validator.check(item):
+            if self._report:
+                self._report(self._validator, item)
+                return item
+
+            try:
+                self._validator.validate(item)
+            except TypeError as e:
+                raise TypeError(f'{self._label}Item {index} error. {e}')
+
+        return item
+
+
+class IteratorProxy(_ItemsController, abc.Iterator):
+    '''The iterator wrapper controlling each item as it is consumed.
+    The items are never stored, so a stream is validated in constant
+    memory.
+
+    Attributes:
+        _iterator (abc.Iterator): The wrapped iterator.
+    '''
+
+    def __init__(
+        self,
+        iterator: abc.Iterator,
+        validator: 'Validator',
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            iterator (abc.Iterator): The wrapped iterator.
+            validator (Validator): The items validator.
+            label (Optional, str): The prefix of the errors messages.
+                Default to ''.
+            report (Optional, Reporter | None): Called with the
+                validator and the value of the mismatches, instead of
+                raising. Default to None.
+        '''
+
+        super().__init__(validator, label, report)
+        self._iterator: abc.Iterator = iterator
+
+    def __next__(self) -> Any:
+        return self._control(next(self._iterator))
+
+
+class IterableProxy(abc.Iterable):
+    '''The iterable wrapper controlling the items of each iteration.
+
+    Attributes:
+        _iterable (abc.Iterable): The wrapped iterable.
+        _validator (Validator): The items validator.
+        _label (str): The prefix of the errors messages.
+        _report (Reporter | None): The mismatches reporter.
+    '''
+
+    def __init__(
+        self,
+        iterable: abc.Iterable,
+        validator: 'Validator',
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            iterable (abc.Iterable): The wrapped iterable.
+            validator (Validator): The items validator.
+            label (Optional, str): The prefix of the errors messages.
+                Default to ''.
+            report (Optional, Reporter | None): Called with the
+                validator and the value of the mismatches, instead of
+                raising. Default to None.
+        '''
+
+        self._iterable: abc.Iterable = iterable
+        self._validator: 'Validator' = validator
+        self._label: str = label
+        self._report: Reporter | None = report
+
+    def __iter__(self) -> IteratorProxy:
+        return IteratorProxy(
+            iter(self._iterable),
+            self._validator,
+            self._label,
+            self._report,
+        )
+
+
+class GeneratorProxy(IteratorProxy, abc.Generator):
+    '''The generator wrapper controlling the yielded, sent and returned
+    values.
+
+    Attributes:
+        _send_validator (Validator): The sent values validator.
+        _return_validator (Validator): The return value validator.
+    '''
+
+    def __init__(
+        self,
+        generator: abc.Generator,
+        validator: 'Validator',
+        send_validator: 'Validator',
+        return_validator: 'Validator',
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            generator (abc.Generator): The wrapped generator.
+            validator (Validator): The yielded values validator.
+            send_validator (Validator): The sent values validator.
+            return_validator (Validator): The return value validator.
+            label (Optional, str): The prefix of the errors messages.
+                Default to ''.
+            report (Optional, Reporter | None): Called with the
+                validator and the value of the mismatches, instead of
+                raising. Default to None.
+        '''
+
+        super().__init__(generator, validator, label, report)
+        self._send_validator: 'Validator' = send_validator
+        self._return_validator: 'Validator' = return_validator
+
+    def __next__(self) -> Any:
+        return self.send(None)
+
+    def send(self, value: Any) -> Any:
+        if not self._send_validator.check(value):
+            if self._report:
+                self._report(self._send_validator, value)
+            else:
+                try:
+                    self._send_validator.validate(value)
+                except TypeError as e:
+                    raise TypeError(f'{self._label}Sent value error. {e}')
+
+        return self._resume(self._iterator.send, value)
+
+    def throw(self, *args: Any) -> Any:
+        return self._resume(self._iterator.throw, *args)
+
+    def close(self) -> None:
+        self._iterator.close()
+
+    def _resume(self, resume: abc.Callable[..., Any], *args: Any) -> Any:
+        '''Resume the wrapped generator and control its outcome.
+
+        Args:
+            resume (abc.Callable[..., Any]): The generator method.
+            *args (Any): The method arguments.
+
+        Raises:
+            TypeError: If the yielded or returned value does not match
+                with the typing.
+            StopIteration: If the generator is exhausted.
+
+        Returns:
+            Any: The yielded value.
+        '''
+
+        try:
+            item: Any = resume(*args)
+        except StopIteration as stop:
+            if not self._return_validator.check(stop.value):
+                if self._report:
+                    self._report(self._return_validator, stop.value)
+                    raise
+
+                try:
+                    self._return_validator.validate(stop.value)
+                except TypeError as e:
+                    raise TypeError(
+                        f'{self._label}Generator return value error. {e}'
+                    )
+
+            raise
+
+        return self._control(item)
+
+
+class AsyncIteratorProxy(_ItemsController, abc.AsyncIterator):
+    '''The asynchronous iterator wrapper controlling each item as it is
+    consumed.
+
+    Attributes:
+        _iterator (abc.AsyncIterator): The wrapped asynchronous
+            iterator.
+    '''
+
+    def __init__(
+        self,
+        iterator: abc.AsyncIterator,
+        validator: 'Validator',
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            iterator (abc.AsyncIterator): The wrapped asynchronous
+                iterator.
+            validator (Validator): The items validator.
+            label (Optional, str): The prefix of the errors messages.
+                Default to ''.
+            report (Optional, Reporter | None): Called with the
+                validator and the value of the mismatches, instead of
+                raising. Default to None.
+        '''
+
+        super().__init__(validator, label, report)
+        self._iterator: abc.AsyncIterator = iterator
+
+    async def __anext__(self) -> Any:
+        return self._control(await anext(self._iterator))
+
+
+class AsyncIterableProxy(abc.AsyncIterable):
+    '''The asynchronous iterable wrapper controlling the items of each
+    iteration.
+
+    Attributes:
+        _iterable (abc.AsyncIterable): The wrapped asynchronous
+            iterable.
+        _validator (Validator): The items validator.
+        _label (str): The prefix of the errors messages.
+        _report (Reporter | None): The mismatches reporter.
+    '''
+
+    def __init__(
+        self,
+        iterable: abc.AsyncIterable,
+        validator: 'Validator',
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            iterable (abc.AsyncIterable): The wrapped asynchronous
+                iterable.
+            validator (Validator): The items validator.
+            label (Optional, str): The prefix of the errors messages.
+                Default to ''.
+            report (Optional, Reporter | None): Called with the
+                validator and the value of the mismatches, instead of
+                raising. Default to None.
+        '''
+
+        self._iterable: abc.AsyncIterable = iterable
+        self._validator: 'Validator' = validator
+        self._label: str = label
+        self._report: Reporter | None = report
+
+    def __aiter__(self) -> AsyncIteratorProxy:
+        return AsyncIteratorProxy(
+            aiter(self._iterable),
+            self._validator,
+            self._label,
+            self._report,
+        )
+
+
+class AsyncGeneratorProxy(AsyncIteratorProxy, abc.AsyncGenerator):
+    '''The asynchronous generator wrapper controlling the yielded and
+    sent values.
+
+    Attributes:
+        _send_validator (Validator): The sent values validator.
+    '''
+
+    def __init__(
+        self,
+        generator: abc.AsyncGenerator,
+        validator: 'Validator',
+        send_validator: 'Validator',
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            generator (abc.AsyncGenerator): The wrapped asynchronous
+                generator.
+            validator (Validator): The yielded values validator.
+            send_validator (Validator): The sent values validator.
+            label (Optional, str): The prefix of the errors messages.
+                Default to ''.
+            report (Optional, Reporter | None): Called with the
+                validator and the value of the mismatches, instead of
+                raising. Default to None.
+        '''
+
+        super().__init__(generator, validator, label, report)
+        self._send_validator: 'Validator' = send_validator
+
+    async def __anext__(self) -> Any:
+        return await self.asend(None)
+
+    async def asend(self, value: Any) -> Any:
+        if not self._send_validator.check(value):
+            if self._report:
+                self._report(self._send_validator, value)
+            else:
+                try:
+                    self._send_validator.validate(value)
+                except TypeError as e:
+                    raise TypeError(f'{self._label}Sent value error. {e}')
+
+        return self._control(await self._iterator.asend(value))
+
+    async def athrow(self, *args: Any) -> Any:
+        return self._control(await self._iterator.athrow(*args))
+
+    async def aclose(self) -> None:
+        await self._iterator.aclose()
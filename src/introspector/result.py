@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    '''A typing mismatch found in a data structure.
+
+    Attributes:
+        path (str): The path of the mismatching value from the root
+            value, such as "b[3]['x'][1]".
+        expected (TypeVar): The expected typing.
+        actual (type): The mismatching value type.
+        detail (str | None): The mismatch description, if not a plain
+            type mismatch (tuple size, array shape...). Default to None.
+    '''
+
+    path: str
+    expected: TypeVar
+    actual: type
+    detail: str | None = None
+
+    def __str__(self) -> str:
+        message: str = self.detail or (
+            f'Expected {self.expected}. Mismatch on {self.actual}'
+        )
+
+        if self.path:
+            return f'{self.path}: {message}'
+
+        return message
+
+
+class ValidationResult:
+    '''The outcome of a validation collecting all the mismatches.
+    The result is true if the value is valid.
+
+    Attributes:
+        mismatches (list[Mismatch]): The mismatches, in the order they
+            were found.
+        max_errors (int | None): The maximum number of mismatches
+            collected. All of them if None.
+        truncated (bool): Whether mismatches were left out because
+            max_errors was reached.
+    '''
+
+    def __init__(self, max_errors: int | None = None) -> None:
+        '''The constructor.
+
+        Args:
+            max_errors (Optional, int | None): The maximum number of
+                mismatches collected. All of them if None.
+                Default to None.
+
+        Raises:
+            ValueError: If max_errors is lower than 1.
+        '''
+
+        if max_errors is not None and max_errors < 1:
+            raise ValueError('Expected at least 1 error.')
+
+        self.mismatches: list[Mismatch] = []
+        self.max_errors: int | None = max_errors
+        self.truncated: bool = False
+
+    def __bool__(self) -> bool:
+        return not self.mismatches
+
+    def __str__(self) -> str:
+        lines: list[str] = [str(mismatch) for mismatch in self.mismatches]
+
+        if self.truncated:
+            lines.append(f'... (stopped after {self.max_errors} errors)')
+
+        return '\n'.join(lines)
+
+    @property
+    def full(self) -> bool:
+        '''Tell if no more mismatch can be collected.
+
+        Returns:
+            bool: True if max_errors is reached, False otherwise.
+        '''
+
+        return self.max_errors is not None and (
+            len(self.mismatches) >= self.max_errors
+        )
+
+    def add(
+        self,
+        path: str,
+        expected: TypeVar,
+        value: Any,
+        detail: str | None = None,
+    ) -> None:
+        '''Record a mismatch, unless max_errors is reached.
+
+        Args:
+            path (str): The path of the mismatching value.
+            expected (TypeVar): The expected typing.
+            value (Any): The mismatching value.
+            detail (Optional, str | None): The mismatch description.
+                Default to None.
+        '''
+
+        if self.full:
+            self.truncated = True
+            return
+
+        self.mismatches.append(Mismatch(path, expected, type(value), detail))
+
+
+class ValidationError(TypeError):
+    '''The error aggregating all the mismatches of a validation.
+
+    Attributes:
+        result (ValidationResult): The validation result.
+    '''
+
+    def __init__(self, message: str, result: ValidationResult) -> None:
+        '''The constructor.
+
+        Args:
+            message (str): The error message.
+            result (ValidationResult): The validation result.
+        '''
+
+        super().__init__(message)
+        self.result: ValidationResult = result
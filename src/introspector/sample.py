@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from typing import Any, ClassVar
+from collections import abc
+from itertools import compress, count, islice, takewhile
+import random
+
+
+@dataclass(frozen=True)
+class Sample:
+    '''The container sampling policy.
+    Only a sample of the containers items are checked, which bounds the
+    validation cost of the very large containers.
+
+    Examples:
+        Sample.first(100): check the first 100 items.
+        Sample.random(100): check 100 random items.
+        Sample.fraction(0.01): check 1% of the items, evenly spread.
+
+    Attributes:
+        strategy (str): The sampling strategy name.
+        size (int | float): The number of items to check, or the
+            fraction of items for the fraction strategy.
+        STRATEGIES (ClassVar[tuple[str, ...]]): The available
+            strategies.
+    '''
+
+    STRATEGIES: ClassVar[tuple[str, ...]] = ('first', 'random', 'fraction')
+
+    strategy: str
+    size: int | float
+
+    def __post_init__(self) -> None:
+        if self.strategy not in self.STRATEGIES:
+            raise ValueError(f'Unknown sampling strategy {self.strategy}.')
+
+        if self.strategy == 'fraction':
+            if not 0 < self.size <= 1:
+                raise ValueError('Expected a fraction in ]0, 1].')
+        elif type(self.size) is not int or self.size < 1:
+            raise ValueError('Expected a positive number of items.')
+
+    @classmethod
+    def first(cls, size: int) -> 'Sample':
+        '''Check the first items of the containers.
+
+        Args:
+            size (int): The number of items to check.
+
+        Returns:
+            Sample: The sampling policy.
+        '''
+
+        return cls('first', size)
+
+    @classmethod
+    def random(cls, size: int) -> 'Sample':
+        '''Check random items of the containers.
+
+        Args:
+            size (int): The number of items to check.
+
+        Returns:
+            Sample: The sampling policy.
+        '''
+
+        return cls('random', size)
+
+    @classmethod
+    def fraction(cls, size: float) -> 'Sample':
+        '''Check a fraction of the containers items, evenly spread.
+
+        Args:
+            size (float): The fraction of items to check, in ]0, 1].
+
+        Returns:
+            Sample: The sampling policy.
+        '''
+
+        return cls('fraction', size)
+
+    def select(self, values: abc.Collection[Any]) -> abc.Iterable[Any]:
+        '''Select the items to check.
+        The unordered containers can't be indexed, their items are
+        picked with a mask (one byte by item), at C speed and without
+        copying them, but still in linear time: only the sequences are
+        sampled in bounded time.
+
+        Args:
+            values (abc.Collection[Any]): The container items.
+
+        Returns:
+            abc.Iterable[Any]: The items to check.
+        '''
+
+        length: int = len(values)
+
+        if self.strategy == 'fraction':
+            step: float = 1 / self.size
+
+            if step.is_integer():
+                if isinstance(values, abc.Sequence):
+                    return values[:: int(step)]
+
+                return islice(values, 0, None, int(step))
+
+            # The i-th checked item is at index int(i / size).
+            indices: abc.Iterable[int] = takewhile(
+                length.__gt__,
+                (int(index * step) for index in count()),
+            )
+        elif length <= self.size:
+            return values
+        elif self.strategy == 'first':
+            if isinstance(values, abc.Sequence):
+                return values[: self.size]
+
+            return islice(values, self.size)
+        else:
+            indices = random.sample(range(length), self.size)
+
+        if isinstance(values, abc.Sequence):
+            return map(values.__getitem__, indices)
+
+        mask: bytearray = bytearray(length)
+
+        for index in indices:
+            mask[index] = 1
+
+        return compress(values, mask)
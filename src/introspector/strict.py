@@ -1,6 +1,57 @@
-from typing import Any, Callable, ClassVar, TypeVar
+from typing import Any, Callable, ClassVar
+from concurrent.futures import Executor
+import asyncio
+import contextvars
+import copy
+import dataclasses
+import functools
 import inspect
-from .introspector import Introspector
+import random
+import threading
+import time
+import weakref
+from . import codegen, config, memo, metrics, observe, trust, walker
+from .codegen import BACKENDS, GeneratedValidator
+from .memo import CachedValidator, ResultCache
+from .metrics import Metrics
+from .observe import MODES, Observation
+from .proxy import Reporter
+from .result import ValidationError, ValidationResult
+from .sample import Sample
+from .trust import TrustedValidator
+from .validator import (
+    TupleValidator,
+    UnionValidator,
+    Validator,
+    compile_type,
+)
+from .walker import ENGINES, Budget, IterativeValidator
+
+# The decorated functions which binding plan is not compiled yet.
+_PENDING: weakref.WeakSet = weakref.WeakSet()
+_COMPILING: threading.Lock = threading.Lock()
+# The default value of the dataclasses __init__ parameters built by a
+# default_factory, it is not a value of the field type.
+_DEFAULT_FACTORY: Any = dataclasses._HAS_DEFAULT_FACTORY
+
+
+def warmup() -> int:
+    '''Compile the binding plan of all the decorated functions not
+    compiled yet, so their first calls don't pay for it.
+
+    Raises:
+        TypeError: If a parameter typing is malformed.
+
+    Returns:
+        int: The number of compiled functions.
+    '''
+
+    count: int = 0
+
+    for sct in list(_PENDING):
+        count += sct.warmup()
+
+    return count
 
 
 class Strict:
@@ -16,16 +67,133 @@ class Strict:
         def bar(a: int, b: list[str]) -> None:
             ...
 
+        @Strict(sample={'b': Sample.first(100)})
+        def baz(a: int, b: list[str]) -> None:
+            ...
+
+        @Strict(frozen=['b'])
+        def qux(a: int, b: list[str]) -> None:
+            ...
+
+        @Strict(cache=256)
+        def quux(a: int, b: tuple[str, ...]) -> None:
+            ...
+
+        @Strict(collect=True, max_errors=100)
+        def corge(a: int, b: list[str]) -> None:
+            ...
+
+        @Strict(backend='codegen')
+        def grault(a: int, b: tuple[str, int]) -> None:
+            ...
+
+        @Strict(mode='observe')
+        def fred(a: int, b: list[str]) -> None:
+            ...
+
+        @Strict(budget_us=200)
+        def plugh(a: int, b: list[str]) -> None:
+            ...
+
+        @Strict(eager=True)
+        class Garply:
+            def waldo(self, a: int) -> str:
+                ...
+
     Attributes:
         _fx (Callable[[Any], Any]): The function reference.
         _fx_sign (inspect.Signature): The function signature.
+        _positionals (tuple[tuple[str, Validator | None], ...]): The
+            name and validator of each positional parameter, by
+            position. The validator is None if the parameter is ignored.
+        _keywords (dict[str, Validator | None]): The validator of each
+            parameter that can be given by name.
+        _var_positional (tuple[str, Validator] | None): The name and
+            validator of the *args parameter.
+        _var_keyword (Validator | None): The validator of the **kwargs
+            parameter.
+        _bad_defaults (dict[str, TypeError]): The error of each default
+            value that does not match with its parameter typing.
+        _lazy (bool): Whether some arguments must be wrapped into a
+            controlling proxy (iterators, generators...).
+        _retval_validator (Validator): The compiled validator of the
+            return annotation.
         _ignore (set[str]) = The list of arguments that will not
             inspected. Default to _DEFAULT_EXCLUSIONS.
+        _sample (Sample | dict[str, Sample] | None): The sampling
+            policy of the containers items, for all the parameters or by
+            parameter name ('return' for the return value).
+            Default to None.
+        _rate (float): The fraction of the function calls that are
+            controlled. Default to 1.
+        _metered (bool): Whether the controls telemetry is recorded.
+            Default to False.
+        _metrics (Metrics | None): The controls telemetry of the
+            function, if recorded.
+        _offload (bool): Whether the controls of the coroutine functions
+            are run in an executor instead of the event loop.
+            Default to False.
+        _executor (Executor | None): The executor running the offloaded
+            controls. The event loop default executor if None.
+        _frozen (set[str]): The parameters which values are not mutated
+            while the function runs, so they can be trusted once
+            validated ('return' for the return value). Default to an
+            empty set.
+        _trust (bool): Whether the immutable and frozen values already
+            validated by the enclosing strict calls are trusted.
+            Default to False, True if some parameters are frozen.
+        _cache_size (int): The maximum number of immutable values which
+            validation is cached, 0 to disable the cache. Default to 0,
+            DEFAULT_CACHE_SIZE if the option is True.
+        _cache (ResultCache | None): The validation result cache of the
+            function, if enabled.
+        _collect (bool): Whether all the mismatches of a call are
+            collected and raised at once, as a ValidationError.
+            Default to False, True if max_errors is given.
+        _max_errors (int | None): The maximum number of mismatches
+            collected. All of them if None. Default to None.
+        _engine (str): The validation engine (see `walker.ENGINES`):
+            'auto' runs the recursive validators and falls back on the
+            iterative walker if a value is too deeply nested,
+            'iterative' always runs the walker. Default to 'auto'.
+        _eager (bool): Whether the binding plan is compiled at
+            decoration time, instead of on first call or by `warmup`.
+            Default to False.
+        _compiled (bool): Whether the binding plan is compiled.
+        _backend (str): The validation backend (see `codegen.BACKENDS`):
+            'interpreted' runs the validators, 'codegen' runs their
+            generated source. Default to 'interpreted'.
+        _sign_check (Callable[..., bool] | None): The generated check of
+            the function arguments, if any. The arguments are validated
+            again by the validators on mismatch, to raise the error.
+        _generated (Callable[..., Any] | None): The generated wrapper of
+            the function, if any (see `codegen.generate_wrapper`), run
+            instead of the interpreted controls.
+        _mode (str): The controls mode (see `observe.MODES`): 'raise'
+            raises the mismatches, 'observe' reports them from a
+            background thread and never raises. Default to 'raise'.
+        _on_mismatch (Callable[[Observation], Any] | None): Called with
+            the mismatches observed in observe mode, instead of logging
+            them. Default to None.
+        _budget_us (float | None): The time budget of the arguments
+            control, and of the return value control, in microseconds.
+            The value is walked (see `walker`) and the control stops,
+            as if the value matched, once the budget is exhausted.
+            Unbounded if None. Default to None.
+        _budget_nodes (int | None): The maximum number of nodes walked
+            by the arguments control, and by the return value control.
+            Unbounded if None. Default to None.
+        _budgeted (bool): Whether the controls are bounded by a budget.
+            The budget only applies to the controls raising the first
+            mismatch (not in collect nor observe mode).
+        DEFAULT_CACHE_SIZE (ClassVar[int]): The result cache size when
+            the cache option is True.
         _DEFAULT_EXCLUSIONS (ClassVar[list[str]]) The default list of
             ignored function arguments.
     '''
 
     _DEFAULT_EXCLUSIONS: ClassVar[list[str]] = ['self', 'cls']
+    DEFAULT_CACHE_SIZE: ClassVar[int] = 1024
 
     def __init__(
         self,
@@ -41,94 +209,545 @@ class Strict:
 
         self._fx: Callable[[Any], Any] = None
         self._fx_sign: inspect.Signature = None
+        self._positionals: tuple[tuple[str, Validator | None], ...] = ()
+        self._keywords: dict[str, Validator | None] = {}
+        self._var_positional: tuple[str, Validator] | None = None
+        self._var_keyword: Validator | None = None
+        self._bad_defaults: dict[str, TypeError] = {}
+        self._lazy: bool = False
+        self._retval_validator: Validator = None
         self._ignore: set[str] = set(kwargs.get('ignore', []))
-        self._ignore.update(self._DEFAULT_EXCLUSIONS)
+        self._sample: Sample | dict[str, Sample] | None = kwargs.get('sample')
+        self._rate: float = kwargs.get('rate', 1)
+        self._metered: bool = kwargs.get('metrics', False)
+        self._metrics: Metrics | None = None
+        self._offload: bool = bool(kwargs.get('offload', False))
+        self._executor: Executor | None = (
+            kwargs['offload']
+            if isinstance(kwargs.get('offload'), Executor)
+            else None
+        )
+        self._frozen: set[str] = set(kwargs.get('frozen', []))
+        self._trust: bool = kwargs.get('trust', bool(self._frozen))
+        self._cache_size: int = (
+            self.DEFAULT_CACHE_SIZE
+            if kwargs.get('cache') is True
+            else int(kwargs.get('cache') or 0)
+        )
+        self._cache: ResultCache | None = None
+        self._max_errors: int | None = kwargs.get('max_errors')
+        self._collect: bool = kwargs.get(
+            'collect',
+            self._max_errors is not None,
+        )
+        self._engine: str = kwargs.get('engine', 'auto')
+        self._eager: bool = kwargs.get('eager', False)
+        self._compiled: bool = False
+        self._backend: str = kwargs.get('backend', 'interpreted')
+        self._sign_check: Callable[..., bool] | None = None
+        self._generated: Callable[..., Any] | None = None
+        self._mode: str = kwargs.get('mode', 'raise')
+        self._on_mismatch: Callable[[Observation], Any] | None = kwargs.get(
+            'on_mismatch'
+        )
+        self._budget_us: float | None = kwargs.get('budget_us')
+        self._budget_nodes: int | None = kwargs.get('budget_nodes')
+        self._budgeted: bool = (
+            (self._budget_us is not None or self._budget_nodes is not None)
+            and self._mode == 'raise'
+            and not self._collect
+        )
 
-    def _map_params(
-        self,
-        *fx_args: Any,
-        **fx_kwargs: Any,
-    ) -> dict[str, tuple[TypeVar, Any]]:
-        '''Build a mapping of the function given arguments and the
-        function signature.
+        if not 0 <= self._rate <= 1:
+            raise ValueError('Expected a rate in [0, 1].')
+        if self._cache_size < 0:
+            raise ValueError('Expected a positive cache size.')
+        if self._max_errors is not None and self._max_errors < 1:
+            raise ValueError('Expected at least 1 error.')
+        if self._engine not in ENGINES:
+            raise ValueError(f'Expected an engine in {ENGINES}.')
+        if self._backend not in BACKENDS:
+            raise ValueError(f'Expected a backend in {BACKENDS}.')
+        if self._mode not in MODES:
+            raise ValueError(f'Expected a mode in {MODES}.')
+        if (self._budget_us is not None and self._budget_us <= 0) or (
+            self._budget_nodes is not None and self._budget_nodes < 1
+        ):
+            raise ValueError('Expected a positive budget.')
+        self._ignore.update(self._DEFAULT_EXCLUSIONS)
 
-        Examples:
-            This method should returns a data like:
-                {
-                    'a': (int, 42),
-                    'b': (list[str], [5, 'string']),
-                }
+    def _inspect_fx_sign(self, *fx_args: Any, **fx_kwargs: Any) -> None:
+        '''Control the function given parameters.
+        Only the supplied arguments are controlled, the default values
+        have been controlled once by `_compile`.
 
         Args:
             *fx_args (Any): The function arguments.
             **fx_kwargs (Any): The function named arguments.
 
+        Raises:
+            TypeError: If any inspection detect a typing mismatch.
+        '''
+
+        if self._budgeted:
+            return self._walk_fx_sign(
+                fx_args,
+                fx_kwargs,
+                Budget(self._budget_us, self._budget_nodes),
+            )
+
+        if self._sign_check:
+            try:
+                if self._sign_check(*fx_args, **fx_kwargs):
+                    return
+            except (TypeError, RecursionError):
+                # The arguments don't bind to the signature, or are too
+                # deep: the validators tell.
+                pass
+
+        if self._mode == 'observe':
+            return self._observe_fx_sign(fx_args, fx_kwargs)
+
+        if self._collect:
+            return self._collect_fx_sign(fx_args, fx_kwargs)
+
+        arg_name: str = None
+
+        try:
+            for (arg_name, validator), value in zip(
+                self._positionals,
+                fx_args,
+            ):
+                if validator:
+                    validator.validate(value)
+
+            start: int = len(self._positionals)
+
+            if len(fx_args) > start and self._var_positional:
+                arg_name, validator = self._var_positional
+
+                for value in fx_args[start:]:
+                    validator.validate(value)
+
+            for arg_name, value in fx_kwargs.items():
+                validator = self._keywords.get(arg_name, self._var_keyword)
+
+                if validator:
+                    validator.validate(value)
+        except TypeError as e:
+            raise self._arg_error(arg_name, e)
+        except RecursionError:
+            return self._walk_fx_sign(fx_args, fx_kwargs)
+
+        if self._bad_defaults:
+            self._inspect_fx_defaults(len(fx_args), fx_kwargs)
+
+    def _walk_fx_sign(
+        self,
+        fx_args: tuple[Any, ...],
+        fx_kwargs: dict[str, Any],
+        budget: Budget | None = None,
+    ) -> None:
+        '''Control the function given parameters with the iterative
+        walker, when an argument is too deeply nested to be validated
+        recursively, or the control is bounded by a budget.
+
+        Args:
+            fx_args (tuple[Any, ...]): The function arguments.
+            fx_kwargs (dict[str, Any]): The function named arguments.
+            budget (Optional, Budget | None): The control budget, the
+                arguments left once it is exhausted are not controlled.
+                Unbounded if None. Default to None.
+
+        Raises:
+            TypeError: If any inspection detect a typing mismatch.
+        '''
+
+        for path, validator, value in self._bind(fx_args, fx_kwargs):
+            try:
+                walker.validate(validator, value, budget)
+            except TypeError as e:
+                raise self._arg_error(path.split('[')[0], e)
+
+            if budget and budget.exhausted:
+                metrics.record_partial(
+                    f'{self._fx.__module__}.{self._fx.__qualname__}'
+                )
+                return
+
+    def _inspect_fx_defaults(
+        self,
+        args_count: int,
+        fx_kwargs: dict[str, Any],
+    ) -> None:
+        '''Raise the error of the first mismatching default value used
+        by the call.
+
+        Args:
+            args_count (int): The number of given positional arguments.
+            fx_kwargs (dict[str, Any]): The function named arguments.
+
+        Raises:
+            TypeError: If a mismatching default value is used.
+        '''
+
+        given: set[str] = {name for name, _ in self._positionals[:args_count]}
+        given.update(fx_kwargs)
+
+        for arg_name, error in self._bad_defaults.items():
+            if arg_name not in given:
+                raise self._arg_error(arg_name, error)
+
+    def _arg_error(self, arg_name: str, error: TypeError) -> TypeError:
+        '''Build the error of a mismatching argument.
+
+        Args:
+            arg_name (str): The argument name.
+            error (TypeError): The validator error.
+
         Returns:
-            dict[str, tuple[TypeVar, Any]]: The parameters mapping.
+            TypeError: The error to raise.
         '''
 
-        params: dict[str, Any] = dict(self._fx_sign.parameters)
-        params_mapping: dict[str, tuple[TypeVar, Any]] = {}
+        if self._metrics:
+            self._metrics.record_mismatch(arg_name)
 
-        # Mapping kwargs parameters
-        for arg_name, arg_val in fx_kwargs.items():
-            params_mapping[arg_name] = (
-                params[arg_name].annotation,
-                arg_val,
-            )
-            del params[arg_name]
+        return TypeError(f'{self._arg_label(arg_name)}{error}')
+
+    def _wrap_args(
+        self,
+        fx_args: tuple[Any, ...],
+        fx_kwargs: dict[str, Any],
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        '''Wrap the arguments of the lazy parameters (iterators,
+        generators...) into proxies controlling their items while they
+        are consumed.
+
+        Args:
+            fx_args (tuple[Any, ...]): The function arguments.
+            fx_kwargs (dict[str, Any]): The function named arguments.
+
+        Returns:
+            tuple[tuple[Any, ...], dict[str, Any]]: The function
+                arguments and named arguments to call with.
+        '''
+
+        args: list[Any] = list(fx_args)
+        kwargs: dict[str, Any] = dict(fx_kwargs)
+
+        for i, value in enumerate(fx_args):
+            if i < len(self._positionals):
+                arg_name, validator = self._positionals[i]
+            elif self._var_positional:
+                arg_name, validator = self._var_positional
+            else:
+                break
+
+            if validator and validator.lazy:
+                args[i] = validator.wrap(
+                    value,
+                    self._arg_label(arg_name),
+                    self._reporter(arg_name),
+                )
+
+        for arg_name, value in fx_kwargs.items():
+            validator = self._keywords.get(arg_name, self._var_keyword)
 
-        # Mapping args parameters
-        for arg_name, arg_val in zip(params, fx_args):
-            params_mapping[arg_name] = (
-                params[arg_name].annotation,
-                arg_val,
+            if validator and validator.lazy:
+                kwargs[arg_name] = validator.wrap(
+                    value,
+                    self._arg_label(arg_name),
+                    self._reporter(arg_name),
+                )
+
+        return tuple(args), kwargs
+
+    def _reporter(self, arg_name: str) -> Reporter | None:
+        '''Get the mismatches reporter of the proxies of an argument,
+        in observe mode.
+
+        Args:
+            arg_name (str): The argument name, 'return' for the return
+                value.
+
+        Returns:
+            Reporter | None: The reporter pushing the items mismatches
+                to the observer, None if the mismatches are raised.
+        '''
+
+        if self._mode != 'observe':
+            return None
+
+        return functools.partial(self._observe, arg_name)
+
+    def _arg_label(self, arg_name: str) -> str:
+        '''Get the errors messages prefix of an argument.
+
+        Args:
+            arg_name (str): The argument name.
+
+        Returns:
+            str: The errors messages prefix.
+        '''
+
+        return f'[{self._fx.__name__}] Arg \'{arg_name}\' error. '
+
+    def _inspect_fx_retval(self, retval: Any) -> Any:
+        '''Control the function return value.
+        The lazy return values (iterators, generators...) are wrapped
+        into proxies controlling their items while they are consumed.
+
+        Args:
+            retval (Any): The function return value.
+
+        Raises:
+            TypeError: If the function return value does not match the
+                signature.
+
+        Returns:
+            Any: The return value, or its controlling proxy.
+        '''
+
+        if self._mode == 'observe':
+            if not walker.accepts(self._retval_validator, retval):
+                self._observe('return', self._retval_validator, retval)
+            elif self._retval_validator.lazy:
+                return self._retval_validator.wrap(
+                    retval,
+                    f'[{self._fx.__name__}] Return value error. ',
+                    self._reporter('return'),
+                )
+
+            return retval
+
+        if self._collect:
+            if not self._retval_validator.check(retval):
+                raise self._collect_fx_retval(retval)
+        else:
+            budget: Budget | None = (
+                Budget(self._budget_us, self._budget_nodes)
+                if self._budgeted
+                else None
             )
 
-        # Mapping default parameters
-        for arg_name, param in params.items():
-            if param.default != inspect._empty:
-                params_mapping[arg_name] = (
-                    param.annotation,
-                    param.default,
+            try:
+                if budget:
+                    walker.validate(self._retval_validator, retval, budget)
+                else:
+                    walker.run(self._retval_validator, retval)
+            except TypeError as e:
+                if self._metrics:
+                    self._metrics.record_mismatch('return')
+
+                raise TypeError(
+                    f'[{self._fx.__name__}] Return value error. {e}'
                 )
 
-        return params_mapping
+            if budget and budget.exhausted:
+                metrics.record_partial(
+                    f'{self._fx.__module__}.{self._fx.__qualname__}'
+                )
 
-    def _inspect_fx_sign(self, *fx_args: Any, **fx_kwargs: Any) -> None:
-        '''Control the function given parameters.
+        if self._retval_validator.lazy:
+            return self._retval_validator.wrap(
+                retval,
+                f'[{self._fx.__name__}] Return value error. ',
+            )
+
+        return retval
+
+    def _observe_fx_sign(
+        self,
+        fx_args: tuple[Any, ...],
+        fx_kwargs: dict[str, Any],
+    ) -> None:
+        '''Control the function given parameters in observe mode: the
+        mismatches are pushed to the background reporter, never raised.
 
         Args:
-            *fx_args (Any): The function arguments.
-            **fx_kwargs (Any): The function named arguments.
+            fx_args (tuple[Any, ...]): The function arguments.
+            fx_kwargs (dict[str, Any]): The function named arguments.
+        '''
+
+        for path, validator, value in self._bind(fx_args, fx_kwargs):
+            if not walker.accepts(validator, value):
+                self._observe(path.split('[')[0], validator, value)
+
+    def _observe(
+        self,
+        arg_name: str,
+        validator: Validator,
+        value: Any,
+    ) -> None:
+        '''Push a mismatch to the background reporter.
+
+        Args:
+            arg_name (str): The argument name, 'return' for the return
+                value.
+            validator (Validator): The argument validator.
+            value (Any): The mismatching value.
+        '''
+
+        if self._metrics:
+            self._metrics.record_mismatch(arg_name)
+
+        observe.push(
+            f'{self._fx.__module__}.{self._fx.__qualname__}',
+            arg_name,
+            validator,
+            value,
+            self._on_mismatch,
+        )
+
+    def _collect_fx_sign(
+        self,
+        fx_args: tuple[Any, ...],
+        fx_kwargs: dict[str, Any],
+    ) -> None:
+        '''Control the function given parameters, raising all their
+        mismatches at once.
+        The arguments are only checked, without raising nor catching
+        any exception, the mismatches are collected on failure only.
+
+        Args:
+            fx_args (tuple[Any, ...]): The function arguments.
+            fx_kwargs (dict[str, Any]): The function named arguments.
 
         Raises:
-            TypeError: If any inspection detect a typing mismatch.
+            ValidationError: If any argument does not match with its
+                typing.
         '''
 
-        params_mapping: dict[str, tuple[TypeVar, Any]] = self._map_params(
-            *fx_args,
-            **fx_kwargs,
+        bound: list[tuple[str, Validator, Any]] = self._bind(
+            fx_args,
+            fx_kwargs,
         )
 
-        for arg_name, pair in params_mapping.items():
-            if arg_name not in self._ignore:
-                try:
-                    type_, value = pair
+        if all(validator.check(value) for _, validator, value in bound):
+            return
 
-                    if type_ is inspect._empty:
-                        raise TypeError('Missing typing.')
+        result: ValidationResult = ValidationResult(self._max_errors)
 
-                    inspector: Introspector = Introspector(type_, value)
-                    inspector.inspect()
-                except TypeError as e:
-                    raise TypeError(
-                        f'[{self._fx.__name__}] Arg '
-                        f'\'{arg_name}\' error. {e}'
+        for path, validator, value in bound:
+            if result.full:
+                result.truncated = True
+                break
+
+            if not validator.check(value):
+                if self._metrics:
+                    self._metrics.record_mismatch(path.split('[')[0])
+
+                validator.collect(value, path, result)
+
+        raise ValidationError(
+            f'[{self._fx.__name__}] Args errors.\n{result}',
+            result,
+        )
+
+    def _collect_fx_retval(self, retval: Any) -> ValidationError:
+        '''Build the error of all the mismatches of the return value.
+
+        Args:
+            retval (Any): The mismatching return value.
+
+        Returns:
+            ValidationError: The error to raise.
+        '''
+
+        if self._metrics:
+            self._metrics.record_mismatch('return')
+
+        result: ValidationResult = self._retval_validator.report(
+            retval,
+            self._max_errors,
+            'return',
+        )
+        return ValidationError(
+            f'[{self._fx.__name__}] Return value error.\n{result}',
+            result,
+        )
+
+    def _bind(
+        self,
+        fx_args: tuple[Any, ...],
+        fx_kwargs: dict[str, Any],
+    ) -> list[tuple[str, Validator, Any]]:
+        '''Bind the controlled arguments to their validators, including
+        the mismatching default values used by the call.
+
+        Args:
+            fx_args (tuple[Any, ...]): The function arguments.
+            fx_kwargs (dict[str, Any]): The function named arguments.
+
+        Returns:
+            list[tuple[str, Validator, Any]]: The path, validator and
+                value of each controlled argument.
+        '''
+
+        bound: list[tuple[str, Validator, Any]] = [
+            (arg_name, validator, value)
+            for (arg_name, validator), value in zip(
+                self._positionals,
+                fx_args,
+            )
+            if validator
+        ]
+
+        start: int = len(self._positionals)
+
+        if len(fx_args) > start and self._var_positional:
+            arg_name, validator = self._var_positional
+            bound.extend(
+                (f'{arg_name}[{index}]', validator, value)
+                for index, value in enumerate(fx_args[start:])
+            )
+
+        for arg_name, value in fx_kwargs.items():
+            validator = self._keywords.get(arg_name, self._var_keyword)
+
+            if validator:
+                bound.append((arg_name, validator, value))
+
+        given: set[str] = set(fx_kwargs)
+        given.update(name for name, _ in self._positionals[: len(fx_args)])
+        validators: dict[str, Validator | None] = {
+            **dict(self._positionals),
+            **self._keywords,
+        }
+
+        for arg_name in self._bad_defaults:
+            if arg_name not in given:
+                bound.append(
+                    (
+                        arg_name,
+                        validators[arg_name],
+                        self._fx_sign.parameters[arg_name].default,
                     )
+                )
 
-    def _inspect_fx_retval(self, retval: Any) -> None:
-        '''Control the function return value.
+        return bound
+
+    def _metered_sign(self, *fx_args: Any, **fx_kwargs: Any) -> None:
+        '''Control the function given parameters, recording the time
+        spent.
+
+        Args:
+            *fx_args (Any): The function arguments.
+            **fx_kwargs (Any): The function named arguments.
+
+        Raises:
+            TypeError: If any inspection detect a typing mismatch.
+        '''
+
+        start: int = time.perf_counter_ns()
+
+        try:
+            self._inspect_fx_sign(*fx_args, **fx_kwargs)
+        finally:
+            self._metrics.record_sign(time.perf_counter_ns() - start)
+
+    def _metered_retval(self, retval: Any) -> Any:
+        '''Control the function return value, recording the time spent.
 
         Args:
             retval (Any): The function return value.
@@ -136,16 +755,45 @@ class Strict:
         Raises:
             TypeError: If the function return value does not match the
                 signature.
+
+        Returns:
+            Any: The return value, or its controlling proxy.
         '''
 
+        start: int = time.perf_counter_ns()
+
         try:
-            inspector: Introspector = Introspector(
-                self._fx_sign.return_annotation,
-                retval,
-            )
-            inspector.inspect()
-        except TypeError as e:
-            raise TypeError(f'[{self._fx.__name__}] Return value error. {e}')
+            return self._inspect_fx_retval(retval)
+        finally:
+            self._metrics.record_retval(time.perf_counter_ns() - start)
+
+    async def _offloaded(
+        self,
+        control: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        '''Run a control in the executor, so a long control doesn't
+        block the event loop.
+
+        Args:
+            control (Callable[..., Any]): The control method.
+            *args (Any): The control arguments.
+            **kwargs (Any): The control named arguments.
+
+        Raises:
+            TypeError: If the control detects a typing mismatch.
+
+        Returns:
+            Any: The control result.
+        '''
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        context: contextvars.Context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(context.run, control, *args, **kwargs),
+        )
 
     def __call__(self, fx: Callable[[Any], Any]) -> Any:
         '''The __call__ implementation.
@@ -160,7 +808,8 @@ class Strict:
             ValueError: If the given fx argument is not a Callable.
 
         Returns:
-            Any: The function return value.
+            Any: The function return value. The function itself if the
+                controls are turned off (see `config`).
         '''
 
         def wrapper(*fx_args: Any, **fx_kwargs: Any) -> Any:
@@ -179,14 +828,390 @@ class Strict:
                 Any: The function return value.
             '''
 
-            self._inspect_fx_sign(*fx_args, **fx_kwargs)
+            if not self._compiled and config.enabled:
+                self.warmup()
+
+            if self._generated:
+                return self._generated(*fx_args, **fx_kwargs)
+
+            if config.enabled and (
+                self._rate == 1 or random.random() < self._rate
+            ):
+                if self._trust and not trust.is_open():
+                    with trust.scope():
+                        return controlled(*fx_args, **fx_kwargs)
+
+                return controlled(*fx_args, **fx_kwargs)
+
+            return self._fx(*fx_args, **fx_kwargs)
+
+        def controlled(*fx_args: Any, **fx_kwargs: Any) -> Any:
+            '''Call the function with its controls, once sampled by the
+            wrapper.
+
+            Args:
+                *fx_args (Any): The function arguments.
+                **fx_kwargs (Any): The function named arguments.
+
+            Raises:
+                TypeError: If any function values does not match with the
+                    function signature.
+
+            Returns:
+                Any: The function return value.
+            '''
+
+            if self._metrics:
+                self._metered_sign(*fx_args, **fx_kwargs)
+            else:
+                self._inspect_fx_sign(*fx_args, **fx_kwargs)
+
+            if self._lazy:
+                fx_args, fx_kwargs = self._wrap_args(fx_args, fx_kwargs)
+
             retval: Any = self._fx(*fx_args, **fx_kwargs)
-            self._inspect_fx_retval(retval)
-            return retval
+
+            if self._metrics:
+                return self._metered_retval(retval)
+
+            return self._inspect_fx_retval(retval)
+
+        async def async_wrapper(*fx_args: Any, **fx_kwargs: Any) -> Any:
+            '''The decorator inner function of the coroutine functions.
+            Apply the function controls, the return value control is
+            applied to the awaited result.
+
+            Args:
+                *fx_args (Any): The function arguments.
+                **fx_kwargs (Any): The function named arguments.
+
+            Raises:
+                TypeError: If any function values does not match with the
+                    function signature.
+
+            Returns:
+                Any: The function awaited return value.
+            '''
+
+            if config.enabled and (
+                self._rate == 1 or random.random() < self._rate
+            ):
+                if not self._compiled:
+                    self.warmup()
+
+                if self._trust and not trust.is_open():
+                    with trust.scope():
+                        return await async_controlled(*fx_args, **fx_kwargs)
+
+                return await async_controlled(*fx_args, **fx_kwargs)
+
+            return await self._fx(*fx_args, **fx_kwargs)
+
+        async def async_controlled(*fx_args: Any, **fx_kwargs: Any) -> Any:
+            '''Await the coroutine function with its controls, once
+            sampled by the wrapper.
+
+            Args:
+                *fx_args (Any): The function arguments.
+                **fx_kwargs (Any): The function named arguments.
+
+            Raises:
+                TypeError: If any function values does not match with the
+                    function signature.
+
+            Returns:
+                Any: The function awaited return value.
+            '''
+
+            if self._offload:
+                await self._offloaded(sign_control, *fx_args, **fx_kwargs)
+            else:
+                sign_control(*fx_args, **fx_kwargs)
+
+            if self._lazy:
+                fx_args, fx_kwargs = self._wrap_args(fx_args, fx_kwargs)
+
+            retval: Any = await self._fx(*fx_args, **fx_kwargs)
+
+            if self._offload:
+                return await self._offloaded(retval_control, retval)
+
+            return retval_control(retval)
 
         if not callable(fx):
             raise ValueError('Expected callable at 1st arg.')
 
+        if not config.enabled:
+            return fx
+
+        if inspect.isclass(fx):
+            return self._decorate_class(fx)
+
         self._fx = fx
-        self._fx_sign = inspect.signature(self._fx)
+
+        if self._metered:
+            self._metrics = metrics.register(
+                f'{fx.__module__}.{fx.__qualname__}'
+            )
+
+        if self._cache_size:
+            self._cache = memo.register(
+                f'{fx.__module__}.{fx.__qualname__}',
+                self._cache_size,
+            )
+
+        if self._eager:
+            self.warmup()
+        else:
+            _PENDING.add(self)
+
+        if self._generated:
+            return self._generated
+
+        if inspect.iscoroutinefunction(fx):
+            sign_control: Callable[..., None] = (
+                self._metered_sign if self._metrics else self._inspect_fx_sign
+            )
+            retval_control: Callable[[Any], Any] = (
+                self._metered_retval
+                if self._metrics
+                else self._inspect_fx_retval
+            )
+            return async_wrapper
+
         return wrapper
+
+    def warmup(self) -> int:
+        '''Compile the binding plan of the function, if not compiled
+        yet.
+
+        Raises:
+            TypeError: If a parameter typing is malformed.
+
+        Returns:
+            int: 1 if the plan was compiled, 0 if it already was.
+        '''
+
+        with _COMPILING:
+            if self._compiled:
+                return 0
+
+            self._fx_sign = inspect.signature(self._fx)
+            self._compile()
+            self._compiled = True
+            _PENDING.discard(self)
+            return 1
+
+    def _decorate_class(self, cls: type) -> type:
+        '''Control the public methods of a class, and the __init__ of
+        the dataclasses. Each method is decorated by a copy of the
+        decorator, the methods sharing an annotation share its compiled
+        validator (see `validator.compile_type`).
+
+        Args:
+            cls (type): The class.
+
+        Returns:
+            type: The class, with its methods decorated.
+        '''
+
+        for name, member in list(vars(cls).items()):
+            if name.startswith('_') and not (
+                name == '__init__' and dataclasses.is_dataclass(cls)
+            ):
+                continue
+
+            if isinstance(member, (staticmethod, classmethod)):
+                decorated: Any = type(member)(
+                    copy.copy(self)(member.__func__)
+                )
+            elif inspect.isfunction(member):
+                decorated = copy.copy(self)(member)
+            else:
+                continue
+
+            setattr(cls, name, decorated)
+
+        return cls
+
+    def _compile(self) -> None:
+        '''Compile the binding plan of the function signature.
+        The validators are built and the default values are controlled
+        once, on first call or warmup, so the function calls only have
+        to run the validators of the supplied arguments.
+        '''
+
+        positionals: list[tuple[str, Validator | None]] = []
+        validators: dict[str, Validator | None] = {}
+        self._keywords = {}
+        self._var_positional = None
+        self._var_keyword = None
+        self._bad_defaults = {}
+
+        for name, param in self._fx_sign.parameters.items():
+            validator: Validator | None = None
+
+            if name not in self._ignore:
+                validator = (
+                    _MissingTyping(param.annotation)
+                    if param.annotation is inspect._empty
+                    else self._skipping(
+                        name,
+                        compile_type(param.annotation, self._get_sample(name)),
+                    )
+                )
+
+            validators[name] = validator
+
+            if param.kind is param.VAR_POSITIONAL:
+                self._var_positional = (name, validator) if validator else None
+                continue
+            elif param.kind is param.VAR_KEYWORD:
+                self._var_keyword = validator
+                continue
+            elif param.kind is not param.KEYWORD_ONLY:
+                positionals.append((name, validator))
+
+            if param.kind is not param.POSITIONAL_ONLY:
+                self._keywords[name] = validator
+
+            if (
+                validator
+                and param.default is not inspect._empty
+                and param.default is not _DEFAULT_FACTORY
+            ):
+                try:
+                    walker.run(validator, param.default)
+                except TypeError as e:
+                    self._bad_defaults[name] = e
+
+        self._positionals = tuple(positionals)
+        self._lazy = any(
+            validator.lazy
+            for validator in (
+                *self._keywords.values(),
+                *(validator for _, validator in positionals),
+                self._var_positional and self._var_positional[1],
+                self._var_keyword,
+            )
+            if validator
+        )
+        self._retval_validator = self._skipping(
+            'return',
+            compile_type(
+                self._fx_sign.return_annotation,
+                self._get_sample('return'),
+            ),
+        )
+        self._sign_check = None
+
+        # The generated check would skip the trusted and cached values
+        # bookkeeping of the validators.
+        if self._backend == 'codegen' and not (self._trust or self._cache):
+            self._sign_check = codegen.generate_sign(
+                f'{self._fx.__module__}.{self._fx.__qualname__}',
+                self._fx_sign,
+                validators,
+                self._bad_defaults,
+            )
+
+        # The generated wrapper only runs the default controls of the
+        # plain functions.
+        if self._sign_check and not (
+            self._metered
+            or self._lazy
+            or self._retval_validator.lazy
+            or self._mode == 'observe'
+            or self._collect
+            or self._budgeted
+            or inspect.iscoroutinefunction(self._fx)
+        ):
+            self._generated = codegen.generate_wrapper(
+                self._fx,
+                self._fx_sign,
+                validators,
+                self._bad_defaults,
+                self._retval_validator,
+                self._rate,
+                (self._inspect_fx_sign, self._inspect_fx_retval),
+            )
+
+    def _skipping(self, arg_name: str, validator: Validator) -> Validator:
+        '''Get the validator of a parameter, skipping the values already
+        validated by the enclosing strict calls if they can be trusted,
+        or found in the result cache.
+        The immutable values are only trusted or cached if they are
+        containers, the plain values are faster to check than to look
+        up.
+
+        Args:
+            arg_name (str): The parameter name, or 'return' for the
+                return value.
+            validator (Validator): The parameter validator.
+
+        Returns:
+            Validator: The validator to use.
+        '''
+
+        container: bool = validator.immutable and (
+            isinstance(validator, TupleValidator)
+            or (
+                isinstance(validator, UnionValidator)
+                and bool(validator._dispatch or validator._fallbacks)
+            )
+        )
+
+        # The trusted and cached values are keyed by the shared
+        # validator, not by the wrappers of this function.
+        compiled: Validator = validator
+
+        if self._engine == 'iterative':
+            validator = IterativeValidator(validator)
+        elif self._backend == 'codegen':
+            validator = GeneratedValidator(validator)
+
+        if self._cache and container:
+            validator = CachedValidator(validator, self._cache, compiled)
+
+        if self._trust and (arg_name in self._frozen or container):
+            validator = TrustedValidator(validator, compiled)
+
+        return validator
+
+    def _get_sample(self, arg_name: str) -> Sample | None:
+        '''Get the sampling policy of a parameter.
+
+        Args:
+            arg_name (str): The parameter name, or 'return' for the
+                return value.
+
+        Returns:
+            Sample | None: The sampling policy.
+        '''
+
+        if isinstance(self._sample, dict):
+            return self._sample.get(arg_name)
+
+        return self._sample
+
+
+class _MissingTyping(Validator):
+    '''The validator of the parameters without typing.
+    Any value is rejected.
+    '''
+
+    flat: ClassVar[bool] = True
+
+    def validate(self, value: Any) -> None:
+        raise TypeError('Missing typing.')
+
+    def check(self, value: Any) -> bool:
+        return False
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        result.add(path, self._type, value, 'Missing typing.')
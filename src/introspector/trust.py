@@ -0,0 +1,193 @@
+from typing import Any, Iterator
+from collections import abc
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from .proxy import Reporter
+from .result import ValidationResult
+from .validator import Validator
+
+# The values already validated by the running strict calls, by value id.
+# The value itself is kept, so its id can't be reused by another object
+# while the scope is open. The scope is bound to the context, so each
+# thread and asyncio task has its own.
+_TRUSTED: ContextVar[dict[int, tuple[Any, set[Validator]]] | None] = (
+    ContextVar('introspector_trusted', default=None)
+)
+
+
+@contextmanager
+def scope() -> Iterator[None]:
+    '''Open a trust scope, if none is open yet.
+    The values validated inside the scope are not validated again by the
+    trusting validators until the scope is closed.
+    '''
+
+    if is_open():
+        yield
+        return
+
+    token: Token = _TRUSTED.set({})
+
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
+def is_open() -> bool:
+    '''Tell if a trust scope is open in the current context.
+
+    Returns:
+        bool: True if a scope is open, False otherwise.
+    '''
+
+    return _TRUSTED.get() is not None
+
+
+def is_trusted(value: Any, validator: Validator) -> bool:
+    '''Tell if a value was already validated in the current scope.
+
+    Args:
+        value (Any): The value.
+        validator (Validator): The validator of the value typing.
+
+    Returns:
+        bool: True if the value was validated by this validator, False
+            otherwise or if no scope is open.
+    '''
+
+    trusted: dict[int, tuple[Any, set[Validator]]] | None = _TRUSTED.get()
+
+    if not trusted:
+        return False
+
+    entry: tuple[Any, set[Validator]] | None = trusted.get(id(value))
+    return entry is not None and entry[0] is value and validator in entry[1]
+
+
+def remember(value: Any, validator: Validator) -> None:
+    '''Record a validated value in the current scope, if any.
+
+    Args:
+        value (Any): The validated value.
+        validator (Validator): The validator of the value typing.
+    '''
+
+    trusted: dict[int, tuple[Any, set[Validator]]] | None = _TRUSTED.get()
+
+    if trusted is None:
+        return
+
+    entry: tuple[Any, set[Validator]] | None = trusted.get(id(value))
+
+    if entry is None or entry[0] is not value:
+        trusted[id(value)] = (value, {validator})
+    else:
+        entry[1].add(validator)
+
+
+class TrustedValidator(Validator):
+    '''The validator skipping the values already validated in the
+    current trust scope.
+    Only the values which can't change during the scope are trusted:
+    the immutable ones, or the ones the functions declare frozen.
+
+    Attributes:
+        _validator (Validator): The wrapped validator.
+        _key (Validator): The validator of the value typing, shared by
+            the functions (see `validator.compile_type`).
+    '''
+
+    def __init__(
+        self,
+        validator: Validator,
+        key: Validator | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            validator (Validator): The wrapped validator.
+            key (Optional, Validator | None): The validator of the value
+                typing, shared by the functions, if the wrapped one is
+                specific to a function (iterative, generated...).
+                Default to None (the wrapped validator).
+        '''
+
+        super().__init__(validator._type)
+        self._validator: Validator = validator
+        self._key: Validator = key or validator
+        self.lazy = validator.lazy
+        self.immutable = validator.immutable
+        self.flat = validator.flat
+
+    def validate(self, value: Any) -> None:
+        if not is_trusted(value, self._key):
+            self._validator.validate(value)
+            remember(value, self._key)
+
+    def check(self, value: Any) -> bool:
+        if is_trusted(value, self._key):
+            return True
+        elif self._validator.check(value):
+            remember(value, self._key)
+            return True
+
+        return False
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if not is_trusted(value, self._key):
+            mismatches: int = len(result.mismatches)
+            self._validator.collect(value, path, result)
+
+            if len(result.mismatches) == mismatches:
+                remember(value, self._key)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if is_trusted(value, self._key):
+            return ()
+
+        # The walk is depth first: the value is remembered once all its
+        # items matched, it never is if the walk stops before.
+        return (
+            (self._validator, value),
+            (_Remembering(self._key), value),
+        )
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        return self._validator.wrap(value, label, report)
+
+
+class _Remembering(Validator):
+    '''The walker node recording a value as validated, walked right
+    after the value itself (see `TrustedValidator.expand`).
+
+    Attributes:
+        _validator (Validator): The validator of the value typing.
+    '''
+
+    def __init__(self, validator: Validator) -> None:
+        '''The constructor.
+
+        Args:
+            validator (Validator): The validator of the value typing.
+        '''
+
+        super().__init__(validator._type)
+        self._validator: Validator = validator
+
+    def check(self, value: Any) -> bool:
+        return True
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        remember(value, self._validator)
+        return ()
@@ -0,0 +1,2167 @@
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    ClassVar,
+    NotRequired,
+    Required,
+    TypeVar,
+    Union,
+    get_type_hints,
+    is_typeddict,
+)
+from collections import abc
+from itertools import chain, repeat
+import dataclasses
+from .arrays import Constraint, ndarray_dtype
+from .proxy import (
+    AsyncGeneratorProxy,
+    AsyncIterableProxy,
+    AsyncIteratorProxy,
+    GeneratorProxy,
+    IterableProxy,
+    IteratorProxy,
+    Reporter,
+)
+from .result import ValidationResult
+from .sample import Sample
+
+
+class Validator:
+    '''The compiled validator base class.
+    A validator is built once from a typing tree by `compile_type` and
+    can then check any number of values without walking the typing
+    tree again.
+
+    Attributes:
+        _type (TypeVar): The type tree the validator was compiled from.
+        lazy (ClassVar[bool]): Whether the values are controlled while
+            consumed, through the proxy returned by `wrap`.
+        immutable (ClassVar[bool]): Whether the accepted values can't
+            change once validated (int, str, tuple of immutables...).
+        flat (ClassVar[bool]): Whether `check` never runs the
+            validators of the value items, so it can't recurse.
+    '''
+
+    lazy: ClassVar[bool] = False
+    immutable: ClassVar[bool] = False
+    flat: ClassVar[bool] = False
+
+    def __init__(self, type_: TypeVar) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+        '''
+
+        self._type: TypeVar = type_
+
+    def validate(self, value: Any) -> None:
+        '''Compare the value with the compiled type tree.
+        The value is first checked with the fast `check` path, the
+        slower item by item analysis is only run on a mismatch to
+        find the precise error.
+
+        Args:
+            value (Any): The value to analyze.
+
+        Raises:
+            TypeError: If the value data structure does not match
+                with the compiled typing.
+        '''
+
+        if not self.check(value):
+            self.validate_origin(value)
+            self.validate_items(value)
+            raise self._mismatch(value)
+
+    def check(self, value: Any) -> bool:
+        '''Tell if the value matches with the compiled type tree.
+        Unlike `validate`, no exception is raised nor built.
+
+        Args:
+            value (Any): The value to analyze.
+
+        Returns:
+            bool: True if the value matches, False otherwise.
+        '''
+
+        raise NotImplementedError
+
+    def check_many(self, values: abc.Iterable[Any]) -> bool:
+        '''Tell if all the values match with the compiled type tree.
+        Used to check the items of a container at once.
+
+        Args:
+            values (abc.Iterable[Any]): The values to analyze.
+
+        Returns:
+            bool: True if all the values match, False otherwise.
+        '''
+
+        return all(map(self.check, values))
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        '''Collect all the mismatches of the value, without raising.
+        The matching values only cost a `check`.
+
+        Args:
+            value (Any): The value to analyze.
+            path (str): The path of the value from the root value.
+            result (ValidationResult): The result collecting the
+                mismatches.
+        '''
+
+        if not self.check(value):
+            result.add(path, self._type, value)
+
+    def expand(
+        self,
+        value: Any,
+    ) -> abc.Iterable[tuple['Validator', Any]] | None:
+        '''Check the value itself, not its items, for the iterative
+        engine (see `walker`).
+        The flat items may be checked at once, the others are returned
+        to be checked next.
+
+        Args:
+            value (Any): The value to analyze.
+
+        Returns:
+            abc.Iterable[tuple[Validator, Any]] | None: The validator
+                and value of each item to check next, None if the value
+                does not match.
+        '''
+
+        return () if self.check(value) else None
+
+    def report(
+        self,
+        value: Any,
+        max_errors: int | None = None,
+        path: str = '',
+    ) -> ValidationResult:
+        '''Validate the value, collecting all the mismatches instead of
+        raising the first one.
+
+        Args:
+            value (Any): The value to analyze.
+            max_errors (Optional, int | None): The maximum number of
+                mismatches collected. All of them if None.
+                Default to None.
+            path (Optional, str): The path of the root value.
+                Default to ''.
+
+        Returns:
+            ValidationResult: The validation result.
+        '''
+
+        result: ValidationResult = ValidationResult(max_errors)
+        self.collect(value, path, result)
+        return result
+
+    def validate_origin(self, value: Any) -> None:
+        '''Analyze the main type.
+
+        Args:
+            value (Any): The value to analyze.
+
+        Raises:
+            TypeError: If the value does not match with the main type.
+        '''
+
+    def validate_items(self, value: Any) -> None:
+        '''Analyze the subtypes of the main type.
+
+        Args:
+            value (Any): The value to analyze.
+
+        Raises:
+            TypeError: If the value items does not match with the
+                subtypes.
+        '''
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        '''Wrap a value into a proxy controlling its items while they
+        are consumed. The value is returned as is by the validators which
+        are not lazy.
+
+        Args:
+            value (Any): The value, already checked by `validate`.
+            label (Optional, str): The prefix of the proxy errors
+                messages. Default to ''.
+            report (Optional, Reporter | None): Called with the
+                validator and the value of the mismatching items,
+                instead of raising. Default to None.
+
+        Returns:
+            Any: The proxy.
+        '''
+
+        return value
+
+    def _mismatch(self, value: Any) -> TypeError:
+        '''Build the mismatch error of the given value.
+
+        Args:
+            value (Any): The mismatching value.
+
+        Returns:
+            TypeError: The error to raise.
+        '''
+
+        return TypeError(f'Expected {self._type}. Mismatch on {type(value)}')
+
+
+class AnyValidator(Validator):
+    '''The validator of the typing trees that accept any value.
+    Example:
+        - Any
+        - T = TypeVar('T')
+    '''
+
+    flat: ClassVar[bool] = True
+
+    def validate(self, value: Any) -> None:
+        pass
+
+    def check(self, value: Any) -> bool:
+        return True
+
+    def check_many(self, values: abc.Iterable[Any]) -> bool:
+        return True
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        pass
+
+
+class ClassValidator(Validator):
+    '''The validator of the plain classes.
+    The value type must be exactly the expected class.
+    Many values are checked at once by collecting their types, which
+    doesn't cost a Python call per value.
+    Example:
+        - int
+        - frozenset[int]: main type is frozenset
+
+    Attributes:
+        _origin (type): The expected class.
+        _accepted (frozenset[type]): The accepted value types.
+    '''
+
+    flat: ClassVar[bool] = True
+
+    def __init__(self, type_: TypeVar, origin: type) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            origin (type): The expected class.
+        '''
+
+        super().__init__(type_)
+        self._origin: type = origin
+        self._accepted: frozenset[type] = frozenset((origin, NoneType))
+        self.immutable = origin in _IMMUTABLES
+
+    def check(self, value: Any) -> bool:
+        return value is None or type(value) is self._origin
+
+    def check_many(self, values: abc.Iterable[Any]) -> bool:
+        return set(map(type, values)) <= self._accepted
+
+    def validate_origin(self, value: Any) -> None:
+        if type(value) is not self._origin:
+            raise self._mismatch(value)
+
+
+class CallableValidator(Validator):
+    '''The validator of the callable typings.
+    Example:
+        - Callable
+        - Callable[[int, str], int]: subtypes are not analyzed
+    '''
+
+    flat: ClassVar[bool] = True
+
+    def check(self, value: Any) -> bool:
+        return value is None or is_instance(value, abc.Callable)
+
+    def validate_origin(self, value: Any) -> None:
+        if not is_instance(value, abc.Callable):
+            raise self._mismatch(value)
+
+
+class AbstractClassValidator(Validator):
+    '''The validator of the other abstract classes of collections.abc.
+    Any instance of the abstract class is accepted, found with a cached
+    isinstance lookup (see `is_instance`), its items are not checked.
+    Example:
+        - Hashable
+        - Container[int]: subtypes are not analyzed
+
+    Attributes:
+        _origin (type): The expected abstract class.
+    '''
+
+    flat: ClassVar[bool] = True
+
+    def __init__(self, type_: TypeVar, origin: type) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            origin (type): The expected abstract class.
+        '''
+
+        super().__init__(type_)
+        self._origin: type = origin
+
+    def check(self, value: Any) -> bool:
+        return value is None or is_instance(value, self._origin)
+
+    def validate_origin(self, value: Any) -> None:
+        if not is_instance(value, self._origin):
+            raise self._mismatch(value)
+
+
+class UnionValidator(Validator):
+    '''The validator of the union typings.
+    Example:
+        - int | float
+        - Optional[str]
+
+    The candidate members of a value are found with a lookup on the
+    value type, so most of the values are checked without trying each
+    member in turn.
+
+    Attributes:
+        _members (tuple[Validator, ...]): The union members validators.
+        _any (bool): Whether a member accepts any value.
+        _leaves (frozenset[type]): The plain classes of the members.
+        _dispatch (dict[type, tuple[Validator, ...]]): The generic
+            members validators, by main type.
+        _fallbacks (tuple[Validator, ...]): The members validators that
+            can't be found by type.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        members: tuple[Validator, ...],
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            members (tuple[Validator, ...]): The union members
+                validators.
+        '''
+
+        super().__init__(type_)
+        self._members: tuple[Validator, ...] = members
+        self.lazy = any(member.lazy for member in members)
+        self.immutable = all(member.immutable for member in members)
+        self.flat = all(member.flat for member in members)
+        self._any: bool = False
+        leaves: set[type] = set()
+        dispatch: dict[type, list[Validator]] = {}
+        fallbacks: list[Validator] = []
+
+        for member in members:
+            if isinstance(member, AnyValidator):
+                self._any = True
+            elif type(member) is ClassValidator:
+                leaves.add(member._origin)
+            elif isinstance(member, ClassValidator):
+                dispatch.setdefault(member._origin, []).append(member)
+            else:
+                fallbacks.append(member)
+
+        self._leaves: frozenset[type] = frozenset(leaves | {NoneType})
+        self._dispatch: dict[type, tuple[Validator, ...]] = {
+            origin: tuple(validators)
+            for origin, validators in dispatch.items()
+        }
+        self._fallbacks: tuple[Validator, ...] = tuple(fallbacks)
+
+    def check(self, value: Any) -> bool:
+        if self._any:
+            return True
+
+        type_: type = type(value)
+
+        if type_ in self._leaves:
+            return True
+
+        for member in self._members_of(type_):
+            if member.check(value):
+                return True
+
+        for member in self._fallbacks:
+            if member.check(value):
+                return True
+
+        return False
+
+    def check_many(self, values: abc.Iterable[Any]) -> bool:
+        if self._any:
+            return True
+
+        if not isinstance(values, abc.Collection):
+            values = list(values)
+
+        return set(map(type, values)) <= self._leaves or (
+            bool(self._dispatch or self._fallbacks)
+            and all(map(self.check, values))
+        )
+
+    def validate_origin(self, value: Any) -> None:
+        if not self.check(value):
+            raise self._mismatch(value)
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        # A single candidate member gives the path of the mismatching
+        # items, several candidates can't tell which one was meant.
+        candidates: tuple[Validator, ...] = self._members_of(type(value))
+
+        if len(candidates) == 1 and not self._fallbacks:
+            candidates[0].collect(value, path, result)
+        else:
+            result.add(path, self._type, value)
+
+    def candidates(self, value: Any) -> tuple[Validator, ...] | None:
+        '''Get the members which may accept the value.
+
+        Args:
+            value (Any): The value to analyze.
+
+        Returns:
+            tuple[Validator, ...] | None: The candidate members, None if
+                the value is accepted by a plain member.
+        '''
+
+        if self._any or type(value) in self._leaves:
+            return None
+
+        return self._members_of(type(value)) + self._fallbacks
+
+    def _members_of(self, type_: type) -> tuple[Validator, ...]:
+        '''Get the generic members validators of a value type.
+        The checked containers (see `containers`) are dispatched on
+        their builtin container class.
+
+        Args:
+            type_ (type): The value type.
+
+        Returns:
+            tuple[Validator, ...]: The generic members validators.
+        '''
+
+        return self._dispatch.get(type_) or self._dispatch.get(
+            _checked_origin(type_),
+            (),
+        )
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        for member in self._members:
+            if member.lazy and member.check(value):
+                return member.wrap(value, label, report)
+
+        return value
+
+
+class ContainerValidator(ClassValidator):
+    '''The validator base class of the containers typings.
+
+    Attributes:
+        _sample (Sample | None): The sampling policy of the container
+            items. All the items are checked if None.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        origin: type,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            origin (type): The expected container class.
+            sample (Optional, Sample | None): The sampling policy of the
+                container items. Default to None.
+        '''
+
+        super().__init__(type_, origin)
+        self._sample: Sample | None = sample
+
+    # The containers are not leaves, their items must be checked.
+    check_many = Validator.check_many
+    flat: ClassVar[bool] = False
+
+    def _checked(self, value: Any) -> bool:
+        '''Tell if the value is a checked container (see `containers`)
+        matching with the typing. A checked container of the same
+        typing is accepted as is, its items were validated when they
+        were inserted.
+
+        Args:
+            value (Any): The value to analyze.
+
+        Returns:
+            bool: True if the value is a matching checked container,
+                False otherwise.
+        '''
+
+        checked: TypeVar | None = getattr(type(value), '__checked__', None)
+
+        if checked is None or get_origin(checked) is not self._origin:
+            return False
+
+        # The same typing may be spelled differently (List[int]), the
+        # items are then checked as those of a plain container.
+        return checked == self._type or self.check(self._origin(value))
+
+    def _select(self, items: abc.Collection[Any]) -> abc.Iterable[Any]:
+        '''Select the items to check according to the sampling policy.
+
+        Args:
+            items (abc.Collection[Any]): The container items.
+
+        Returns:
+            abc.Iterable[Any]: The items to check.
+        '''
+
+        if self._sample:
+            return self._sample.select(items)
+
+        return items
+
+    def _collect_items(
+        self,
+        items: abc.Iterable[tuple[str, Validator, Any]],
+        result: ValidationResult,
+    ) -> None:
+        '''Collect the mismatches of the container items, until the
+        result is full.
+
+        Args:
+            items (abc.Iterable[tuple[str, Validator, Any]]): The path,
+                validator and value of each item.
+            result (ValidationResult): The result collecting the
+                mismatches.
+        '''
+
+        for path, validator, item in items:
+            if result.full:
+                result.truncated = True
+                return
+
+            validator.collect(item, path, result)
+
+    def _expand_items(
+        self,
+        validator: Validator,
+        items: abc.Iterable[Any],
+    ) -> abc.Iterable[tuple[Validator, Any]]:
+        '''Get the container items to check next by the iterative
+        engine. The flat items are checked at once, and only the first
+        mismatching one is returned.
+
+        Args:
+            validator (Validator): The items validator.
+            items (abc.Iterable[Any]): The items.
+
+        Returns:
+            abc.Iterable[tuple[Validator, Any]]: The validator and value
+                of each item to check next.
+        '''
+
+        if not validator.flat:
+            return zip(repeat(validator), items)
+
+        if not isinstance(items, abc.Collection):
+            items = list(items)
+
+        if validator.check_many(items):
+            return ()
+
+        for item in items:
+            if not validator.check(item):
+                return ((validator, item),)
+
+        return ()
+
+
+class ListValidator(ContainerValidator):
+    '''The validator of the list typings.
+    Example:
+        - list[int]
+
+    Attributes:
+        _item (Validator): The list items validator.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        item: Validator,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            item (Validator): The list items validator.
+            sample (Optional, Sample | None): The sampling policy of the
+                list items. Default to None.
+        '''
+
+        super().__init__(type_, list, sample)
+        self._item: Validator = item
+
+    def check(self, value: Any) -> bool:
+        return (
+            value is None
+            or (
+                type(value) is self._origin
+                and self._item.check_many(self._select(value))
+            )
+            or self._checked(value)
+        )
+
+    def validate_items(self, value: Any) -> None:
+        validate: abc.Callable[[Any], None] = self._item.validate
+
+        for item in value:
+            validate(item)
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if type(value) is not self._origin:
+            result.add(path, self._type, value)
+            return
+
+        self._collect_items(
+            (
+                (self._path(path, index, item), self._item, item)
+                for index, item in enumerate(value)
+            ),
+            result,
+        )
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None:
+            return ()
+
+        if type(value) is not self._origin:
+            return () if self._checked(value) else None
+
+        return self._expand_items(self._item, self._select(value))
+
+    def _path(self, path: str, index: int, item: Any) -> str:
+        '''Get the path of an item.
+
+        Args:
+            path (str): The path of the container.
+            index (int): The item index.
+            item (Any): The item.
+
+        Returns:
+            str: The item path.
+        '''
+
+        return f'{path}[{index}]'
+
+
+class SetValidator(ListValidator):
+    '''The validator of the set typings.
+    Example:
+        - set[int]
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        item: Validator,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            item (Validator): The set items validator.
+            sample (Optional, Sample | None): The sampling policy of the
+                set items. Default to None.
+        '''
+
+        super().__init__(type_, item, sample)
+        self._origin = set
+        self._accepted = frozenset((set, NoneType))
+
+    def _path(self, path: str, index: int, item: Any) -> str:
+        return f'{path}{{{item!r}}}'
+
+
+class TupleValidator(ContainerValidator):
+    '''The validator of the tuple typings.
+    Example:
+        - tuple[int, str]
+        - tuple[int, ...]: a tuple of any size
+
+    Attributes:
+        _items (tuple[Validator, ...]): The validators of each tuple
+            position.
+        _variadic (Validator | None): The validator of all the tuple
+            items when the tuple size is not fixed.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        items: tuple[Validator, ...],
+        variadic: Validator | None = None,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            items (tuple[Validator, ...]): The validators of each
+                tuple position.
+            variadic (Optional, Validator | None): The validator of all
+                the tuple items when the size is not fixed.
+                Default to None.
+            sample (Optional, Sample | None): The sampling policy of the
+                items of the tuples which size is not fixed.
+                Default to None.
+        '''
+
+        super().__init__(type_, tuple, sample)
+        self._items: tuple[Validator, ...] = items
+        self._variadic: Validator | None = variadic
+        self.immutable = all(
+            validator.immutable
+            for validator in (*items, variadic)
+            if validator
+        )
+
+    def check(self, value: Any) -> bool:
+        if value is None:
+            return True
+
+        if type(value) is not tuple:
+            return False
+
+        if self._variadic:
+            return self._variadic.check_many(self._select(value))
+
+        return len(self._items) == len(value) and all(
+            validator.check(item)
+            for validator, item in zip(self._items, value)
+        )
+
+    def check_many(self, values: abc.Iterable[Any]) -> bool:
+        if not isinstance(values, abc.Collection):
+            values = list(values)
+
+        if self._sample or not set(map(type, values)) <= _TUPLE_ROWS:
+            return all(map(self.check, values))
+
+        # A batch of records (list[tuple[int, str]]...) is checked by
+        # column: all the items of a position at once.
+        rows: list[tuple[Any, ...]] = [
+            row for row in values if row is not None
+        ]
+
+        if self._variadic:
+            return self._variadic.check_many(chain.from_iterable(rows))
+
+        if set(map(len, rows)) - {len(self._items)}:
+            return False
+
+        return all(
+            validator.check_many(column)
+            for validator, column in zip(self._items, zip(*rows))
+        )
+
+    def validate_items(self, value: Any) -> None:
+        if self._variadic:
+            for item in value:
+                self._variadic.validate(item)
+
+            return
+
+        if len(self._items) != len(value):
+            raise TypeError('Tuple sizes doesn\'t matches.')
+
+        for validator, item in zip(self._items, value):
+            validator.validate(item)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None:
+            return ()
+
+        if type(value) is not tuple:
+            return None
+
+        if self._variadic:
+            return self._expand_items(self._variadic, self._select(value))
+
+        if len(self._items) != len(value):
+            return None
+
+        return zip(self._items, value)
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if type(value) is not tuple:
+            result.add(path, self._type, value)
+        elif self._variadic:
+            self._collect_items(
+                (
+                    (f'{path}[{index}]', self._variadic, item)
+                    for index, item in enumerate(value)
+                ),
+                result,
+            )
+        elif len(self._items) != len(value):
+            result.add(
+                path,
+                self._type,
+                value,
+                f'Expected {self._type}. Tuple sizes doesn\'t matches.',
+            )
+        else:
+            self._collect_items(
+                (
+                    (f'{path}[{index}]', validator, item)
+                    for index, (validator, item) in enumerate(
+                        zip(self._items, value)
+                    )
+                ),
+                result,
+            )
+
+
+class DictValidator(ContainerValidator):
+    '''The validator of the dict typings.
+    Example:
+        - dict[str, Any]
+
+    Attributes:
+        _key (Validator): The dict keys validator.
+        _val (Validator): The dict values validator.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        key: Validator,
+        val: Validator,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            key (Validator): The dict keys validator.
+            val (Validator): The dict values validator.
+            sample (Optional, Sample | None): The sampling policy of the
+                dict keys and values. Default to None.
+        '''
+
+        super().__init__(type_, dict, sample)
+        self._key: Validator = key
+        self._val: Validator = val
+
+    def check(self, value: Any) -> bool:
+        return (
+            value is None
+            or (
+                type(value) is dict
+                and self._key.check_many(self._select(value.keys()))
+                and self._val.check_many(self._select(value.values()))
+            )
+            or self._checked(value)
+        )
+
+    def check_many(self, values: abc.Iterable[Any]) -> bool:
+        if not isinstance(values, abc.Collection):
+            values = list(values)
+
+        if self._sample or not set(map(type, values)) <= _DICT_ROWS:
+            return all(map(self.check, values))
+
+        # A batch of records (list[dict[str, int]]...) is checked by
+        # column: all the keys at once, then all the values.
+        rows: list[dict[Any, Any]] = list(filter(None, values))
+        return self._key.check_many(
+            chain.from_iterable(rows)
+        ) and self._val.check_many(chain.from_iterable(map(dict.values, rows)))
+
+    def validate_items(self, value: Any) -> None:
+        validate_key: abc.Callable[[Any], None] = self._key.validate
+        validate_val: abc.Callable[[Any], None] = self._val.validate
+
+        for key, val in value.items():
+            validate_key(key)
+            validate_val(val)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None:
+            return ()
+
+        if type(value) is not dict:
+            return () if self._checked(value) else None
+
+        return chain(
+            self._expand_items(self._key, self._select(value.keys())),
+            self._expand_items(self._val, self._select(value.values())),
+        )
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if type(value) is not dict:
+            result.add(path, self._type, value)
+            return
+
+        def items() -> abc.Iterator[tuple[str, Validator, Any]]:
+            for key, val in value.items():
+                item_path: str = f'{path}[{key!r}]'
+                yield f'{item_path} (key)', self._key, key
+                yield item_path, self._val, val
+
+        self._collect_items(items(), result)
+
+
+class StructValidator(ContainerValidator):
+    '''The validator base class of the classes with annotated fields.
+    The fields plan (the validator of each field) is built once by
+    class, on first use, so the type hints are never resolved on the
+    hot path and the recursive classes can refer to themselves.
+
+    Attributes:
+        _fields (tuple[tuple[str, Validator], ...] | None): The name
+            and validator of each field, None until built.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        origin: type,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            origin (type): The expected class.
+            sample (Optional, Sample | None): The sampling policy of the
+                fields containers items. Default to None.
+        '''
+
+        super().__init__(type_, origin, sample)
+        self._fields: tuple[tuple[str, Validator], ...] | None = None
+
+    def _plan(self) -> tuple[tuple[str, Validator], ...]:
+        '''Get the fields plan, built on first call.
+
+        Raises:
+            TypeError: If a field typing is malformed.
+
+        Returns:
+            tuple[tuple[str, Validator], ...]: The name and validator of
+                each field.
+        '''
+
+        if self._fields is None:
+            try:
+                hints: dict[str, Any] = get_type_hints(
+                    self._struct(),
+                    include_extras=True,
+                )
+            except NameError as e:
+                raise TypeError(f'Unresolved typing in {self._type}. {e}')
+
+            self._fields = tuple(
+                (
+                    name,
+                    compile_type(
+                        _unqualified(hints.get(name, Any)),
+                        self._sample,
+                    ),
+                )
+                for name in self._names()
+            )
+
+        return self._fields
+
+    def _struct(self) -> type:
+        '''Get the class declaring the fields.
+
+        Returns:
+            type: The class.
+        '''
+
+        return self._origin
+
+    def _names(self) -> abc.Iterable[str]:
+        '''Get the fields names.
+
+        Returns:
+            abc.Iterable[str]: The fields names.
+        '''
+
+        raise NotImplementedError
+
+    def validate_items(self, value: Any) -> None:
+        for name, validator in self._plan():
+            validator.validate(getattr(value, name))
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None:
+            return ()
+
+        if type(value) is not self._origin:
+            return None
+
+        children: list[tuple[Validator, Any]] = []
+
+        # The flat fields are checked at once, so only the nested ones
+        # are left to the walker.
+        for name, validator in self._fields or self._plan():
+            item: Any = getattr(value, name)
+
+            if not validator.flat:
+                children.append((validator, item))
+            elif not validator.check(item):
+                return ((validator, item),)
+
+        return children
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if type(value) is not self._origin:
+            result.add(path, self._type, value)
+            return
+
+        self._collect_items(
+            (
+                (f'{path}.{name}', validator, getattr(value, name))
+                for name, validator in self._plan()
+            ),
+            result,
+        )
+
+
+class DataclassValidator(StructValidator):
+    '''The validator of the dataclasses.
+    Each field value is checked against the field annotation.
+    Example:
+        - @dataclass class Point: x: int; y: int
+    '''
+
+    def _names(self) -> abc.Iterable[str]:
+        return (field.name for field in dataclasses.fields(self._origin))
+
+    def check(self, value: Any) -> bool:
+        if value is None:
+            return True
+
+        if type(value) is not self._origin:
+            return False
+
+        for name, validator in self._fields or self._plan():
+            if not validator.check(getattr(value, name)):
+                return False
+
+        return True
+
+
+class NamedTupleValidator(StructValidator):
+    '''The validator of the typed named tuples.
+    Each item is checked against its field annotation.
+    Example:
+        - class Point(NamedTuple): x: int; y: int
+    '''
+
+    def _names(self) -> abc.Iterable[str]:
+        return self._origin._fields
+
+    def check(self, value: Any) -> bool:
+        if value is None:
+            return True
+
+        if type(value) is not self._origin:
+            return False
+
+        for (_, validator), item in zip(self._fields or self._plan(), value):
+            if not validator.check(item):
+                return False
+
+        return True
+
+
+class TypedDictValidator(StructValidator):
+    '''The validator of the typed dicts.
+    The required keys must be given, the optional keys may be missing
+    and no other key is accepted. Each value is checked against its key
+    annotation.
+    Example:
+        - class Movie(TypedDict): title: str; year: NotRequired[int]
+
+    Attributes:
+        _struct_type (type): The typed dict class.
+        _required (frozenset[str]): The required keys.
+        _keys (frozenset[str]): All the keys.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        struct: type,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            struct (type): The typed dict class.
+            sample (Optional, Sample | None): The sampling policy of the
+                values containers items. Default to None.
+        '''
+
+        super().__init__(type_, dict, sample)
+        self._struct_type: type = struct
+        self._required: frozenset[str] = struct.__required_keys__
+        self._keys: frozenset[str] = (
+            struct.__required_keys__ | struct.__optional_keys__
+        )
+
+    def _struct(self) -> type:
+        return self._struct_type
+
+    def _names(self) -> abc.Iterable[str]:
+        return (
+            name
+            for name in self._struct_type.__annotations__
+            if name in self._keys
+        )
+
+    def check(self, value: Any) -> bool:
+        if value is None:
+            return True
+
+        if type(value) is not dict or not (
+            self._required <= value.keys() <= self._keys
+        ):
+            return False
+
+        for name, validator in self._fields or self._plan():
+            if name in value and not validator.check(value[name]):
+                return False
+
+        return True
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None:
+            return ()
+
+        if type(value) is not dict or not (
+            self._required <= value.keys() <= self._keys
+        ):
+            return None
+
+        children: list[tuple[Validator, Any]] = []
+
+        for name, validator in self._fields or self._plan():
+            if name not in value:
+                continue
+            elif not validator.flat:
+                children.append((validator, value[name]))
+            elif not validator.check(value[name]):
+                return ((validator, value[name]),)
+
+        return children
+
+    def validate_items(self, value: Any) -> None:
+        error: str | None = self._keys_error(value)
+
+        if error:
+            raise TypeError(error)
+
+        for name, validator in self._plan():
+            if name in value:
+                validator.validate(value[name])
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if type(value) is not dict:
+            result.add(path, self._type, value)
+            return
+
+        error: str | None = self._keys_error(value)
+
+        if error:
+            result.add(path, self._type, value, error)
+
+        self._collect_items(
+            (
+                (f'{path}[{name!r}]', validator, value[name])
+                for name, validator in self._plan()
+                if name in value
+            ),
+            result,
+        )
+
+    def _keys_error(self, value: dict[str, Any]) -> str | None:
+        '''Get the error of the missing or unexpected keys.
+
+        Args:
+            value (dict[str, Any]): The value.
+
+        Returns:
+            str | None: The error message, None if the keys match.
+        '''
+
+        missing: set[str] = self._required - value.keys()
+
+        if missing:
+            return f'Expected {self._type}. Missing keys {sorted(missing)}.'
+
+        unexpected: list[Any] = [key for key in value if key not in self._keys]
+
+        if unexpected:
+            return f'Expected {self._type}. Unexpected keys {unexpected}.'
+
+        return None
+
+
+class IteratorValidator(Validator):
+    '''The validator of the iterator typings.
+    An iterator can't be controlled without consuming it, so only its
+    type is checked by `validate` and its items are controlled while
+    consumed through the proxy returned by `wrap`.
+    Example:
+        - Iterator[int]
+
+    Attributes:
+        _origin (type): The expected abstract class.
+        _item (Validator): The items validator.
+    '''
+
+    lazy: ClassVar[bool] = True
+    flat: ClassVar[bool] = True
+
+    def __init__(self, type_: TypeVar, origin: type, item: Validator) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            origin (type): The expected abstract class.
+            item (Validator): The items validator.
+        '''
+
+        super().__init__(type_)
+        self._origin: type = origin
+        self._item: Validator = item
+
+    def check(self, value: Any) -> bool:
+        return value is None or is_instance(value, self._origin)
+
+    def validate_origin(self, value: Any) -> None:
+        if not is_instance(value, self._origin):
+            raise self._mismatch(value)
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        if value is None:
+            return value
+
+        return IteratorProxy(value, self._item, label, report)
+
+
+class IterableValidator(IteratorValidator):
+    '''The validator of the iterable typings.
+    The items of the collections (list, tuple, dict keys...) are
+    controlled at once, the other iterables are wrapped into a proxy.
+    Example:
+        - Iterable[int]
+
+    Attributes:
+        _sample (Sample | None): The sampling policy of the collections
+            items.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        item: Validator,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            item (Validator): The items validator.
+            sample (Optional, Sample | None): The sampling policy of the
+                collections items. Default to None.
+        '''
+
+        super().__init__(type_, abc.Iterable, item)
+        self._sample: Sample | None = sample
+        self.flat = item.flat
+
+    _select = ContainerValidator._select
+    _collect_items = ContainerValidator._collect_items
+    _expand_items = ContainerValidator._expand_items
+
+    def check(self, value: Any) -> bool:
+        if value is None or is_instance(value, abc.Iterator):
+            return True
+
+        if is_instance(value, abc.Collection):
+            return self._item.check_many(self._select(value))
+
+        return is_instance(value, abc.Iterable)
+
+    def validate_items(self, value: Any) -> None:
+        if is_instance(value, abc.Collection):
+            for item in value:
+                self._item.validate(item)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None or is_instance(value, abc.Iterator):
+            return ()
+
+        if is_instance(value, abc.Collection):
+            return self._expand_items(self._item, self._select(value))
+
+        return () if is_instance(value, abc.Iterable) else None
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if not is_instance(value, abc.Collection):
+            result.add(path, self._type, value)
+            return
+
+        self._collect_items(
+            (
+                (f'{path}[{index}]', self._item, item)
+                for index, item in enumerate(value)
+            ),
+            result,
+        )
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        if is_instance(value, abc.Iterator):
+            return IteratorProxy(value, self._item, label, report)
+
+        if value is None or is_instance(value, abc.Collection):
+            return value
+
+        return IterableProxy(value, self._item, label, report)
+
+
+class GeneratorValidator(IteratorValidator):
+    '''The validator of the generator typings.
+    The yielded, sent and returned values are controlled while the
+    generator runs.
+    Example:
+        - Generator[int, str, bool]
+
+    Attributes:
+        _send (Validator): The sent values validator.
+        _return (Validator): The return value validator.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        item: Validator,
+        send: Validator,
+        return_: Validator,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            item (Validator): The yielded values validator.
+            send (Validator): The sent values validator.
+            return_ (Validator): The return value validator.
+        '''
+
+        super().__init__(type_, abc.Generator, item)
+        self._send: Validator = send
+        self._return: Validator = return_
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        if value is None:
+            return value
+
+        return GeneratorProxy(
+            value,
+            self._item,
+            self._send,
+            self._return,
+            label,
+            report,
+        )
+
+
+class AsyncIteratorValidator(IteratorValidator):
+    '''The validator of the asynchronous iterator typings.
+    Example:
+        - AsyncIterator[int]
+    '''
+
+    def __init__(self, type_: TypeVar, item: Validator) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            item (Validator): The items validator.
+        '''
+
+        super().__init__(type_, abc.AsyncIterator, item)
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        if value is None:
+            return value
+
+        return AsyncIteratorProxy(value, self._item, label, report)
+
+
+class AsyncIterableValidator(IteratorValidator):
+    '''The validator of the asynchronous iterable typings.
+    Example:
+        - AsyncIterable[int]
+    '''
+
+    def __init__(self, type_: TypeVar, item: Validator) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            item (Validator): The items validator.
+        '''
+
+        super().__init__(type_, abc.AsyncIterable, item)
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        if value is None:
+            return value
+        elif is_instance(value, abc.AsyncIterator):
+            return AsyncIteratorProxy(value, self._item, label, report)
+
+        return AsyncIterableProxy(value, self._item, label, report)
+
+
+class AsyncGeneratorValidator(IteratorValidator):
+    '''The validator of the asynchronous generator typings.
+    The yielded and sent values are controlled while the generator
+    runs.
+    Example:
+        - AsyncGenerator[int, str]
+
+    Attributes:
+        _send (Validator): The sent values validator.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        item: Validator,
+        send: Validator,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            item (Validator): The yielded values validator.
+            send (Validator): The sent values validator.
+        '''
+
+        super().__init__(type_, abc.AsyncGenerator, item)
+        self._send: Validator = send
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        if value is None:
+            return value
+
+        return AsyncGeneratorProxy(
+            value,
+            self._item,
+            self._send,
+            label,
+            report,
+        )
+
+
+class CollectionValidator(Validator):
+    '''The validator of the abstract collection typings.
+    Any instance of the abstract class is accepted (a tuple or a deque
+    for a Sequence, a frozenset for a Set...), found with a cached
+    isinstance lookup (see `is_instance`).
+    Example:
+        - Collection[int]
+        - AbstractSet[str]
+
+    Attributes:
+        _origin (type): The expected abstract class.
+        _item (Validator): The items validator.
+        _sample (Sample | None): The sampling policy of the items.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        origin: type,
+        item: Validator,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            origin (type): The expected abstract class.
+            item (Validator): The items validator.
+            sample (Optional, Sample | None): The sampling policy of the
+                items. Default to None.
+        '''
+
+        super().__init__(type_)
+        self._origin: type = origin
+        self._item: Validator = item
+        self._sample: Sample | None = sample
+        self.flat = item.flat
+
+    _select = ContainerValidator._select
+    _collect_items = ContainerValidator._collect_items
+    _expand_items = ContainerValidator._expand_items
+
+    def check(self, value: Any) -> bool:
+        return value is None or (
+            is_instance(value, self._origin)
+            and self._item.check_many(self._items(value))
+        )
+
+    def validate_origin(self, value: Any) -> None:
+        if not is_instance(value, self._origin):
+            raise self._mismatch(value)
+
+    def validate_items(self, value: Any) -> None:
+        validate: abc.Callable[[Any], None] = self._item.validate
+
+        for item in value:
+            validate(item)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None:
+            return ()
+
+        if not is_instance(value, self._origin):
+            return None
+
+        return self._expand_items(self._item, self._items(value))
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if not is_instance(value, self._origin):
+            result.add(path, self._type, value)
+            return
+
+        self._collect_items(
+            (
+                (f'{path}[{index}]', self._item, item)
+                for index, item in enumerate(value)
+            ),
+            result,
+        )
+
+    def _items(self, value: abc.Collection[Any]) -> abc.Iterable[Any]:
+        '''Get the items to check, according to the sampling policy.
+
+        Args:
+            value (abc.Collection[Any]): The collection.
+
+        Returns:
+            abc.Iterable[Any]: The items to check.
+        '''
+
+        return self._select(value)
+
+
+class SequenceValidator(CollectionValidator):
+    '''The validator of the abstract sequence typings.
+    The sampled items are picked by index, the sequences may not
+    support slicing.
+    Example:
+        - Sequence[int]
+        - MutableSequence[str]
+    '''
+
+    def _items(self, value: abc.Sequence[Any]) -> abc.Iterable[Any]:
+        if self._sample:
+            return map(
+                value.__getitem__,
+                self._sample.select(range(len(value))),
+            )
+
+        return value
+
+
+class MappingValidator(Validator):
+    '''The validator of the abstract mapping typings.
+    Any instance of the abstract class is accepted (a custom mapping,
+    a MappingProxyType...), found with a cached isinstance lookup (see
+    `is_instance`).
+    Example:
+        - Mapping[str, Any]
+        - MutableMapping[str, int]
+
+    Attributes:
+        _origin (type): The expected abstract class.
+        _key (Validator): The mapping keys validator.
+        _val (Validator): The mapping values validator.
+        _sample (Sample | None): The sampling policy of the keys and
+            values.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        origin: type,
+        key: Validator,
+        val: Validator,
+        sample: Sample | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            origin (type): The expected abstract class.
+            key (Validator): The mapping keys validator.
+            val (Validator): The mapping values validator.
+            sample (Optional, Sample | None): The sampling policy of the
+                keys and values. Default to None.
+        '''
+
+        super().__init__(type_)
+        self._origin: type = origin
+        self._key: Validator = key
+        self._val: Validator = val
+        self._sample: Sample | None = sample
+        self.flat = key.flat and val.flat
+
+    _select = ContainerValidator._select
+    _collect_items = ContainerValidator._collect_items
+    _expand_items = ContainerValidator._expand_items
+
+    def check(self, value: Any) -> bool:
+        return value is None or (
+            is_instance(value, self._origin)
+            and self._key.check_many(self._select(value.keys()))
+            and self._val.check_many(self._select(value.values()))
+        )
+
+    def validate_origin(self, value: Any) -> None:
+        if not is_instance(value, self._origin):
+            raise self._mismatch(value)
+
+    def validate_items(self, value: Any) -> None:
+        validate_key: abc.Callable[[Any], None] = self._key.validate
+        validate_val: abc.Callable[[Any], None] = self._val.validate
+
+        for key, val in value.items():
+            validate_key(key)
+            validate_val(val)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None:
+            return ()
+
+        if not is_instance(value, self._origin):
+            return None
+
+        return chain(
+            self._expand_items(self._key, self._select(value.keys())),
+            self._expand_items(self._val, self._select(value.values())),
+        )
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if not is_instance(value, self._origin):
+            result.add(path, self._type, value)
+            return
+
+        def items() -> abc.Iterator[tuple[str, Validator, Any]]:
+            for key, val in value.items():
+                item_path: str = f'{path}[{key!r}]'
+                yield f'{item_path} (key)', self._key, key
+                yield item_path, self._val, val
+
+        self._collect_items(items(), result)
+
+
+class ConstrainedValidator(Validator):
+    '''The validator of the annotated typings with constraints.
+    The value is checked against the annotated type, then against each
+    constraint, from the value metadata only.
+    Example:
+        - Annotated[np.ndarray, Dtype('float64'), Shape(None, 3)]
+        - Annotated[array.array, Typecode('d')]
+        - npt.NDArray[np.float64]: the dtype is a constraint
+
+    Attributes:
+        _base (Validator): The annotated type validator.
+        _constraints (tuple[Constraint, ...]): The constraints.
+    '''
+
+    def __init__(
+        self,
+        type_: TypeVar,
+        base: Validator,
+        constraints: tuple[Constraint, ...],
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            type_ (TypeVar): The type tree.
+            base (Validator): The annotated type validator.
+            constraints (tuple[Constraint, ...]): The constraints.
+        '''
+
+        super().__init__(type_)
+        self._base: Validator = base
+        self._constraints: tuple[Constraint, ...] = constraints
+        self.lazy = base.lazy
+        self.flat = base.flat
+
+    def check(self, value: Any) -> bool:
+        return value is None or (
+            self._base.check(value)
+            and all(
+                constraint.check(value) for constraint in self._constraints
+            )
+        )
+
+    def validate_origin(self, value: Any) -> None:
+        self._base.validate(value)
+
+        for constraint in self._constraints:
+            if not constraint.check(value):
+                raise TypeError(
+                    f'Expected {self._type}. '
+                    f'Mismatch on {constraint.describe(value)}'
+                )
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        if self.check(value):
+            return
+
+        if not self._base.check(value):
+            self._base.collect(value, path, result)
+            return
+
+        for constraint in self._constraints:
+            if not constraint.check(value):
+                result.add(
+                    path,
+                    self._type,
+                    value,
+                    f'Expected {self._type}. '
+                    f'Mismatch on {constraint.describe(value)}',
+                )
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        if value is None:
+            return ()
+
+        for constraint in self._constraints:
+            if not constraint.check(value):
+                return None
+
+        return ((self._base, value),)
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        return self._base.wrap(value, label, report)
+
+
+_CACHE: dict[TypeVar, Validator] = {}
+
+# The isinstance results of the abstract classes, by abstract class and
+# value type. Cleared when full, the types created at runtime (classes
+# built by a factory...) must not grow it forever nor be kept alive.
+_INSTANCES: dict[tuple[type, type], bool] = {}
+_MAX_INSTANCES: int = 4096
+
+# The abstract collections classes, by kind.
+_SEQUENCES: frozenset[type] = frozenset((abc.Sequence, abc.MutableSequence))
+_COLLECTIONS: frozenset[type] = frozenset(
+    (abc.Collection, abc.Set, abc.MutableSet, abc.KeysView, abc.ValuesView)
+)
+_MAPPINGS: frozenset[type] = frozenset((abc.Mapping, abc.MutableMapping))
+
+# The value types of the records batches checked by column.
+_DICT_ROWS: frozenset[type] = frozenset((dict, NoneType))
+_TUPLE_ROWS: frozenset[type] = frozenset((tuple, NoneType))
+
+# The classes which instances can't change.
+_IMMUTABLES: frozenset[type] = frozenset(
+    (NoneType, bool, int, float, complex, str, bytes, range)
+)
+
+
+def get_origin(type_: TypeVar) -> TypeVar:
+    '''Get the original typing class.
+
+    Args:
+        type_ (TypeVar): The typing var.
+
+    Returns:
+        TypeVar: The original typing class.
+    '''
+
+    if hasattr(type_, '__origin__'):
+        return type_.__origin__
+
+    return type_
+
+
+def is_instance(value: Any, cls: type) -> bool:
+    '''Tell if a value is an instance of an abstract class.
+    The abstract classes checks (`ABCMeta.__instancecheck__`) are slow,
+    their result only depends on the value type, so it is cached by
+    abstract class and value type: the check is one dict lookup once
+    the type was seen. The classes registered on an abstract class
+    (`ABCMeta.register`) after a lookup of its instances are not seen.
+    The cache is cleared once it holds `_MAX_INSTANCES` results.
+
+    Args:
+        value (Any): The value.
+        cls (type): The abstract class.
+
+    Returns:
+        bool: True if the value is an instance of the class, False
+            otherwise.
+    '''
+
+    key: tuple[type, type] = (cls, type(value))
+
+    try:
+        return _INSTANCES[key]
+    except KeyError:
+        if len(_INSTANCES) >= _MAX_INSTANCES:
+            _INSTANCES.clear()
+
+        _INSTANCES[key] = isinstance(value, cls)
+        return _INSTANCES[key]
+
+
+def _checked_origin(type_: type) -> type | None:
+    '''Get the builtin container class of a checked container class
+    (see `containers`).
+
+    Args:
+        type_ (type): The class.
+
+    Returns:
+        type | None: The builtin container class, None if the class is
+            not a checked container.
+    '''
+
+    checked: TypeVar | None = getattr(type_, '__checked__', None)
+    return None if checked is None else get_origin(checked)
+
+
+def _unqualified(type_: TypeVar) -> TypeVar:
+    '''Remove the Required and NotRequired qualifiers of a typed dict
+    key typing.
+
+    Args:
+        type_ (TypeVar): The key typing.
+
+    Returns:
+        TypeVar: The typing.
+    '''
+
+    while getattr(type_, '__origin__', None) in (Required, NotRequired):
+        type_ = type_.__args__[0]
+
+    return type_
+
+
+def compile_type(type_: TypeVar, sample: Sample | None = None) -> Validator:
+    '''Get the validator of a typing tree.
+    The validators are cached by annotation and sampling policy, so
+    every function sharing an annotation shares the same validator.
+
+    Args:
+        type_ (TypeVar): The typing tree.
+        sample (Optional, Sample | None): The sampling policy of the
+            containers items. Default to None.
+
+    Raises:
+        TypeError: If the typing tree is malformed.
+
+    Returns:
+        Validator: The compiled validator.
+    '''
+
+    key: Any = (type_, sample) if sample else type_
+
+    try:
+        return _CACHE[key]
+    except KeyError:
+        validator: Validator = _compile(type_, sample)
+        _CACHE[key] = validator
+        return validator
+    except TypeError:
+        # Unhashable annotations can't be cached.
+        return _compile(type_, sample)
+
+
+def _compile(type_: TypeVar, sample: Sample | None) -> Validator:
+    '''Build the validator of a typing tree.
+
+    Args:
+        type_ (TypeVar): The typing tree.
+        sample (Sample | None): The sampling policy of the containers
+            items.
+
+    Raises:
+        TypeError: If the typing tree is malformed.
+
+    Returns:
+        Validator: The compiled validator.
+    '''
+
+    def sub(*types: TypeVar) -> tuple[Validator, ...]:
+        return tuple(compile_type(subtype, sample) for subtype in types)
+
+    if hasattr(type_, '__metadata__'):
+        # Annotated[X, ...]: the metadata other than constraints are
+        # ignored.
+        base: Validator = compile_type(type_.__origin__, sample)
+        constraints: tuple[Constraint, ...] = tuple(
+            meta for meta in type_.__metadata__ if isinstance(meta, Constraint)
+        )
+
+        if not constraints:
+            return base
+
+        return ConstrainedValidator(type_, base, constraints)
+
+    origin: TypeVar = get_origin(type_)
+    args: tuple[TypeVar, ...] = getattr(type_, '__args__', None) or ()
+
+    if origin is Any or type(origin) is TypeVar:
+        return AnyValidator(type_)
+
+    if type(origin) is UnionType or origin is Union:
+        return UnionValidator(type_, sub(*args))
+
+    if origin is abc.Callable:
+        return CallableValidator(type_)
+
+    if origin is abc.Iterator:
+        return IteratorValidator(type_, origin, *sub(*args[:1] or (Any,)))
+    elif origin is abc.Iterable:
+        return IterableValidator(type_, *sub(*args[:1] or (Any,)), sample)
+    elif origin is abc.AsyncIterator:
+        return AsyncIteratorValidator(type_, *sub(*args[:1] or (Any,)))
+    elif origin is abc.AsyncIterable:
+        return AsyncIterableValidator(type_, *sub(*args[:1] or (Any,)))
+    elif origin is abc.AsyncGenerator:
+        return AsyncGeneratorValidator(type_, *sub(*args or (Any, Any)))
+    elif origin is abc.Generator:
+        return GeneratorValidator(type_, *sub(*args or (Any, Any, Any)))
+    elif origin in _SEQUENCES:
+        return SequenceValidator(type_, origin, *sub(*args or (Any,)), sample)
+    elif origin in _COLLECTIONS:
+        return CollectionValidator(
+            type_,
+            origin,
+            *sub(*args or (Any,)),
+            sample,
+        )
+    elif origin in _MAPPINGS:
+        if args and len(args) != 2:
+            raise TypeError('Missing key/val in mapping type definition.')
+
+        return MappingValidator(
+            type_,
+            origin,
+            *sub(*args or (Any, Any)),
+            sample,
+        )
+    elif origin is abc.ItemsView:
+        return CollectionValidator(
+            type_,
+            origin,
+            compile_type(tuple[args or (Any, Any)], sample),
+            sample,
+        )
+    elif isinstance(origin, type) and origin.__module__ == 'collections.abc':
+        return AbstractClassValidator(type_, origin)
+
+    if isinstance(origin, type):
+        if is_typeddict(origin):
+            return TypedDictValidator(type_, origin, sample)
+        elif dataclasses.is_dataclass(origin):
+            return DataclassValidator(type_, origin, sample)
+        elif issubclass(origin, tuple) and hasattr(origin, '_fields'):
+            return NamedTupleValidator(type_, origin, sample)
+
+    if args:
+        if origin is list:
+            return ListValidator(type_, *sub(args[0]), sample)
+        elif origin is set:
+            return SetValidator(type_, *sub(args[0]), sample)
+        elif origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return TupleValidator(type_, (), *sub(args[0]), sample)
+
+            return TupleValidator(type_, sub(*args))
+        elif origin is dict:
+            if len(args) != 2:
+                raise TypeError('Missing key/val in dict type definition.')
+
+            return DictValidator(type_, *sub(*args), sample)
+
+        dtype: Constraint | None = ndarray_dtype(origin, args)
+
+        if dtype:
+            return ConstrainedValidator(
+                type_,
+                ClassValidator(type_, origin),
+                (dtype,),
+            )
+
+    return ClassValidator(type_, origin)
@@ -0,0 +1,300 @@
+'''The iterative validation engine.
+
+The validators recurse through the value, one Python frame by nesting
+level, so a deeply nested value (a long linked list, a deep JSON
+document...) can't be validated past the recursion limit. The walker
+runs the same validators with an explicit stack instead: each validator
+checks its node with `Validator.expand` and returns the items to check
+next, so the depth of the value only costs memory.
+
+The walk may also be bounded by a `Budget`, to stop a long validation
+instead of letting a giant value add its traversal time to the call.
+'''
+
+from typing import Any, ClassVar
+from collections import abc
+import time
+from .proxy import Reporter
+from .result import ValidationResult
+from .validator import UnionValidator, Validator
+
+# The validation engines: 'auto' runs the recursive validators and
+# falls back on the walker if the value is too deep, 'iterative' always
+# runs the walker.
+ENGINES: tuple[str, ...] = ('auto', 'iterative')
+
+_Node = tuple[Validator, Any]
+
+
+class Budget:
+    '''The traversal budget of a walk: a deadline, a maximum number of
+    nodes, or both. The clock is only read every STRIDE nodes, so the
+    budget check doesn't dominate the walk cost.
+
+    Attributes:
+        exhausted (bool): Whether a walk was stopped by the budget.
+        _deadline (int | None): The deadline, in perf_counter_ns time.
+        _nodes (int | None): The number of nodes left.
+        _countdown (int): The number of nodes left before the next
+            clock read.
+        STRIDE (ClassVar[int]): The number of nodes between two clock
+            reads.
+    '''
+
+    STRIDE: ClassVar[int] = 64
+
+    def __init__(
+        self,
+        time_us: float | None = None,
+        nodes: int | None = None,
+    ) -> None:
+        '''The constructor.
+
+        Args:
+            time_us (Optional, float | None): The time budget, in
+                microseconds from now. Unbounded if None.
+                Default to None.
+            nodes (Optional, int | None): The maximum number of nodes
+                walked. Unbounded if None. Default to None.
+        '''
+
+        self.exhausted: bool = False
+        self._deadline: int | None = (
+            None
+            if time_us is None
+            else time.perf_counter_ns() + int(time_us * 1000)
+        )
+        self._nodes: int | None = nodes
+        self._countdown: int = self.STRIDE
+
+    def spend(self) -> bool:
+        '''Count a walked node.
+
+        Returns:
+            bool: True if the node can be walked, False if the budget is
+                exhausted.
+        '''
+
+        if self._nodes is not None:
+            self._nodes -= 1
+
+            if self._nodes < 0:
+                self.exhausted = True
+                return False
+
+        if self._deadline is not None:
+            self._countdown -= 1
+
+            if not self._countdown:
+                self._countdown = self.STRIDE
+
+                if time.perf_counter_ns() > self._deadline:
+                    self.exhausted = True
+                    return False
+
+        return True
+
+
+def walk(
+    validator: Validator,
+    value: Any,
+    budget: Budget | None = None,
+) -> _Node | None:
+    '''Compare a value with a validator, depth first, with an explicit
+    stack of the items to check.
+    The flat nodes (see `Validator.flat`) are checked at once, the
+    others are expanded. The unions with several candidate members for
+    a value walk each candidate in turn.
+
+    Args:
+        validator (Validator): The validator.
+        value (Any): The value to analyze.
+        budget (Optional, Budget | None): The traversal budget. The walk
+            stops as if the value matched once it is exhausted.
+            Unbounded if None. Default to None.
+
+    Returns:
+        tuple[Validator, Any] | None: The first mismatching node, None
+            if the value matches or the budget is exhausted.
+    '''
+
+    stack: list[abc.Iterator[_Node]] = [iter(((validator, value),))]
+
+    while stack:
+        node: _Node | None = next(stack[-1], None)
+
+        if node is None:
+            stack.pop()
+            continue
+
+        if budget is not None and not budget.spend():
+            return None
+
+        validator, value = node
+
+        if isinstance(validator, UnionValidator) and not validator.flat:
+            candidates: tuple[Validator, ...] | None = validator.candidates(
+                value
+            )
+
+            if candidates is None:
+                continue
+            elif len(candidates) != 1:
+                if all(walk(member, value, budget) for member in candidates):
+                    return node
+
+                continue
+
+            # The union members are never unions, the only candidate is
+            # walked in place.
+            validator = candidates[0]
+
+        if validator.flat:
+            if not validator.check(value):
+                return validator, value
+        else:
+            children: abc.Iterable[_Node] | None = validator.expand(value)
+
+            if children is None:
+                return validator, value
+
+            stack.append(iter(children))
+
+    return None
+
+
+def check(validator: Validator, value: Any) -> bool:
+    '''Tell if a value matches with a validator, with the walker.
+
+    Args:
+        validator (Validator): The validator.
+        value (Any): The value to analyze.
+
+    Returns:
+        bool: True if the value matches, False otherwise.
+    '''
+
+    return walk(validator, value) is None
+
+
+def accepts(validator: Validator, value: Any) -> bool:
+    '''Tell if a value matches with a validator, with the recursive
+    check, or the walker if the value is too deep.
+
+    Args:
+        validator (Validator): The validator.
+        value (Any): The value to analyze.
+
+    Returns:
+        bool: True if the value matches, False otherwise.
+    '''
+
+    try:
+        return validator.check(value)
+    except RecursionError:
+        return check(validator, value)
+
+
+def validate(
+    validator: Validator,
+    value: Any,
+    budget: Budget | None = None,
+) -> None:
+    '''Validate a value with the walker.
+    The error is raised by the validator of the mismatching node, so
+    the messages are the same as the recursive validation ones, except
+    for the unions: a union with a single candidate member reports the
+    mismatch found inside the member.
+
+    Args:
+        validator (Validator): The validator.
+        value (Any): The value to analyze.
+        budget (Optional, Budget | None): The traversal budget, the
+            value is only partially validated once it is exhausted.
+            Unbounded if None. Default to None.
+
+    Raises:
+        TypeError: If the value does not match.
+    '''
+
+    node: _Node | None = walk(validator, value, budget)
+
+    if node is None:
+        return
+
+    validator, value = node
+
+    # The mismatch is on the node itself, not on its items, so its
+    # validation doesn't recurse.
+    if not isinstance(validator, UnionValidator):
+        validator.validate(value)
+
+    raise validator._mismatch(value)
+
+
+def run(validator: Validator, value: Any, engine: str = 'auto') -> None:
+    '''Validate a value with the given engine.
+
+    Args:
+        validator (Validator): The validator.
+        value (Any): The value to analyze.
+        engine (Optional, str): The validation engine, see ENGINES.
+            Default to 'auto'.
+
+    Raises:
+        TypeError: If the value does not match.
+    '''
+
+    if engine == 'iterative':
+        return validate(validator, value)
+
+    try:
+        validator.validate(value)
+    except RecursionError:
+        validate(validator, value)
+
+
+class IterativeValidator(Validator):
+    '''The validator running another validator with the walker.
+
+    Attributes:
+        _validator (Validator): The walked validator.
+    '''
+
+    def __init__(self, validator: Validator) -> None:
+        '''The constructor.
+
+        Args:
+            validator (Validator): The walked validator.
+        '''
+
+        super().__init__(validator._type)
+        self._validator: Validator = validator
+        self.lazy = validator.lazy
+        self.immutable = validator.immutable
+        self.flat = validator.flat
+
+    def validate(self, value: Any) -> None:
+        validate(self._validator, value)
+
+    def check(self, value: Any) -> bool:
+        return walk(self._validator, value) is None
+
+    def collect(
+        self,
+        value: Any,
+        path: str,
+        result: ValidationResult,
+    ) -> None:
+        self._validator.collect(value, path, result)
+
+    def expand(self, value: Any) -> abc.Iterable[tuple[Validator, Any]] | None:
+        return ((self._validator, value),)
+
+    def wrap(
+        self,
+        value: Any,
+        label: str = '',
+        report: Reporter | None = None,
+    ) -> Any:
+        return self._validator.wrap(value, label, report)
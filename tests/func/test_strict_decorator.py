@@ -1,7 +1,27 @@
-from typing import Any, Callable
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+)
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import asyncio
+import gc
+import inspect
+import random
 import pytest
-from src.introspector.strict import Strict
-from src.introspector import strict
+from src.introspector.strict import Strict, warmup
+from src.introspector import codegen, config, memo, metrics, observe, strict
+from src.introspector.observe import Observation
+from src.introspector.result import ValidationError
+from src.introspector.sample import Sample
+from src.introspector.validator import compile_type
 
 
 class TestStrictClassDecorator:
@@ -190,3 +210,1071 @@ class TestStrictFunctionDecorator:
         c: str = None,
     ) -> float:
         return 3.14
+
+
+class TestStrictBindingPlan:
+    @pytest.mark.parametrize(
+        'func_name, args, kwargs, expected_ret, throwable',
+        [
+            ('_lambda_func_1', (1, 2, 3), {}, 3.14, None),
+            ('_lambda_func_1', (1, 2, 'a'), {}, None, TypeError),
+            ('_lambda_func_1', (1,), {'x': 'a', 'y': 'b'}, 3.14, None),
+            ('_lambda_func_1', (1,), {'x': 'a', 'y': 2}, None, TypeError),
+            ('_lambda_func_2', (1,), {'c': 'a'}, 3.14, None),
+            ('_lambda_func_2', (1,), {}, None, TypeError),
+            ('_lambda_func_2', (), {'a': 1, 'c': 'a'}, 3.14, None),
+            ('_lambda_func_2', (), {'a': 'b', 'c': 'a'}, None, TypeError),
+            ('_lambda_func_3', (1, 'a'), {}, 3.14, None),
+            ('_lambda_func_3', ('a', 'a'), {}, None, TypeError),
+        ],
+    )
+    def test_decorator(
+        self,
+        func_name: str,
+        args: Any,
+        kwargs: Any,
+        expected_ret: Any,
+        throwable: TypeError | None,
+    ) -> None:
+        func: Callable[[Any], Any] = getattr(self, func_name)
+
+        if throwable:
+            with pytest.raises(throwable):
+                func(*args, **kwargs)
+        else:
+            ret: Any = func(*args, **kwargs)
+            assert ret == expected_ret
+
+    @strict
+    def _lambda_func_1(self, a: int, *b: int, **c: str) -> float:
+        return 3.14
+
+    @strict
+    def _lambda_func_2(self, a: int, c: str = 5) -> float:
+        return 3.14
+
+    @strict
+    def _lambda_func_3(self, a: int, /, b: str) -> float:
+        return 3.14
+
+
+class TestStrictSample:
+    @pytest.mark.parametrize(
+        'func_name, args, throwable',
+        [
+            ('_lambda_func_1', ([1, 'a'], [1, 'a']), None),
+            ('_lambda_func_1', (['a', 1], [1, 'a']), TypeError),
+            ('_lambda_func_2', ([1, 'a'], [1, 'a']), TypeError),
+            ('_lambda_func_2', ([1, 2], [1, 'a']), None),
+            ('_lambda_func_2', ([1, 2], ['a', 1]), TypeError),
+        ],
+    )
+    def test_decorator(
+        self,
+        func_name: str,
+        args: Any,
+        throwable: TypeError | None,
+    ) -> None:
+        func: Callable[[Any], Any] = getattr(self, func_name)
+
+        if throwable:
+            with pytest.raises(throwable):
+                func(*args)
+        else:
+            func(*args)
+
+    @strict(sample=Sample.first(1))
+    def _lambda_func_1(self, a: list[int], b: list[int]) -> list[int]:
+        return [1, 'a']
+
+    @strict(sample={'b': Sample.first(1)})
+    def _lambda_func_2(self, a: list[int], b: list[int]) -> list[int]:
+        return [1]
+
+
+class TestStrictSwitch:
+    def test_disabled_at_decoration(self) -> None:
+        def func(a: int) -> int:
+            return a
+
+        try:
+            config.disable()
+            assert strict(func) is func
+            assert Strict(rate=0.5)(func) is func
+        finally:
+            config.enable()
+
+        assert strict(func) is not func
+
+    def test_disabled_at_runtime(self) -> None:
+        @strict
+        def func(a: int) -> int:
+            return a
+
+        with pytest.raises(TypeError):
+            func('a')
+
+        try:
+            config.disable()
+            assert func('a') == 'a'
+        finally:
+            config.enable()
+
+    @pytest.mark.parametrize(
+        'rate, throwable',
+        [(0, None), (1, TypeError), (0.5, None), (1.5, ValueError)],
+    )
+    def test_rate(self, rate: float, throwable: Exception | None) -> None:
+        def func(a: int) -> int:
+            return a
+
+        if throwable is ValueError:
+            with pytest.raises(ValueError):
+                strict(rate=rate)(func)
+        elif throwable:
+            with pytest.raises(throwable):
+                strict(rate=rate)(func)('a')
+        else:
+            strict(rate=rate)(func)(1)
+
+    def test_rate_fraction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        @strict(rate=0.5)
+        def func(a: int) -> int:
+            return a
+
+        monkeypatch.setattr(random, 'random', lambda: 0.7)
+        assert func('a') == 'a'
+        monkeypatch.setattr(random, 'random', lambda: 0.2)
+
+        with pytest.raises(TypeError):
+            func('a')
+
+
+class TestStrictMetrics:
+    def test_metrics(self) -> None:
+        @strict(metrics=True)
+        def func(a: int, b: str = 'b') -> int:
+            return a
+
+        name: str = f'{__name__}.{self.test_metrics.__qualname__}'
+        name += '.<locals>.func'
+
+        func(1)
+        func(2, b='c')
+
+        with pytest.raises(TypeError):
+            func(1, b=2)
+
+        with pytest.raises(TypeError):
+            func('a')
+
+        snapshot: dict = metrics.snapshot()[name]
+        assert snapshot['calls'] == 4
+        assert snapshot['sign_ns'] > 0
+        assert sum(snapshot['sign_histogram'].values()) == 4
+        assert sum(snapshot['retval_histogram'].values()) == 2
+        assert snapshot['mismatches'] == {'a': 1, 'b': 1}
+
+    def test_no_metrics(self) -> None:
+        @strict
+        def func(a: int) -> int:
+            return a
+
+        func(1)
+        assert all('no_metrics' not in name for name in metrics.snapshot())
+
+    def test_default_error(self) -> None:
+        @strict
+        def func(a: int, b: str = 2) -> int:
+            return a
+
+        with pytest.raises(TypeError, match=r'^\[func\] Arg \'b\' error'):
+            func(1)
+
+
+class TestStrictAsync:
+    @pytest.mark.parametrize(
+        'offload',
+        [False, True, ThreadPoolExecutor(max_workers=1)],
+    )
+    @pytest.mark.parametrize(
+        'args, throwable',
+        [
+            ((1, [1, 2]), None),
+            (('a', [1, 2]), TypeError),
+            ((1, [1, 'b']), TypeError),
+            ((-1, [1, 2]), TypeError),
+        ],
+    )
+    def test_decorator(
+        self,
+        offload: bool | ThreadPoolExecutor,
+        args: Any,
+        throwable: TypeError | None,
+    ) -> None:
+        @strict(offload=offload, metrics=True)
+        async def func(a: int, b: list[int]) -> int:
+            await asyncio.sleep(0)
+            return a if a >= 0 else 'negative'
+
+        assert inspect.iscoroutinefunction(func)
+
+        if throwable:
+            with pytest.raises(throwable):
+                asyncio.run(func(*args))
+        else:
+            assert asyncio.run(func(*args)) == args[0]
+
+
+class TestStrictLazy:
+    @pytest.mark.parametrize(
+        'items, throwable',
+        [([1, 2], None), ([1, 'a'], TypeError)],
+    )
+    def test_iterator_arg(
+        self,
+        items: list[Any],
+        throwable: TypeError | None,
+    ) -> None:
+        @strict
+        def func(a: Iterator[int], *, b: Iterable[int]) -> int:
+            return sum(a) + sum(b)
+
+        if throwable:
+            with pytest.raises(throwable, match='^\\[func\\] Arg \'a\''):
+                func(iter(items), b=[1])
+
+            with pytest.raises(throwable, match='^\\[func\\] Arg \'b\''):
+                func(iter([1]), b=(item for item in items))
+        else:
+            assert func(iter(items), b=iter(items)) == 6
+
+    @pytest.mark.parametrize(
+        'stop, throwable',
+        [(2, None), (3, TypeError)],
+    )
+    def test_generator_retval(
+        self,
+        stop: int,
+        throwable: TypeError | None,
+    ) -> None:
+        @strict
+        def func(stop: int) -> Generator[int, None, str]:
+            yield from range(stop)
+            return 'done' if stop < 3 else 3
+
+        if throwable:
+            with pytest.raises(throwable, match='Return value error'):
+                list(func(stop))
+        else:
+            assert list(func(stop)) == [0, 1]
+
+    @pytest.mark.parametrize(
+        'annotation',
+        [AsyncGenerator[int, None], AsyncIterable[int]],
+    )
+    def test_async_generator_retval(self, annotation: Any) -> None:
+        @strict
+        async def func(items: list[Any]) -> annotation:
+            for item in items:
+                yield item
+
+        async def consume(items: list[Any]) -> list[Any]:
+            return [item async for item in func(items)]
+
+        assert asyncio.run(consume([1, 2])) == [1, 2]
+
+        with pytest.raises(TypeError, match='Return value error'):
+            asyncio.run(consume([1, 'a']))
+
+    def test_async_iterator_retval(self) -> None:
+        @strict
+        async def func(items: list[Any]) -> AsyncIterator[int]:
+            for item in items:
+                yield item
+
+        async def consume(items: list[Any]) -> list[Any]:
+            return [item async for item in func(items)]
+
+        assert asyncio.run(consume([1, 2])) == [1, 2]
+
+        with pytest.raises(TypeError):
+            asyncio.run(consume([1, 'a']))
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    calls: list[Any] = []
+
+    for type_ in (list[dict[str, bytes]], tuple[bytes, ...]):
+        validator: Any = compile_type(type_)
+        monkeypatch.setattr(
+            validator,
+            'validate',
+            lambda value, validate=validator.validate: (
+                calls.append(value),
+                validate(value),
+            ),
+        )
+
+    return calls
+
+
+class TestStrictTrust:
+    @pytest.mark.parametrize(
+        'options, value, expected',
+        [
+            ({'frozen': ['rows']}, [{'a': b'a'}], 1),
+            ({'trust': True}, [{'a': b'a'}], 3),
+            ({}, [{'a': b'a'}], 3),
+            ({'trust': True}, (b'a', b'b'), 1),
+            ({}, (b'a', b'b'), 3),
+        ],
+    )
+    def test_chain(
+        self,
+        calls: list[Any],
+        options: dict[str, Any],
+        value: Any,
+        expected: int,
+    ) -> None:
+        type_: Any = type(value)
+        annotation: Any = (
+            list[dict[str, bytes]] if type_ is list else tuple[bytes, ...]
+        )
+
+        @strict(**options)
+        def leaf(rows: annotation) -> None:
+            pass
+
+        @strict(**options)
+        def middle(rows: annotation) -> None:
+            leaf(rows)
+
+        @strict(**options)
+        def handler(rows: annotation) -> None:
+            middle(rows)
+
+        handler(value)
+        assert len(calls) == expected
+
+    def test_scope_closed(self, calls: list[Any]) -> None:
+        @strict(frozen=['rows'])
+        def handler(rows: list[dict[str, bytes]]) -> None:
+            pass
+
+        rows: list[dict[str, bytes]] = [{'a': b'a'}]
+        handler(rows)
+        handler(rows)
+        assert len(calls) == 2
+
+    def test_other_value(self, calls: list[Any]) -> None:
+        @strict(frozen=['rows'])
+        def leaf(rows: list[dict[str, bytes]]) -> None:
+            pass
+
+        @strict(frozen=['rows'])
+        def handler(rows: list[dict[str, bytes]]) -> None:
+            leaf(rows)
+            leaf([{'a': b'a'}])
+
+            with pytest.raises(TypeError):
+                leaf([{'a': 1}])
+
+        handler([{'a': b'a'}])
+        assert len(calls) == 3
+
+    def test_threads(self, calls: list[Any]) -> None:
+        @strict(frozen=['rows'])
+        def leaf(rows: list[dict[str, bytes]]) -> None:
+            pass
+
+        @strict(frozen=['rows'])
+        def handler(rows: list[dict[str, bytes]]) -> None:
+            with ThreadPoolExecutor(1) as executor:
+                executor.submit(leaf, rows).result()
+
+        handler([{'a': b'a'}])
+        assert len(calls) == 2
+
+    def test_tasks(self, calls: list[Any]) -> None:
+        @strict(frozen=['rows'])
+        async def leaf(rows: list[dict[str, bytes]]) -> None:
+            pass
+
+        @strict(frozen=['rows'])
+        async def handler(rows: list[dict[str, bytes]]) -> None:
+            await asyncio.gather(leaf(rows), leaf(rows))
+
+        asyncio.run(handler([{'a': b'a'}]))
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize(
+        'options',
+        [
+            {},
+            {'collect': True},
+            {'mode': 'observe'},
+            {'budget_nodes': 100},
+            {'engine': 'iterative'},
+            {'cache': True},
+        ],
+    )
+    def test_modes(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        options: dict[str, Any],
+    ) -> None:
+        calls: list[str] = []
+        validator: Any = compile_type(tuple[int, tuple[bytes, ...]])
+
+        for method in ('validate', 'check', 'collect', 'expand'):
+            monkeypatch.setattr(
+                validator,
+                method,
+                lambda *args, method=method, run=getattr(validator, method): (
+                    calls.append(method),
+                    run(*args),
+                )[1],
+            )
+
+        @strict(trust=True, **options)
+        def leaf(value: tuple[int, tuple[bytes, ...]]) -> None:
+            pass
+
+        @strict(trust=True, **options)
+        def handler(value: tuple[int, tuple[bytes, ...]]) -> None:
+            leaf(value)
+
+        # Distinct values, the cached ones are not checked again.
+        leaf((1, tuple([b'a'])))
+        checks: int = len(calls)
+        calls.clear()
+        handler((1, tuple([b'a'])))
+
+        assert checks and len(calls) == checks
+
+    @pytest.mark.parametrize('coroutine', [False, True])
+    def test_rate(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        coroutine: bool,
+    ) -> None:
+        draws: list[float] = []
+        monkeypatch.setattr(
+            random,
+            'random',
+            lambda: draws.append(0.25) or 0.25,
+        )
+
+        @strict(trust=True, rate=0.5)
+        def func(a: int) -> int:
+            return a
+
+        @strict(trust=True, rate=0.5)
+        async def async_func(a: int) -> int:
+            return a
+
+        for _ in range(10):
+            if coroutine:
+                asyncio.run(async_func(1))
+            else:
+                func(1)
+
+        assert len(draws) == 10
+
+
+class TestStrictCache:
+    @pytest.mark.parametrize(
+        'options, hits',
+        [
+            ({'cache': True}, 2),
+            ({'cache': 1}, 1),
+            ({'cache': 0}, None),
+            ({}, None),
+        ],
+    )
+    def test_cache(
+        self,
+        calls: list[Any],
+        options: dict[str, Any],
+        hits: int | None,
+    ) -> None:
+        @strict(**options)
+        def func(config: tuple[bytes, ...], b: int = 1) -> None:
+            pass
+
+        name: str = f'{__name__}.{self.test_cache.__qualname__}'
+        name += '.<locals>.func'
+        memo.clear()
+        config: tuple[bytes, ...] = (b'a', b'b')
+        other: tuple[bytes, ...] = (b'c',)
+
+        func(config)
+        func(other)
+        func(config)
+        func(config)
+
+        if hits is None:
+            assert len(calls) == 4
+        else:
+            assert len(calls) == 4 - hits
+            assert memo.snapshot()[name]['hits'] == hits
+
+    def test_mismatch(self) -> None:
+        @strict(cache=True)
+        def func(config: tuple[int, ...]) -> None:
+            pass
+
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                func((True,))
+
+    def test_size(self) -> None:
+        with pytest.raises(ValueError):
+            Strict(cache=-1)
+
+
+class TestStrictCollect:
+    @pytest.mark.parametrize(
+        'args, kwargs, paths',
+        [
+            ((1, [{'x': 1}]), {}, []),
+            (('a', [{'x': 1}]), {}, ['a']),
+            (
+                ('a', [{'x': 1}, {'x': 'b', 'y': 2.5}]),
+                {},
+                ['a', "b[1]['x']", "b[1]['y']"],
+            ),
+            ((1, []), {'c': 'c'}, ['c']),
+            ((1, [], 2, 'd', 1), {}, ['args[1]']),
+            ((1, []), {'d': 'd', 'e': 1}, ['e']),
+        ],
+    )
+    def test_collect(
+        self,
+        args: tuple,
+        kwargs: dict[str, Any],
+        paths: list[str],
+    ) -> None:
+        @strict(collect=True)
+        def func(
+            a: int,
+            b: list[dict[str, int]],
+            c: int = 1,
+            *args: str,
+            **kwargs: str,
+        ) -> None:
+            pass
+
+        if paths:
+            with pytest.raises(ValidationError) as error:
+                func(*args, **kwargs)
+
+            assert [
+                mismatch.path for mismatch in error.value.result.mismatches
+            ] == paths
+            assert str(error.value).startswith('[func] Args errors.\n')
+        else:
+            func(*args, **kwargs)
+
+    def test_max_errors(self) -> None:
+        @strict(max_errors=2)
+        def func(a: int, b: list[int]) -> None:
+            pass
+
+        with pytest.raises(ValidationError) as error:
+            func('a', [1, 'b', 'c'])
+
+        assert len(error.value.result.mismatches) == 2
+        assert error.value.result.truncated
+
+    def test_default(self) -> None:
+        @strict(collect=True)
+        def func(a: int, b: str = 2) -> None:
+            pass
+
+        func(1, 'b')
+
+        with pytest.raises(ValidationError, match=r'b: Expected'):
+            func('a')
+
+    def test_retval(self) -> None:
+        @strict(collect=True)
+        def func(a: list[int]) -> list[str]:
+            return ['a', *a]
+
+        assert func([]) == ['a']
+
+        with pytest.raises(ValidationError) as error:
+            func([1])
+
+        assert str(error.value) == (
+            '[func] Return value error.\n'
+            'return[1]: Expected <class \'str\'>. Mismatch on <class \'int\'>'
+        )
+
+    def test_type_error(self) -> None:
+        @strict(collect=True)
+        def func(a: int) -> None:
+            pass
+
+        with pytest.raises(TypeError):
+            func('a')
+
+    def test_max_errors_value(self) -> None:
+        with pytest.raises(ValueError):
+            Strict(max_errors=0)
+
+
+@dataclass
+class Link:
+    value: int
+    next: Optional['Link'] = None
+
+
+class TestStrictEngine:
+    @staticmethod
+    def chain(depth: int, value: Any = 1) -> Link:
+        link: Link = Link(value)
+
+        for _ in range(depth):
+            link = Link(1, link)
+
+        return link
+
+    @pytest.mark.parametrize('engine', ['auto', 'iterative'])
+    def test_deep(self, engine: str) -> None:
+        @strict(engine=engine)
+        def func(a: Link, *args: Link, b: int = 1) -> Link:
+            return a
+
+        func(self.chain(5_000))
+        func(self.chain(5_000), self.chain(5_000), b=2)
+
+        with pytest.raises(TypeError, match=r'\[func\] Arg \'a\' error.'):
+            func(self.chain(5_000, 'x'))
+
+        with pytest.raises(TypeError, match=r'\[func\] Arg \'args\' error.'):
+            func(self.chain(5_000), self.chain(5_000, 'x'))
+
+        with pytest.raises(TypeError, match=r'\[func\] Arg \'b\' error.'):
+            func(self.chain(5_000), b='x')
+
+    @pytest.mark.parametrize('engine', ['auto', 'iterative'])
+    def test_retval(self, engine: str) -> None:
+        @strict(engine=engine)
+        def func(depth: int) -> Link:
+            return TestStrictEngine.chain(depth, 'x')
+
+        with pytest.raises(TypeError, match=r'\[func\] Return value error.'):
+            func(5_000)
+
+    def test_engine_value(self) -> None:
+        with pytest.raises(ValueError):
+            Strict(engine='threaded')
+
+
+class TestStrictWarmup:
+    def test_lazy(self) -> None:
+        @strict
+        def func(a: dict[str]) -> None:
+            pass
+
+        with pytest.raises(TypeError, match='Missing key/val'):
+            func({})
+
+    def test_eager(self) -> None:
+        with pytest.raises(TypeError, match='Missing key/val'):
+
+            @strict(eager=True)
+            def func(a: dict[str]) -> None:
+                pass
+
+    def test_warmup(self) -> None:
+        sct: Strict = Strict()
+
+        @sct
+        def func(a: int, b: str = 1) -> int:
+            return a
+
+        # The functions left pending by the other tests are released.
+        gc.collect()
+        assert not sct._compiled
+        assert warmup() >= 1
+        assert sct._compiled
+        assert sct.warmup() == 0
+        assert func(1, 'b') == 1
+
+        with pytest.raises(TypeError, match=r'\[func\] Arg \'b\' error.'):
+            func(1)
+
+    def test_threads(self) -> None:
+        sct: Strict = Strict()
+
+        @sct
+        def func(a: int) -> int:
+            return a
+
+        with ThreadPoolExecutor(8) as executor:
+            assert list(executor.map(func, range(100))) == list(range(100))
+
+        assert sct._compiled
+
+    def test_class(self) -> None:
+        @strict
+        class Foo:
+            def __init__(self, a: int) -> None:
+                self.a = a
+
+            def bar(self, b: int) -> int:
+                return self.a + b
+
+            @staticmethod
+            def baz(c: str) -> str:
+                return c
+
+            @classmethod
+            def qux(cls, d: str) -> int:
+                return cls(len(d)).a
+
+            def _quux(self, e: int) -> int:
+                return e
+
+        foo: Foo = Foo('a')
+        assert foo._quux('b') == 'b'
+        assert Foo.baz('c') == 'c'
+        assert Foo(1).bar(1) == 2
+
+        with pytest.raises(TypeError, match=r'\[bar\] Arg \'b\' error.'):
+            foo.bar('b')
+
+        with pytest.raises(TypeError, match=r'\[baz\] Arg \'c\' error.'):
+            Foo.baz(1)
+
+        with pytest.raises(TypeError, match=r'\[qux\] Arg \'d\' error.'):
+            Foo.qux(1)
+
+    def test_dataclass(self) -> None:
+        @strict(eager=True)
+        @dataclass
+        class Point:
+            x: int
+            y: int = 0
+            tags: list[str] = field(default_factory=list)
+
+            def moved(self, dx: int) -> tuple[int, int]:
+                return self.x + dx, self.y
+
+        assert Point(1).moved(1) == (2, 0)
+        assert Point(1, tags=['a']).tags == ['a']
+
+        with pytest.raises(TypeError, match=r'\[__init__\] Arg \'tags\''):
+            Point(1, tags=[1])
+
+        with pytest.raises(TypeError, match=r'\[__init__\] Arg \'y\' error.'):
+            Point(1, 'b')
+
+        with pytest.raises(TypeError, match=r'\[moved\] Arg \'dx\' error.'):
+            Point(1).moved('a')
+
+
+class TestStrictBackend:
+    @pytest.mark.parametrize(
+        'args, kwargs, message',
+        [
+            ((1, ['a']), {'d': 1}, None),
+            ((1, ['a'], 2, 3), {'c': (2, 'b'), 'd': 1, 'e': 1.5}, None),
+            ((None, None), {'d': None}, None),
+            (('x', ['a']), {'d': 1}, r'\[func\] Arg \'a\' error.'),
+            ((1, [1]), {'d': 1}, r'\[func\] Arg \'b\' error.'),
+            ((1, ['a'], 'x'), {'d': 1}, r'\[func\] Arg \'args\' error.'),
+            ((1, ['a']), {'c': (1, 2), 'd': 1}, r'\[func\] Arg \'c\' error.'),
+            ((1, ['a']), {}, r'\[func\] Arg \'d\' error.'),
+            ((1, ['a']), {'d': 1, 'e': 'x'}, r'\[func\] Arg \'e\' error.'),
+        ],
+    )
+    @pytest.mark.parametrize('eager', [False, True])
+    def test_sign(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        message: str | None,
+        eager: bool,
+    ) -> None:
+        @strict(backend='codegen', eager=eager)
+        def func(
+            a: int,
+            /,
+            b: list[str],
+            *args: int,
+            c: tuple[int, str] = (1, 'a'),
+            d: int = 'x',
+            **kwargs: float,
+        ) -> int:
+            return a
+
+        if message:
+            with pytest.raises(TypeError, match=message):
+                func(*args, **kwargs)
+        else:
+            assert func(*args, **kwargs) == args[0]
+
+    def test_retval(self) -> None:
+        @strict(backend='codegen')
+        def func(value: Any) -> tuple[int, str]:
+            return value
+
+        assert func((1, 'a')) == (1, 'a')
+
+        with pytest.raises(TypeError, match=r'\[func\] Return value error.'):
+            func((1, 2))
+
+    def test_deep(self) -> None:
+        @strict(backend='codegen')
+        def func(a: Link) -> Link:
+            return a
+
+        func(TestStrictEngine.chain(5_000))
+
+        with pytest.raises(TypeError, match=r'\[func\] Arg \'a\' error.'):
+            func(TestStrictEngine.chain(5_000, 'x'))
+
+    def test_binding(self) -> None:
+        @strict(backend='codegen')
+        def func(a: int) -> None:
+            pass
+
+        with pytest.raises(TypeError, match='unexpected keyword'):
+            func(1, b=2)
+
+    def test_dump_source(self) -> None:
+        @strict(backend='codegen', eager=True)
+        def func(a: int, b: list[str]) -> None:
+            pass
+
+        source: str = codegen.dump_source(
+            f'{__name__}.TestStrictBackend.test_dump_source.'
+            '<locals>.func'
+        )
+
+        assert 'def check_sign(a, b):' in source
+        assert 'def wrapper(a, b):' in source
+
+    def test_wrapper(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        @strict(backend='codegen', eager=True)
+        def func(ok: int, r: list[str] = ['a']) -> list[str]:
+            return r * ok if ok else 'x'
+
+        assert func.__qualname__.endswith('test_wrapper.<locals>.func')
+        assert func(2) == ['a', 'a']
+        assert func(1, ['b']) == ['b']
+
+        with pytest.raises(TypeError, match=r'\[func\] Arg \'r\' error.'):
+            func(1, [1])
+
+        with pytest.raises(TypeError, match=r'\[func\] Return value error.'):
+            func(0)
+
+        monkeypatch.setattr(config, 'enabled', False)
+        assert func(1, [1]) == [1]
+
+    def test_wrapper_rate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        draws: list[float] = []
+        monkeypatch.setattr(
+            random,
+            'random',
+            lambda: draws.append(0.75) or 0.75,
+        )
+
+        @strict(backend='codegen', rate=0.5)
+        def func(a: int) -> int:
+            return a
+
+        assert func('x') == 'x'
+        assert len(draws) == 1
+
+    def test_collect(self) -> None:
+        @strict(backend='codegen', collect=True)
+        def func(a: int, b: list[str]) -> None:
+            pass
+
+        func(1, ['a'])
+
+        with pytest.raises(ValidationError, match=r'b\[0\]'):
+            func('x', [1])
+
+    def test_backend_value(self) -> None:
+        with pytest.raises(ValueError):
+            Strict(backend='jit')
+
+
+class TestStrictObserve:
+    @pytest.fixture
+    def observations(self) -> Iterator[list[Observation]]:
+        observe.reset()
+        yield []
+        observe.reset()
+
+    def test_sign(self, observations: list[Observation]) -> None:
+        @strict(mode='observe', on_mismatch=observations.append)
+        def func(a: int, *args: str, b: list[int] = ['x']) -> int:
+            return a
+
+        assert func('x', 'y', 1, b=[1]) == 'x'
+        assert func(1) == 1
+        observe.flush()
+
+        assert sorted(
+            (observation.argument, observation.message)
+            for observation in observations
+        ) == [
+            ('a', 'Expected <class \'int\'>. Mismatch on <class \'str\'>'),
+            ('args', 'Expected <class \'str\'>. Mismatch on <class \'int\'>'),
+            ('b', 'Expected <class \'int\'>. Mismatch on <class \'str\'>'),
+            (
+                'return',
+                'Expected <class \'int\'>. Mismatch on <class \'str\'>',
+            ),
+        ]
+        assert observations[0].function.endswith('test_sign.<locals>.func')
+
+    def test_retval(self, observations: list[Observation]) -> None:
+        @strict(mode='observe', on_mismatch=observations.append)
+        def func(value: Any) -> tuple[int, str]:
+            return value
+
+        assert func((1, 2)) == (1, 2)
+        observe.flush()
+
+        assert [observation.argument for observation in observations] == [
+            'return'
+        ]
+
+    def test_lazy(self, observations: list[Observation]) -> None:
+        @strict(mode='observe', on_mismatch=observations.append)
+        def func(items: Iterator[int]) -> Iterator[str]:
+            return items
+
+        assert list(func(iter([1, 'a']))) == [1, 'a']
+        observe.flush()
+
+        assert sorted(
+            (observation.argument, observation.message)
+            for observation in observations
+        ) == [
+            (
+                'items',
+                'Expected <class \'int\'>. Mismatch on <class \'str\'>',
+            ),
+            (
+                'return',
+                'Expected <class \'str\'>. Mismatch on <class \'int\'>',
+            ),
+        ]
+
+    def test_generator(self, observations: list[Observation]) -> None:
+        @strict(mode='observe', on_mismatch=observations.append)
+        def func(stop: int) -> Generator[int, str, str]:
+            sent: Any = yield 0
+
+            while len(sent) < stop:
+                sent = yield 'x'
+
+            return stop
+
+        generator: Generator = func(2)
+        next(generator)
+        generator.send('')
+
+        with pytest.raises(StopIteration):
+            generator.send('ab')
+
+        observe.flush()
+
+        assert [
+            (observation.argument, observation.message)
+            for observation in observations
+        ] == [
+            (
+                'return',
+                'Expected <class \'int\'>. Mismatch on <class \'str\'>',
+            ),
+            (
+                'return',
+                'Expected <class \'str\'>. Mismatch on <class \'int\'>',
+            ),
+        ]
+
+    def test_async(self, observations: list[Observation]) -> None:
+        @strict(mode='observe', on_mismatch=observations.append)
+        async def func(a: int) -> int:
+            return a
+
+        assert asyncio.run(func('x')) == 'x'
+        observe.flush()
+
+        assert [observation.argument for observation in observations] == [
+            'a',
+            'return',
+        ]
+
+    def test_metrics(self, observations: list[Observation]) -> None:
+        @strict(mode='observe', metrics=True)
+        def func(a: int) -> None:
+            pass
+
+        func('x')
+
+        assert metrics.snapshot()[
+            f'{__name__}.TestStrictObserve.test_metrics.<locals>.func'
+        ]['mismatches'] == {'a': 1}
+
+    def test_mode_value(self) -> None:
+        with pytest.raises(ValueError):
+            Strict(mode='warn')
+
+
+class TestStrictBudget:
+    def test_partial(self) -> None:
+        @strict(budget_nodes=100)
+        def func(rows: list[list[int]]) -> int:
+            return len(rows)
+
+        metrics.reset()
+
+        assert func([[1]] * 1_000 + [['x']]) == 1_001
+        assert metrics.partial() == {
+            f'{__name__}.TestStrictBudget.test_partial.<locals>.func': 1
+        }
+
+    def test_mismatch(self) -> None:
+        @strict(budget_us=10**6)
+        def func(rows: list[list[int]]) -> int:
+            return len(rows)
+
+        with pytest.raises(TypeError, match='Arg \'rows\' error.'):
+            func([[1]] * 10 + [['x']])
+
+    def test_retval(self) -> None:
+        @strict(budget_nodes=100)
+        def func(value: Any) -> list[list[int]]:
+            return value
+
+        metrics.reset()
+        func([[1]] * 1_000 + [['x']])
+
+        with pytest.raises(TypeError, match='Return value error.'):
+            func([['x']])
+
+        assert metrics.partial() == {
+            f'{__name__}.TestStrictBudget.test_retval.<locals>.func': 1
+        }
+
+    @pytest.mark.parametrize(
+        'options',
+        [{'budget_us': 0}, {'budget_nodes': -1}],
+    )
+    def test_budget_value(self, options: dict[str, int]) -> None:
+        with pytest.raises(ValueError):
+            Strict(**options)
@@ -0,0 +1,155 @@
+from typing import Annotated, Any
+from array import array
+import pytest
+from src.introspector.arrays import (
+    Constraint,
+    Dtype,
+    Format,
+    Ndim,
+    Shape,
+    Typecode,
+)
+from src.introspector.introspector import Introspector
+from src.introspector.validator import compile_type
+
+
+class TestConstraints:
+    @pytest.mark.parametrize(
+        'constraint, value, expected',
+        [
+            (Typecode('d'), array('d', [1.0, 2.0]), True),
+            (Typecode('d'), array('i', [1, 2]), False),
+            (Typecode('d'), [1.0, 2.0], False),
+            (Format('B'), memoryview(b'abc'), True),
+            (Format('B'), memoryview(array('d', [1.0])), False),
+            (Format('d'), memoryview(array('d', [1.0])), True),
+            (Shape(3), memoryview(b'abc'), True),
+            (Shape(None), array('i', [1, 2]), True),
+            (Shape(2), array('i', [1, 2, 3]), False),
+            (Shape(2, 3), memoryview(bytes(6)).cast('B', (2, 3)), True),
+            (Shape(None, 3), memoryview(bytes(6)).cast('B', (2, 3)), True),
+            (Shape(None, 2), memoryview(bytes(6)).cast('B', (2, 3)), False),
+            (Shape(6), memoryview(bytes(6)).cast('B', (2, 3)), False),
+            (Ndim(2), memoryview(bytes(6)).cast('B', (2, 3)), True),
+            (Ndim(1), array('i'), True),
+            (Ndim(2), array('i'), False),
+            (Dtype('float64'), array('d'), False),
+        ],
+    )
+    def test_check(
+        self,
+        constraint: Constraint,
+        value: Any,
+        expected: bool,
+    ) -> None:
+        assert constraint.check(value) is expected
+
+    def test_hashable(self) -> None:
+        assert Shape(None, 3) == Shape(None, 3)
+        assert hash(Annotated[array, Typecode('d'), Shape(2)])
+
+
+class TestAnnotated:
+    @pytest.mark.parametrize(
+        'type_, value, throwable',
+        [
+            (Annotated[array, Typecode('d')], array('d', [1.0]), None),
+            (Annotated[array, Typecode('d')], None, None),
+            (Annotated[array, Typecode('d')], array('i', [1]), TypeError),
+            (Annotated[array, Typecode('d')], [1.0], TypeError),
+            (
+                Annotated[memoryview, Format('B'), Ndim(1)],
+                memoryview(b'a'),
+                None,
+            ),
+            (
+                Annotated[memoryview, Format('B'), Shape(None, 3)],
+                memoryview(bytes(6)).cast('B', (2, 3)),
+                None,
+            ),
+            (
+                Annotated[memoryview, Format('B'), Shape(None, 3)],
+                memoryview(bytes(6)),
+                TypeError,
+            ),
+            (Annotated[int, 'unit'], 1, None),
+            (Annotated[int, 'unit'], 'a', TypeError),
+            (
+                list[Annotated[array, Typecode('i')]],
+                [array('i'), array('i', [1])],
+                None,
+            ),
+            (
+                list[Annotated[array, Typecode('i')]],
+                [array('i'), array('d')],
+                TypeError,
+            ),
+            (
+                Annotated[array, Typecode('i')] | str,
+                'a',
+                None,
+            ),
+            (
+                Annotated[array, Typecode('i')] | str,
+                array('d'),
+                TypeError,
+            ),
+        ],
+    )
+    def test_inspect(
+        self,
+        type_: Any,
+        value: Any,
+        throwable: TypeError | None,
+    ) -> None:
+        if throwable:
+            with pytest.raises(throwable):
+                Introspector(type_, value).inspect()
+        else:
+            Introspector(type_, value).inspect()
+
+    def test_inspect_error(self) -> None:
+        with pytest.raises(TypeError, match='Mismatch on typecode \'i\''):
+            Introspector(
+                Annotated[array, Typecode('d')],
+                array('i'),
+            ).inspect()
+
+    def test_no_data_read(self) -> None:
+        class Buffer:
+            shape: tuple[int, ...] = (1_000_000, 3)
+
+            def __iter__(self) -> Any:
+                raise AssertionError('The data must not be read.')
+
+        assert compile_type(Annotated[Buffer, Shape(None, 3)]).check(Buffer())
+
+    def test_ndarray(self) -> None:
+        np: Any = pytest.importorskip('numpy')
+        npt: Any = pytest.importorskip('numpy.typing')
+        value: Any = np.zeros((4, 3))
+
+        Introspector(
+            Annotated[np.ndarray, Dtype('float64'), Shape(None, 3)],
+            value,
+        ).inspect()
+        Introspector(
+            Annotated[np.ndarray, Dtype(np.floating)],
+            value,
+        ).inspect()
+        Introspector(npt.NDArray[np.float64], value).inspect()
+
+        with pytest.raises(TypeError, match='Mismatch on dtype int32'):
+            Introspector(
+                Annotated[np.ndarray, Dtype('float64')],
+                value.astype('int32'),
+            ).inspect()
+
+        with pytest.raises(TypeError, match='Mismatch on ndim 2'):
+            Introspector(
+                Annotated[np.ndarray, Ndim(1)],
+                value,
+            ).inspect()
+
+        with pytest.raises(TypeError):
+            Introspector(npt.NDArray[np.int64], value).inspect()
@@ -0,0 +1,98 @@
+from typing import Any, Iterator
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.introspector.batch import validate_many
+from src.introspector.result import ValidationResult
+
+
+def records(count: int) -> Iterator[dict[str, Any]]:
+    for i in range(count):
+        yield {'id': i, 'name': str(i) if i % 3 else i}
+
+
+class TestValidateMany:
+    @pytest.mark.parametrize(
+        'options',
+        [
+            {},
+            {'workers': ThreadPoolExecutor(2), 'chunk_size': 4},
+            {'workers': 2, 'chunk_size': 7},
+        ],
+    )
+    def test_results(self, options: dict[str, Any]) -> None:
+        results: list[ValidationResult] = list(
+            validate_many(dict[str, int | str], records(50), **options)
+        )
+
+        assert [bool(result) for result in results] == [True] * 50
+        results = list(
+            validate_many(dict[str, str | None], records(50), **options)
+        )
+
+        assert len(results) == 50
+        assert [
+            [mismatch.path for mismatch in result.mismatches]
+            for result in results[:4]
+        ] == [
+            ["['id']", "['name']"],
+            ["['id']"],
+            ["['id']"],
+            ["['id']", "['name']"],
+        ]
+
+    @pytest.mark.parametrize(
+        'options',
+        [{}, {'workers': ThreadPoolExecutor(2), 'chunk_size': 3}],
+    )
+    def test_details(self, options: dict[str, Any]) -> None:
+        assert list(
+            validate_many(
+                list[int],
+                [[1], ['a'], None, [2]],
+                details=False,
+                **options,
+            )
+        ) == [True, False, True, True]
+
+    def test_max_errors(self) -> None:
+        result: ValidationResult = next(
+            validate_many(list[int], [['a', 'b', 'c']], max_errors=2)
+        )
+
+        assert len(result.mismatches) == 2 and result.truncated
+
+    def test_lazy(self) -> None:
+        consumed: list[int] = []
+
+        def values() -> Iterator[int]:
+            for i in range(1_000_000):
+                consumed.append(i)
+                yield i
+
+        results: Iterator[ValidationResult | bool] = validate_many(
+            int,
+            values(),
+            details=False,
+            workers=ThreadPoolExecutor(1),
+            chunk_size=10,
+        )
+
+        assert next(results)
+        assert len(consumed) <= 20
+
+    @pytest.mark.parametrize(
+        'type_, options, throwable',
+        [
+            (dict[str], {}, TypeError),
+            (int, {'max_errors': 0}, ValueError),
+            (int, {'chunk_size': 0}, ValueError),
+        ],
+    )
+    def test_errors(
+        self,
+        type_: Any,
+        options: dict[str, Any],
+        throwable: Exception,
+    ) -> None:
+        with pytest.raises(throwable):
+            validate_many(type_, iter([]), **options)
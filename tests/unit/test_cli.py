@@ -0,0 +1,167 @@
+from typing import Any, Optional
+from pathlib import Path
+import io
+import json
+import pytest
+from src.introspector import cli
+
+
+class TestParseType:
+    @pytest.mark.parametrize(
+        'expression, expected',
+        [
+            ('int', int),
+            ('list[dict[str, int | None]]', list[dict[str, int | None]]),
+            ('tuple[int, ...]', tuple[int, ...]),
+            ('Optional[Any]', Optional[Any]),
+            ('typing.Any', Any),
+            ('collections:OrderedDict', __import__('collections').OrderedDict),
+            ('pathlib.Path', Path),
+        ],
+    )
+    def test_parse_type(self, expression: str, expected: Any) -> None:
+        assert cli.parse_type(expression) == expected
+
+    @pytest.mark.parametrize(
+        'expression',
+        ['__import__("os")', 'list[', 'unknown.module:Name', 'json:nope'],
+    )
+    def test_parse_type_error(self, expression: str) -> None:
+        with pytest.raises(ValueError):
+            cli.parse_type(expression)
+
+
+class TestReadJson:
+    @pytest.mark.parametrize(
+        'text, stream, streamed, expected',
+        [
+            ('[1, {"a": [2, 3]}, "x", 123456]', True, True, None),
+            ('  [ ]', True, True, []),
+            ('[1, 2]', False, False, [[1, 2]]),
+            ('{"a": 1}', True, False, [{'a': 1}]),
+        ],
+    )
+    def test_read_json(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        text: str,
+        stream: bool,
+        streamed: bool,
+        expected: list[Any] | None,
+    ) -> None:
+        monkeypatch.setattr(cli, '_READ_SIZE', 3)
+        is_streamed, records = cli.read_json(io.StringIO(text), stream)
+
+        assert is_streamed is streamed
+        assert [value for _, value in records] == (
+            json.loads(text) if expected is None else expected
+        )
+
+    @pytest.mark.parametrize('text', ['[1 2]', '[1, 2', '[1,]'])
+    def test_read_json_error(self, text: str) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            list(cli.read_json(io.StringIO(text), True)[1])
+
+
+class TestMain:
+    @pytest.mark.parametrize(
+        'name, content, argv, code, lines',
+        [
+            (
+                'data.jsonl',
+                '{"a": 1}\n{"a": "x"}\nnot json\n\n{"a": null}\n',
+                ['dict[str, int | None]'],
+                1,
+                ['line 2: [\'a\']:', 'line 3: Invalid JSON.'],
+            ),
+            (
+                'data.jsonl',
+                '{"a": 1}\n',
+                ['dict[str, int]', '--workers', '2'],
+                0,
+                [],
+            ),
+            (
+                'data.json',
+                '[1, 2, "x"]',
+                ['list[int]'],
+                1,
+                ['item 2: Expected <class \'int\'>'],
+            ),
+            (
+                'data.json',
+                '{"a": [1, "x"]}',
+                ['dict[str, list[int]]'],
+                1,
+                ['document 0: [\'a\'][1]:'],
+            ),
+            (
+                'data.txt',
+                '[1]\n["x"]\n',
+                ['list[int]', '--format', 'jsonl', '--quiet'],
+                1,
+                [],
+            ),
+        ],
+    )
+    def test_main(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture,
+        name: str,
+        content: str,
+        argv: list[str],
+        code: int,
+        lines: list[str],
+    ) -> None:
+        path: Path = tmp_path / name
+        path.write_text(content)
+
+        assert cli.main([argv[0], str(path), *argv[1:]]) == code
+
+        captured: Any = capsys.readouterr()
+        output: list[str] = captured.out.splitlines()
+        assert len(output) == len(lines)
+        assert all(
+            line.startswith(prefix) for line, prefix in zip(output, lines)
+        )
+        assert 'records' in captured.err
+
+    @pytest.mark.parametrize('expression', ['dict[str]', 'nope('])
+    def test_main_bad_type(self, tmp_path: Path, expression: str) -> None:
+        with pytest.raises(SystemExit):
+            cli.main([expression, str(tmp_path / 'data.json')])
+
+    @pytest.mark.parametrize(
+        'options',
+        [
+            ['--max-errors', '0'],
+            ['--chunk-size', '0'],
+            ['--workers', '0'],
+        ],
+    )
+    def test_main_bad_option(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture,
+        options: list[str],
+    ) -> None:
+        path: Path = tmp_path / 'data.jsonl'
+        path.write_text('1\n')
+
+        with pytest.raises(SystemExit):
+            cli.main(['int', str(path), *options])
+
+        assert f'Expected at least 1 for {options[0]}.' in (
+            capsys.readouterr().err
+        )
+
+    def test_main_missing_file(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture,
+    ) -> None:
+        with pytest.raises(SystemExit):
+            cli.main(['int', str(tmp_path / 'missing.jsonl')])
+
+        assert 'No such file or directory' in capsys.readouterr().err
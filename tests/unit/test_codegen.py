@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    NotRequired,
+    Optional,
+    TypedDict,
+)
+import pytest
+from src.introspector.arrays import Ndim
+from src.introspector.codegen import GeneratedValidator, dump_source, generate
+from src.introspector.containers import CheckedDict, CheckedList
+from src.introspector.introspector import Introspector
+from src.introspector.sample import Sample
+from src.introspector.validator import compile_type
+
+
+@dataclass
+class Link:
+    value: int
+    next: Optional['Link'] = None
+
+
+class Pair(NamedTuple):
+    key: str
+    value: float
+
+
+class Movie(TypedDict):
+    title: str
+    year: NotRequired[int]
+    cast: list[str]
+
+
+def chain(depth: int, tail: Any = None) -> Link:
+    link: Link | None = tail
+
+    for value in range(depth):
+        link = Link(value, link)
+
+    return link
+
+
+class TestCodegen:
+    @pytest.mark.parametrize(
+        'type_, value',
+        [
+            (int, 1),
+            (int, True),
+            (int, None),
+            (Any, object()),
+            (list[int], [1, 2, 3]),
+            (list[int], [1, 'a', 3]),
+            (list[int], (1, 2)),
+            (list[int], CheckedList[int]([1])),
+            (list[int], CheckedList[str](['a'])),
+            (list[list[int]], [[1], [2, 'a']]),
+            (set[str], {'a', 'b'}),
+            (set[str], {'a', 1}),
+            (tuple[()], ()),
+            (tuple[int, str], (1, 'a')),
+            (tuple[int, str], (1, 'a', 2)),
+            (tuple[int, str], (1, 2)),
+            (tuple[list[int], ...], ([1], ['b'])),
+            (dict[str, list[int]], {'a': [1], 'b': []}),
+            (dict[str, list[int]], {'a': [1], 'b': ['c']}),
+            (dict[str, int], {1: 1}),
+            (dict[str, int], CheckedDict[str, int]({'a': 1})),
+            (int | str, 'a'),
+            (int | str, 1.5),
+            (int | Any, 1.5),
+            (list[int] | list[str], ['a', 'b']),
+            (list[int] | list[str], [1, 'b']),
+            (list[int] | dict[str, int], {'a': 'b'}),
+            (list[int] | Iterable[str], ('a', 'b')),
+            (list[int] | Iterable[str], ('a', 1)),
+            (Optional[list[int]], None),
+            (Callable[[int], int], len),
+            (Callable[[int], int], 1),
+            (Iterable[int], [1, 'a']),
+            (Annotated[list[int], Ndim(1)], [1, 2]),
+            (Link, chain(3)),
+            (Link, chain(3, Link('a'))),
+            (Pair, Pair('a', 1.5)),
+            (Pair, Pair('a', 1)),
+            (Movie, {'title': 'a', 'cast': ['b']}),
+            (Movie, {'title': 'a', 'year': 1, 'cast': []}),
+            (Movie, {'title': 'a', 'year': '1', 'cast': []}),
+            (Movie, {'title': 'a'}),
+            (Movie, {'title': 'a', 'cast': [], 'x': 1}),
+        ],
+    )
+    def test_parity(self, type_: Any, value: Any) -> None:
+        validator: Any = compile_type(type_)
+
+        assert generate(validator)(value) is validator.check(value)
+
+    def test_sample(self) -> None:
+        check: Any = generate(compile_type(list[int], Sample.first(2)))
+
+        assert check([1, 2, 'a'])
+        assert not check([1, 'a', 2])
+
+    def test_once(self) -> None:
+        validator: Any = compile_type(dict[str, tuple[int, float]])
+
+        assert generate(validator) is generate(validator)
+
+    @pytest.mark.parametrize(
+        'type_, expected',
+        [
+            (tuple[int, str], 'x0, x1, = v'),
+            (tuple[int, str], '_type(x0) is _int'),
+            (list[int], '.issuperset(_map(_type, v))'),
+            (list[list[int]], 'for x in v:'),
+            (Link, 'x1 = v.next'),
+            (Movie, "if 'year' in v:"),
+        ],
+    )
+    def test_dump_source(self, type_: Any, expected: str) -> None:
+        source: str = dump_source(type_)
+
+        assert expected in source
+        compile(source, '<test>', 'exec')
+
+    def test_dump_source_unknown(self) -> None:
+        with pytest.raises(ValueError):
+            dump_source('unknown.function')
+
+    def test_validator(self) -> None:
+        validator: GeneratedValidator = GeneratedValidator(
+            compile_type(list[tuple[int, str]])
+        )
+
+        validator.validate([(1, 'a')])
+        assert validator.check([(1, 'a')])
+        assert not validator.check([(1, 2)])
+
+        with pytest.raises(TypeError, match='Mismatch on <class \'int\'>'):
+            validator.validate([(1, 2)])
+
+    def test_deep(self) -> None:
+        Introspector(Link, chain(5_000), backend='codegen').inspect()
+
+        with pytest.raises(TypeError):
+            Introspector(
+                Link,
+                chain(5_000, Link('a')),
+                backend='codegen',
+            ).inspect()
+
+    def test_lazy(self) -> None:
+        inspector: Introspector = Introspector(
+            Iterator[int],
+            iter([1, 'a']),
+            backend='codegen',
+        )
+
+        with pytest.raises(TypeError):
+            list(inspector.inspect())
+
+    def test_backend_value(self) -> None:
+        with pytest.raises(ValueError):
+            Introspector(int, 1, backend='jit')
@@ -0,0 +1,42 @@
+import importlib
+import pytest
+from src.introspector import config
+
+
+class TestConfig:
+    @pytest.mark.parametrize(
+        'env_value, expected',
+        [
+            ('1', True),
+            ('true', True),
+            ('0', False),
+            ('False', False),
+            (' off ', False),
+            ('no', False),
+        ],
+    )
+    def test_env_var(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        env_value: str,
+        expected: bool,
+    ) -> None:
+        monkeypatch.setenv(config.ENV_VAR, env_value)
+
+        try:
+            importlib.reload(config)
+            assert config.is_enabled() is expected
+        finally:
+            monkeypatch.delenv(config.ENV_VAR)
+            importlib.reload(config)
+
+        assert config.is_enabled()
+
+    def test_enable_disable(self) -> None:
+        try:
+            config.disable()
+            assert not config.is_enabled()
+        finally:
+            config.enable()
+
+        assert config.is_enabled()
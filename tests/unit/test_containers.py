@@ -0,0 +1,194 @@
+from typing import Any, Callable, List, Optional
+import pickle
+import pytest
+from src.introspector.containers import CheckedDict, CheckedList, CheckedSet
+from src.introspector.introspector import Introspector
+from src.introspector.strict import Strict
+from src.introspector.validator import compile_type
+
+
+class TestCheckedContainers:
+    @pytest.mark.parametrize(
+        'factory, mutation, throwable',
+        [
+            (lambda: CheckedList[int]([1]), lambda c: c.append(2), None),
+            (
+                lambda: CheckedList[int]([1]),
+                lambda c: c.append('a'),
+                TypeError,
+            ),
+            (
+                lambda: CheckedList[int]([1]),
+                lambda c: c.insert(0, 'a'),
+                TypeError,
+            ),
+            (
+                lambda: CheckedList[int]([1]),
+                lambda c: c.extend([2, 'a']),
+                TypeError,
+            ),
+            (
+                lambda: CheckedList[int]([1]),
+                lambda c: c.__iadd__(iter([2, 'a'])),
+                TypeError,
+            ),
+            (
+                lambda: CheckedList[int]([1]),
+                lambda c: c.__setitem__(0, 'a'),
+                TypeError,
+            ),
+            (
+                lambda: CheckedList[int]([1, 2]),
+                lambda c: c.__setitem__(slice(0, 1), [3, 4]),
+                None,
+            ),
+            (
+                lambda: CheckedList[int]([1, 2]),
+                lambda c: c.__setitem__(slice(0, 1), ['a']),
+                TypeError,
+            ),
+            (lambda: CheckedList[int](['a']), lambda c: None, TypeError),
+            (
+                lambda: CheckedDict[str, int]({'a': 1}),
+                lambda c: c.__setitem__('b', 2),
+                None,
+            ),
+            (
+                lambda: CheckedDict[str, int]({'a': 1}),
+                lambda c: c.__setitem__(1, 2),
+                TypeError,
+            ),
+            (
+                lambda: CheckedDict[str, int]({'a': 1}),
+                lambda c: c.__setitem__('b', 'c'),
+                TypeError,
+            ),
+            (
+                lambda: CheckedDict[str, int]({'a': 1}),
+                lambda c: c.update({'b': 2}, c='d'),
+                TypeError,
+            ),
+            (
+                lambda: CheckedDict[str, int]({'a': 1}),
+                lambda c: c.update([('b', 2)]),
+                None,
+            ),
+            (
+                lambda: CheckedDict[str, int]({'a': 1}),
+                lambda c: c.setdefault('b', 'c'),
+                TypeError,
+            ),
+            (
+                lambda: CheckedDict[str, int]({'a': 1}),
+                lambda c: c.__ior__({'b': None}),
+                None,
+            ),
+            (lambda: CheckedDict[str, int](a='b'), lambda c: None, TypeError),
+            (lambda: CheckedSet[str]({'a'}), lambda c: c.add('b'), None),
+            (lambda: CheckedSet[str]({'a'}), lambda c: c.add(1), TypeError),
+            (
+                lambda: CheckedSet[str]({'a'}),
+                lambda c: c.update({'b'}, [1]),
+                TypeError,
+            ),
+            (
+                lambda: CheckedSet[str]({'a'}),
+                lambda c: c.__ixor__({'a', 1}),
+                TypeError,
+            ),
+            (
+                lambda: CheckedSet[str]({'a'}),
+                lambda c: c.symmetric_difference_update({'a', 'b'}),
+                None,
+            ),
+        ],
+    )
+    def test_mutation(
+        self,
+        factory: Callable[[], Any],
+        mutation: Callable[[Any], Any],
+        throwable: TypeError | None,
+    ) -> None:
+        if throwable:
+            with pytest.raises(throwable, match=r'^\[Checked\w+\[.+\]\] Item'):
+                mutation(factory())
+        else:
+            mutation(factory())
+
+    def test_atomic(self) -> None:
+        checked: Any = CheckedDict[str, int]({'a': 1})
+
+        with pytest.raises(TypeError):
+            checked.update({'b': 2, 'c': 'd'})
+
+        assert checked == {'a': 1}
+
+    @pytest.mark.parametrize(
+        'type_, value, expected',
+        [
+            (list[int], CheckedList[int]([1]), True),
+            (List[int], CheckedList[int]([1]), True),
+            (list[str], CheckedList[int]([1]), False),
+            (Optional[list[int]], CheckedList[int]([1]), True),
+            (list[int] | dict[str, int], CheckedDict[str, int](a=1), True),
+            (dict[str, int], CheckedDict[str, int](a=1), True),
+            (dict[str, str], CheckedDict[str, int](a=1), False),
+            (list[list[int]], [CheckedList[int]([1])], True),
+            (set[str], CheckedSet[str]('a'), True),
+            (frozenset[str], CheckedSet[str]('a'), False),
+            (set[str], CheckedList[str]('a'), False),
+        ],
+    )
+    def test_check(self, type_: Any, value: Any, expected: bool) -> None:
+        assert compile_type(type_).check(value) is expected
+        assert bool(Introspector(type_, value).collect()) is expected
+
+        for engine in ('auto', 'iterative'):
+            if expected:
+                Introspector(type_, value, engine=engine).inspect()
+            else:
+                with pytest.raises(TypeError):
+                    Introspector(type_, value, engine=engine).inspect()
+
+    def test_o1(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        checked: Any = CheckedList[int](range(1_000))
+
+        def fail(*args: Any) -> None:
+            raise AssertionError('The items must not be checked.')
+
+        monkeypatch.setattr(compile_type(int), 'check_many', fail)
+
+        @Strict()
+        def func(a: list[int]) -> None:
+            pass
+
+        func(checked)
+
+    def test_class(self) -> None:
+        assert CheckedList[int] is CheckedList[int]
+        assert CheckedList[int].__name__ == 'CheckedList[int]'
+        assert CheckedDict[str, list[int]].__name__ == (
+            'CheckedDict[str, list[int]]'
+        )
+
+        with pytest.raises(TypeError, match='Expected a parameterized'):
+            CheckedList([1])
+
+        with pytest.raises(TypeError, match='already parameterized'):
+            CheckedList[int][int]
+
+        with pytest.raises(TypeError, match='Missing key/val'):
+            CheckedDict[str]
+
+    @pytest.mark.parametrize(
+        'value',
+        [
+            CheckedList[int]([1, 2]),
+            CheckedDict[str, int](a=1),
+            CheckedSet[str]('ab'),
+        ],
+    )
+    def test_copy(self, value: Any) -> None:
+        for copy in (value.copy(), pickle.loads(pickle.dumps(value))):
+            assert type(copy) is type(value)
+            assert copy == value
@@ -1,11 +1,23 @@
-from typing import Any, Callable, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
+from collections import deque
 import pytest
 from src.introspector.introspector import Introspector
+from src.introspector.result import Mismatch, ValidationResult
+from src.introspector.sample import Sample
 
 
 class TestIntrospector:
     T = TypeVar('T')
 
+    @pytest.mark.parametrize('backend', ['interpreted', 'codegen'])
     @pytest.mark.parametrize(
         'type_, value, throwable',
         [
@@ -119,6 +131,16 @@ class TestIntrospector:
             (T, 'hello', None),
             (list[T], [1, 'a', 3.14], None),
             (list[T], {1, 'a', 3.14}, TypeError),
+            # Abstract collections tests
+            (Sequence[int], [1, 2], None),
+            (Sequence[int], (1, 2), None),
+            (Sequence[int], deque([1, 2]), None),
+            (Sequence[int | str], (1, 'a'), None),
+            (Mapping[str, list[int]], {'a': [1, 2]}, None),
+            (Sequence[int], (1, 'a'), TypeError),
+            (Sequence[int], {1, 2}, TypeError),
+            (Mapping[str, int], {'a': 'b'}, TypeError),
+            (Mapping[str, int], [('a', 1)], TypeError),
         ],
     )
     def test_inspect(
@@ -126,8 +148,9 @@ class TestIntrospector:
         type_: Any,
         value: Any,
         throwable: TypeError | None,
+        backend: str,
     ) -> None:
-        inspector: Introspector = Introspector(type_, value)
+        inspector: Introspector = Introspector(type_, value, backend=backend)
 
         if throwable:
             with pytest.raises(throwable):
@@ -213,3 +236,134 @@ class TestIntrospector:
                 inspector._inspect_subtypes(type_, value)
         else:
             inspector._inspect_subtypes(type_, value)
+
+    @pytest.mark.parametrize('backend', ['interpreted', 'codegen'])
+    @pytest.mark.parametrize(
+        'type_, value, sample, throwable',
+        [
+            (list[int], [1, 2, 'a'], Sample.first(2), None),
+            (list[int], [1, 2, 'a'], Sample.first(3), TypeError),
+            (list[int], [1, 'a', 2, 'b'], Sample.fraction(0.5), None),
+            (list[int], [1, 2, 'a', 'b'], Sample.fraction(0.5), TypeError),
+            (list[int], ['a'] * 100, Sample.random(5), TypeError),
+            (dict[str, list[int]], {'a': [1, 'b']}, Sample.first(1), None),
+            (tuple[int, ...], (1, 2, 'a'), Sample.first(2), None),
+            (tuple[int, str], (1, 2), Sample.first(1), TypeError),
+        ],
+    )
+    def test_inspect_sample(
+        self,
+        type_: Any,
+        value: Any,
+        sample: Sample,
+        throwable: TypeError | None,
+        backend: str,
+    ) -> None:
+        inspector: Introspector = Introspector(
+            type_,
+            value,
+            sample,
+            backend=backend,
+        )
+
+        if throwable:
+            with pytest.raises(throwable):
+                inspector.inspect()
+        else:
+            inspector.inspect()
+
+    @pytest.mark.parametrize(
+        'type_, value, throwable',
+        [
+            (Iterator[int], iter([1, 2]), None),
+            (Iterator[int], iter([1, 'a']), TypeError),
+            (Iterator[int], [1, 2], TypeError),
+            (Iterable[int], [1, 2], None),
+            (Iterable[int], [1, 'a'], TypeError),
+            (Iterable[int], iter([1, 'a']), TypeError),
+        ],
+    )
+    def test_inspect_lazy(
+        self,
+        type_: Any,
+        value: Any,
+        throwable: TypeError | None,
+    ) -> None:
+        inspector: Introspector = Introspector(type_, value)
+
+        if throwable:
+            with pytest.raises(throwable):
+                list(inspector.inspect())
+        else:
+            assert list(inspector.inspect()) == [1, 2]
+
+    @pytest.mark.parametrize(
+        'type_, value, expected',
+        [
+            (int, 1, []),
+            (int, 'a', ['']),
+            (list[int], [1, 'a', 2, 'b'], ['[1]', '[3]']),
+            (list[int], (1,), ['']),
+            (
+                dict[str, list[int | None]],
+                {'x': [1, None, 'a'], 'y': [], 1: [2.5]},
+                ["['x'][2]", '[1] (key)', '[1][0]'],
+            ),
+            (
+                list[dict[str, tuple[int, str]]],
+                [{'x': (1, 'a')}, {'x': (1, 2), 'y': (1,)}],
+                ["[1]['x'][1]", "[1]['y']"],
+            ),
+            (tuple[int, ...], (1, 'a', 'b'), ['[1]', '[2]']),
+            (set[int], {1, 'a'}, ["{'a'}"]),
+            (list[int] | None, [1, 'a'], ['[1]']),
+            (list[int] | list[str], [1, 2.5], ['']),
+            (Iterable[int], [1, 'a'], ['[1]']),
+        ],
+    )
+    def test_collect(
+        self,
+        type_: Any,
+        value: Any,
+        expected: list[str],
+    ) -> None:
+        result: ValidationResult = Introspector(type_, value).collect()
+
+        assert bool(result) is (not expected)
+        assert [mismatch.path for mismatch in result.mismatches] == expected
+
+    def test_collect_mismatch(self) -> None:
+        result: ValidationResult = Introspector(
+            dict[str, list[int]],
+            {'b': [1, 2, 3, 'x']},
+        ).collect()
+
+        assert result.mismatches == [
+            Mismatch("['b'][3]", int, str),
+        ]
+        assert str(result) == (
+            "['b'][3]: Expected <class 'int'>. Mismatch on <class 'str'>"
+        )
+
+    @pytest.mark.parametrize(
+        'max_errors, count, truncated',
+        [
+            (None, 5, False),
+            (5, 5, False),
+            (2, 2, True),
+            (1, 1, True),
+        ],
+    )
+    def test_collect_max_errors(
+        self,
+        max_errors: int | None,
+        count: int,
+        truncated: bool,
+    ) -> None:
+        result: ValidationResult = Introspector(
+            list[list[int]],
+            [['a', 'b'], [1], ['c', 'd', 'e']],
+        ).collect(max_errors)
+
+        assert len(result.mismatches) == count
+        assert result.truncated is truncated
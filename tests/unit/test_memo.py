@@ -0,0 +1,90 @@
+from typing import Any
+import pytest
+from src.introspector import memo
+from src.introspector.memo import CachedValidator, ResultCache
+from src.introspector.validator import Validator, compile_type
+
+
+class TestResultCache:
+    def test_get(self) -> None:
+        cache: ResultCache = ResultCache('foo', 2)
+        validator: Validator = compile_type(tuple[str, ...])
+        value: tuple[str, ...] = ('a', 'b')
+
+        assert not cache.get(validator, value)
+        cache.add(validator, value)
+        assert cache.get(validator, value)
+        assert not cache.get(validator, tuple(['a', 'b']))
+        assert not cache.get(compile_type(tuple[str, str]), value)
+        assert cache.snapshot() == {
+            'size': 1,
+            'maxsize': 2,
+            'hits': 1,
+            'misses': 3,
+            'evictions': 0,
+        }
+
+    def test_lru(self) -> None:
+        cache: ResultCache = ResultCache('foo', 2)
+        validator: Validator = compile_type(tuple[int, ...])
+        values: list[tuple[int, ...]] = [(1,), (2,), (3,)]
+
+        cache.add(validator, values[0])
+        cache.add(validator, values[1])
+        cache.get(validator, values[0])
+        cache.add(validator, values[2])
+
+        assert cache.get(validator, values[0])
+        assert not cache.get(validator, values[1])
+        assert cache.get(validator, values[2])
+        assert cache.evictions == 1
+
+    def test_clear(self) -> None:
+        cache: ResultCache = memo.register('test_memo.clear', 2)
+        validator: Validator = compile_type(tuple[int, ...])
+        value: tuple[int, ...] = (1,)
+
+        cache.add(validator, value)
+        cache.get(validator, value)
+        memo.clear()
+
+        assert memo.snapshot()['test_memo.clear'] == {
+            'size': 0,
+            'maxsize': 2,
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
+
+
+class TestCachedValidator:
+    @pytest.mark.parametrize(
+        'type_, value, throwable',
+        [
+            (tuple[bool, ...], (True, False), None),
+            (tuple[bool, ...], (1, 0), TypeError),
+            (tuple[str, tuple[int, int]], ('a', (1, 2)), None),
+            (tuple[str, tuple[int, int]], ('a', (1, 'b')), TypeError),
+            (tuple[str, ...], None, None),
+        ],
+    )
+    def test_validate(
+        self,
+        type_: Any,
+        value: Any,
+        throwable: TypeError | None,
+    ) -> None:
+        cache: ResultCache = ResultCache('foo', 8)
+        validator: CachedValidator = CachedValidator(
+            compile_type(type_),
+            cache,
+        )
+
+        for _ in range(2):
+            if throwable:
+                with pytest.raises(throwable):
+                    validator.validate(value)
+            else:
+                validator.validate(value)
+
+        assert cache.hits == (1 if value and not throwable else 0)
@@ -0,0 +1,58 @@
+import pytest
+from src.introspector import metrics
+from src.introspector.metrics import Metrics
+
+
+class TestMetrics:
+    @pytest.mark.parametrize(
+        'durations, expected',
+        [
+            ([], {}),
+            ([0], {1: 1}),
+            ([1, 3, 3], {2: 1, 4: 2}),
+            ([1000, 1023, 1024], {1024: 2, 2048: 1}),
+            ([2**60], {2 ** (Metrics.BUCKETS - 1): 1}),
+        ],
+    )
+    def test_record_sign(
+        self,
+        durations: list[int],
+        expected: dict[int, int],
+    ) -> None:
+        metered: Metrics = Metrics('foo')
+
+        for duration in durations:
+            metered.record_sign(duration)
+
+        snapshot: dict = metered.snapshot()
+        assert snapshot['calls'] == len(durations)
+        assert snapshot['sign_ns'] == sum(durations)
+        assert snapshot['sign_histogram'] == expected
+
+    def test_record_mismatch(self) -> None:
+        metered: Metrics = Metrics('foo')
+        metered.record_mismatch('a')
+        metered.record_mismatch('a')
+        metered.record_mismatch('return')
+
+        assert metered.snapshot()['mismatches'] == {'a': 2, 'return': 1}
+
+    def test_registry(self) -> None:
+        metered: Metrics = metrics.register('tests.foo')
+        metered.record_retval(5)
+
+        assert metrics.register('tests.foo') is metered
+        assert metrics.snapshot()['tests.foo']['retval_histogram'] == {8: 1}
+
+        metrics.reset()
+        assert metrics.snapshot()['tests.foo']['retval_ns'] == 0
+
+    def test_record_partial(self) -> None:
+        metrics.reset()
+        metrics.record_partial('tests.foo')
+        metrics.record_partial('tests.foo')
+
+        assert metrics.partial() == {'tests.foo': 2}
+
+        metrics.reset()
+        assert metrics.partial() == {}
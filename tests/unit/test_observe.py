@@ -0,0 +1,239 @@
+from typing import Any, Iterator
+import logging
+import time
+import pytest
+from src.introspector import observe
+from src.introspector.observe import Observation
+from src.introspector.validator import compile_type
+
+
+@pytest.fixture(autouse=True)
+def reporter(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    # The background thread is put to sleep, the tests flush.
+    monkeypatch.setitem(observe._SETTINGS, 'interval', 3600)
+    observe.reset()
+    observe._WAKE.set()
+    time.sleep(0.01)
+    observe._WAKE.clear()
+    yield
+    observe.reset()
+
+
+class TestObserve:
+    def test_push(self) -> None:
+        observations: list[Observation] = []
+        observe.push(
+            'app.foo',
+            'a',
+            compile_type(int),
+            'x',
+            observations.append,
+        )
+
+        assert observations == []
+        assert observe.snapshot()['pending'] == 1
+        assert observe.flush() == 1
+        assert observations == [
+            Observation(
+                'app.foo',
+                'a',
+                'Expected <class \'int\'>. Mismatch on <class \'str\'>',
+            )
+        ]
+
+    def test_dedupe(self) -> None:
+        observations: list[Observation] = []
+
+        for value in ('x', 'y', 'z', 1.5):
+            observe.push(
+                'app.foo',
+                'a',
+                compile_type(int),
+                value,
+                observations.append,
+            )
+
+        assert observe.flush() == 2
+        assert [observation.count for observation in observations] == [1, 1]
+        assert observe.snapshot()['suppressed'] == 2
+
+    def test_repeat(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        observations: list[Observation] = []
+        monkeypatch.setitem(observe._SETTINGS, 'repeat_interval', 1e-9)
+
+        observe.push(
+            'app.foo',
+            'a',
+            compile_type(int),
+            'x',
+            observations.append,
+        )
+        observe.flush()
+        time.sleep(0.001)
+        observe.push(
+            'app.foo',
+            'a',
+            compile_type(int),
+            'y',
+            observations.append,
+        )
+        observe.flush()
+
+        assert len(observations) == 2
+
+    def test_dropped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(observe._SETTINGS, 'max_queue', 2)
+
+        for value in ('x', 'y', 'z'):
+            observe.push('app.foo', 'a', compile_type(int), value)
+
+        assert observe.snapshot() == {
+            'observed': 2,
+            'dropped': 1,
+            'reported': 0,
+            'suppressed': 0,
+            'failed': 0,
+            'pending': 2,
+        }
+
+    def test_fixed(self) -> None:
+        value: list[Any] = ['a']
+        observe.push('app.foo', 'a', compile_type(list[int]), value)
+        value[0] = 1
+
+        assert observe.flush() == 0
+
+    def test_logging(self, caplog: pytest.LogCaptureFixture) -> None:
+        observe.push('app.foo', 'return', compile_type(int), 'x')
+
+        with caplog.at_level(logging.WARNING, 'introspector'):
+            observe.flush()
+
+        assert caplog.messages == [
+            '[app.foo] Return value error. '
+            'Expected <class \'int\'>. Mismatch on <class \'str\'>'
+        ]
+
+    def test_callback_error(self, caplog: pytest.LogCaptureFixture) -> None:
+        def callback(observation: Observation) -> None:
+            raise RuntimeError('down')
+
+        observe.push('app.foo', 'a', compile_type(int), 'x', callback)
+
+        with caplog.at_level(logging.ERROR, 'introspector'):
+            assert observe.flush() == 1
+
+        assert 'The mismatch callback failed.' in caplog.text
+
+    def test_failed(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        observations: list[Observation] = []
+        run: Any = observe.walker.run
+
+        def fail_once(validator: Any, value: Any) -> None:
+            monkeypatch.setattr(observe.walker, 'run', run)
+            raise RuntimeError('dictionary changed size during iteration')
+
+        monkeypatch.setattr(observe.walker, 'run', fail_once)
+
+        for value in ('x', 1.5):
+            observe.push(
+                'app.foo',
+                'a',
+                compile_type(int),
+                value,
+                observations.append,
+            )
+
+        with caplog.at_level(logging.ERROR, 'introspector'):
+            assert observe.flush() == 1
+
+        assert 'could not be reported' in caplog.text
+        assert len(observations) == 1
+        assert observe.snapshot()['failed'] == 1
+        assert observe.snapshot()['pending'] == 0
+
+    def test_worker_failed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        observations: list[Observation] = []
+        run: Any = observe.walker.run
+
+        def fail_once(validator: Any, value: Any) -> None:
+            monkeypatch.setattr(observe.walker, 'run', run)
+            raise RuntimeError('dictionary changed size during iteration')
+
+        monkeypatch.setattr(observe.walker, 'run', fail_once)
+        monkeypatch.setitem(observe._SETTINGS, 'interval', 0.01)
+        observe._WAKE.set()
+
+        for value in ('x', 1.5):
+            observe.push(
+                'app.foo',
+                'a',
+                compile_type(int),
+                value,
+                observations.append,
+            )
+            deadline: float = time.monotonic() + 5
+
+            while observe.snapshot()['pending'] and (
+                time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+
+        assert observe.snapshot()['failed'] == 1
+        assert len(observations) == 1
+        assert observe._WORKER.is_alive()
+
+    def test_worker(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        observations: list[Observation] = []
+        monkeypatch.setitem(observe._SETTINGS, 'interval', 0.01)
+        observe._WAKE.set()
+        observe.push(
+            'app.foo',
+            'a',
+            compile_type(int),
+            'x',
+            observations.append,
+        )
+        deadline: float = time.monotonic() + 5
+
+        while not observations and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(observations) == 1
+        assert observe._WORKER.daemon
+
+    @pytest.mark.parametrize(
+        'observation, expected',
+        [
+            (Observation('f', 'a', 'Bad.'), '[f] Arg \'a\' error. Bad.'),
+            (
+                Observation('f', 'return', 'Bad.'),
+                '[f] Return value error. Bad.',
+            ),
+            (
+                Observation('f', 'a', 'Bad.', 3),
+                '[f] Arg \'a\' error. Bad. (3 times)',
+            ),
+        ],
+    )
+    def test_str(self, observation: Observation, expected: str) -> None:
+        assert str(observation) == expected
+
+    @pytest.mark.parametrize(
+        'settings',
+        [{'max_queue': 0}, {'interval': -1}, {'repeat_interval': 0}],
+    )
+    def test_configure_value(self, settings: dict[str, float]) -> None:
+        with pytest.raises(ValueError):
+            observe.configure(**settings)
+
+    def test_configure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(observe, '_SETTINGS', dict(observe._SETTINGS))
+        observe.configure(max_queue=5)
+
+        assert observe._SETTINGS['max_queue'] == 5
+        assert observe._SETTINGS['repeat_interval'] == 60
@@ -0,0 +1,220 @@
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Generator,
+    Iterable,
+    Iterator,
+)
+import asyncio
+import pytest
+from src.introspector.proxy import (
+    AsyncGeneratorProxy,
+    AsyncIterableProxy,
+    AsyncIteratorProxy,
+    GeneratorProxy,
+    IterableProxy,
+    IteratorProxy,
+)
+from src.introspector.validator import compile_type
+
+
+class TestProxy:
+    class Stream:
+        def __iter__(self) -> Iterator[int]:
+            return iter([1, 2])
+
+    @pytest.mark.parametrize(
+        'items, throwable',
+        [
+            ([], None),
+            ([1, 2, None], None),
+            ([1, 'a', 3], TypeError),
+        ],
+    )
+    def test_iterator_proxy(
+        self,
+        items: list[Any],
+        throwable: TypeError | None,
+    ) -> None:
+        proxy: IteratorProxy = IteratorProxy(iter(items), compile_type(int))
+
+        if throwable:
+            with pytest.raises(throwable, match='Item 1 error'):
+                list(proxy)
+        else:
+            assert list(proxy) == items
+
+    def test_iterator_proxy_lazy(self) -> None:
+        consumed: list[int] = []
+
+        def stream() -> Iterator[Any]:
+            for item in [1, 2, 'a', 4]:
+                consumed.append(item)
+                yield item
+
+        proxy: IteratorProxy = IteratorProxy(stream(), compile_type(int))
+
+        assert next(proxy) == 1
+        assert consumed == [1]
+        assert next(proxy) == 2
+
+        with pytest.raises(TypeError):
+            next(proxy)
+
+        assert consumed == [1, 2, 'a']
+
+    def test_iterable_proxy(self) -> None:
+        proxy: IterableProxy = IterableProxy(
+            range(3),
+            compile_type(int),
+            'label. ',
+        )
+
+        assert list(proxy) == list(proxy) == [0, 1, 2]
+
+        with pytest.raises(TypeError, match='^label. Item 0'):
+            list(IterableProxy('ab', compile_type(int), 'label. '))
+
+    @pytest.mark.parametrize(
+        'sent, returned, throwable, match',
+        [
+            ('a', True, None, None),
+            (1, True, TypeError, 'Sent value error'),
+            ('a', 'b', TypeError, 'Generator return value error'),
+        ],
+    )
+    def test_generator_proxy(
+        self,
+        sent: Any,
+        returned: Any,
+        throwable: TypeError | None,
+        match: str | None,
+    ) -> None:
+        def generator() -> Generator[int, str, bool]:
+            received: str = yield 1
+            yield len(received)
+            return returned
+
+        proxy: GeneratorProxy = GeneratorProxy(
+            generator(),
+            compile_type(int),
+            compile_type(str),
+            compile_type(bool),
+        )
+
+        assert next(proxy) == 1
+
+        if throwable:
+            with pytest.raises(throwable, match=match):
+                proxy.send(sent)
+                next(proxy)
+        else:
+            assert proxy.send(sent) == 1
+
+            with pytest.raises(StopIteration) as stop:
+                next(proxy)
+
+            assert stop.value.value is returned
+
+    def test_report(self) -> None:
+        reported: list[Any] = []
+        proxy: IteratorProxy = IteratorProxy(
+            iter([1, 'a', 2, 'b']),
+            compile_type(int),
+            report=lambda validator, item: reported.append(item),
+        )
+
+        assert list(proxy) == [1, 'a', 2, 'b']
+        assert reported == ['a', 'b']
+
+    def test_async_iterator_proxy(self) -> None:
+        async def stream(items: list[Any]) -> AsyncIterator[Any]:
+            for item in items:
+                yield item
+
+        async def consume(items: list[Any]) -> list[Any]:
+            proxy: AsyncIteratorProxy = AsyncIteratorProxy(
+                stream(items),
+                compile_type(int),
+            )
+            return [item async for item in proxy]
+
+        assert asyncio.run(consume([1, 2])) == [1, 2]
+
+        with pytest.raises(TypeError):
+            asyncio.run(consume([1, 'a']))
+
+    @pytest.mark.parametrize(
+        'sent, throwable',
+        [(None, None), ('a', None), (1, TypeError)],
+    )
+    def test_async_generator_proxy(
+        self,
+        sent: Any,
+        throwable: TypeError | None,
+    ) -> None:
+        async def stream() -> AsyncGenerator[Any, Any]:
+            received: Any = yield 1
+
+            while True:
+                received = yield received
+
+        async def consume() -> list[Any]:
+            proxy: AsyncGeneratorProxy = AsyncGeneratorProxy(
+                stream(),
+                compile_type(int | str | None),
+                compile_type(str | None),
+            )
+
+            try:
+                return [await anext(proxy), await proxy.asend(sent)]
+            finally:
+                await proxy.aclose()
+
+        if throwable:
+            with pytest.raises(throwable, match='Sent value error'):
+                asyncio.run(consume())
+        else:
+            assert asyncio.run(consume()) == [1, sent]
+
+    def test_async_iterable_proxy(self) -> None:
+        class AsyncStream:
+            def __init__(self, items: list[Any]) -> None:
+                self._items = items
+
+            async def _stream(self) -> AsyncIterator[Any]:
+                for item in self._items:
+                    yield item
+
+            def __aiter__(self) -> AsyncIterator[Any]:
+                return self._stream()
+
+        async def consume(items: list[Any]) -> list[Any]:
+            proxy: AsyncIterableProxy = AsyncIterableProxy(
+                AsyncStream(items),
+                compile_type(int),
+            )
+            return [item async for item in proxy] + [
+                item async for item in proxy
+            ]
+
+        assert asyncio.run(consume([1, 2])) == [1, 2, 1, 2]
+
+        with pytest.raises(TypeError):
+            asyncio.run(consume([1, 'a']))
+
+    @pytest.mark.parametrize(
+        'type_, value, expected',
+        [
+            (Iterator[int], iter([1]), IteratorProxy),
+            (Iterable[int], iter([1]), IteratorProxy),
+            (Iterable[int], range(3), range),
+            (Iterable[int], Stream(), IterableProxy),
+            (Iterable[int], [1, 2], list),
+            (Generator[int, None, None], (i for i in [1]), GeneratorProxy),
+            (Iterator[int] | None, iter([1]), IteratorProxy),
+        ],
+    )
+    def test_wrap(self, type_: Any, value: Any, expected: type) -> None:
+        assert type(compile_type(type_).wrap(value)) is expected
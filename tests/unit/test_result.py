@@ -0,0 +1,41 @@
+import pytest
+from src.introspector.result import Mismatch, ValidationResult
+
+
+class TestMismatch:
+    @pytest.mark.parametrize(
+        'mismatch, expected',
+        [
+            (
+                Mismatch("a[1]['x']", int, str),
+                "a[1]['x']: Expected <class 'int'>. Mismatch on <class 'str'>",
+            ),
+            (
+                Mismatch('', int, str),
+                "Expected <class 'int'>. Mismatch on <class 'str'>",
+            ),
+            (Mismatch('a', int, str, 'Missing typing.'), 'a: Missing typing.'),
+        ],
+    )
+    def test_str(self, mismatch: Mismatch, expected: str) -> None:
+        assert str(mismatch) == expected
+
+
+class TestValidationResult:
+    def test_add(self) -> None:
+        result: ValidationResult = ValidationResult(2)
+        assert result and not result.full
+
+        result.add('a', int, 'a')
+        result.add('b', int, 'b')
+        assert not result and result.full and not result.truncated
+
+        result.add('c', int, 'c')
+        assert result.truncated
+        assert [mismatch.path for mismatch in result.mismatches] == ['a', 'b']
+        assert str(result).endswith('... (stopped after 2 errors)')
+
+    @pytest.mark.parametrize('max_errors', [0, -1])
+    def test_max_errors(self, max_errors: int) -> None:
+        with pytest.raises(ValueError):
+            ValidationResult(max_errors)
@@ -0,0 +1,67 @@
+from typing import Any
+import pytest
+from src.introspector.sample import Sample
+
+
+class TestSample:
+    @pytest.mark.parametrize(
+        'strategy, size, throwable',
+        [
+            ('first', 10, None),
+            ('random', 1, None),
+            ('fraction', 0.5, None),
+            ('fraction', 1, None),
+            ('first', 0, ValueError),
+            ('random', 2.5, ValueError),
+            ('fraction', 0, ValueError),
+            ('fraction', 1.5, ValueError),
+            ('last', 10, ValueError),
+        ],
+    )
+    def test_init(
+        self,
+        strategy: str,
+        size: int | float,
+        throwable: ValueError | None,
+    ) -> None:
+        if throwable:
+            with pytest.raises(throwable):
+                Sample(strategy, size)
+        else:
+            Sample(strategy, size)
+
+    @pytest.mark.parametrize(
+        'sample, values, expected',
+        [
+            (Sample.first(3), list(range(10)), [0, 1, 2]),
+            (Sample.first(3), [0, 1], [0, 1]),
+            (Sample.first(3), {0: 'a', 1: 'b', 2: 'c', 3: 'd'}, [0, 1, 2]),
+            (Sample.fraction(0.25), tuple(range(10)), [0, 4, 8]),
+            (Sample.fraction(0.5), set(range(4)), [0, 2]),
+            (Sample.fraction(1), list(range(3)), [0, 1, 2]),
+            (Sample.fraction(0.6), list(range(10)), [0, 1, 3, 5, 6, 8]),
+            (Sample.fraction(0.7), set(range(10)), [0, 1, 2, 4, 5, 7, 8]),
+            (Sample.fraction(0.9), tuple(range(10)), list(range(9))),
+            (Sample.random(3), {0: 'a'}, [0]),
+        ],
+    )
+    def test_select(self, sample: Sample, values: Any, expected: Any) -> None:
+        assert list(sample.select(values)) == expected
+
+    @pytest.mark.parametrize(
+        'values',
+        [list(range(100)), set(range(100)), dict.fromkeys(range(100))],
+    )
+    def test_select_random(self, values: Any) -> None:
+        selected: list[int] = list(Sample.random(10).select(values))
+
+        assert len(selected) == len(set(selected)) == 10
+        assert set(selected) <= set(values)
+
+    @pytest.mark.parametrize('size', [0.3, 0.6, 0.7, 0.9])
+    def test_select_fraction(self, size: float) -> None:
+        for values in (list(range(1_000)), set(range(1_000))):
+            selected: list[int] = list(Sample.fraction(size).select(values))
+
+            assert len(selected) == len(set(selected))
+            assert abs(len(selected) - size * 1_000) <= 1
@@ -0,0 +1,154 @@
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple, NotRequired, Optional, TypedDict
+import pytest
+from src.introspector.introspector import Introspector
+from src.introspector.result import ValidationResult
+from src.introspector.validator import compile_type
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Node:
+    value: int
+    children: list['Node']
+
+
+class Pair(NamedTuple):
+    key: str
+    value: float
+
+
+class Movie(TypedDict):
+    title: str
+    year: NotRequired[int]
+    cast: list['Actor']
+
+
+class Actor(TypedDict, total=False):
+    name: str
+    point: Optional[Point]
+
+
+class TestStructs:
+    @pytest.mark.parametrize('backend', ['interpreted', 'codegen'])
+    @pytest.mark.parametrize(
+        'type_, value, throwable',
+        [
+            (Point, Point(1, 2), None),
+            (Point, Point(1, 2, ['a']), None),
+            (Point, Point(1, 'b'), TypeError),
+            (Point, Point(1, 2, [1]), TypeError),
+            (Point, (1, 2), TypeError),
+            (Point, None, None),
+            (list[Point], [Point(1, 2), Point(3, 4)], None),
+            (list[Point], [Point(1, 2), Point(3, 4.5)], TypeError),
+            (Node, Node(1, [Node(2, []), Node(3, [Node(4, [])])]), None),
+            (
+                Node,
+                Node(1, [Node(2, []), Node(3, [Node('4', [])])]),
+                TypeError,
+            ),
+            (Pair, Pair('a', 1.5), None),
+            (Pair, Pair('a', 1), TypeError),
+            (Pair, ('a', 1.5), TypeError),
+            (Movie, {'title': 'a', 'year': 1, 'cast': []}, None),
+            (Movie, {'title': 'a', 'cast': [{}]}, None),
+            (Movie, {'title': 'a', 'cast': [{'name': 'b'}]}, None),
+            (Movie, {'title': 'a', 'year': '1', 'cast': []}, TypeError),
+            (Movie, {'title': 'a'}, TypeError),
+            (Movie, {'title': 'a', 'cast': [], 'extra': 1}, TypeError),
+            (Movie, {'title': 'a', 'cast': [{'name': 1}]}, TypeError),
+            (
+                Movie,
+                {'title': 'a', 'cast': [{'point': Point(1, 2)}]},
+                None,
+            ),
+            (
+                Movie,
+                {'title': 'a', 'cast': [{'point': Point(1, None)}]},
+                None,
+            ),
+            (
+                Movie,
+                {'title': 'a', 'cast': [{'point': Point('1', 2)}]},
+                TypeError,
+            ),
+            (Movie | Pair, Pair('a', 1.5), None),
+            (Movie | Pair, {'title': 'a', 'cast': []}, None),
+            (Movie | Pair, {'title': 1, 'cast': []}, TypeError),
+        ],
+    )
+    def test_inspect(
+        self,
+        type_: Any,
+        value: Any,
+        throwable: TypeError | None,
+        backend: str,
+    ) -> None:
+        if throwable:
+            with pytest.raises(throwable):
+                Introspector(type_, value, backend=backend).inspect()
+        else:
+            Introspector(type_, value, backend=backend).inspect()
+
+    @pytest.mark.parametrize(
+        'type_, value, expected',
+        [
+            (Point, Point(1, 'b', [1]), ['.y', '.tags[0]']),
+            (Pair, Pair(1, 1), ['.key', '.value']),
+            (
+                Node,
+                Node(1, [Node(2, []), Node(3, [Node('4', [])])]),
+                ['.children[1].children[0].value'],
+            ),
+            (
+                Movie,
+                {'title': 1, 'extra': 2, 'cast': [{'name': 1}]},
+                ['', "['title']", "['cast'][0]['name']"],
+            ),
+        ],
+    )
+    def test_collect(
+        self,
+        type_: Any,
+        value: Any,
+        expected: list[str],
+    ) -> None:
+        result: ValidationResult = Introspector(type_, value).collect()
+
+        assert [mismatch.path for mismatch in result.mismatches] == expected
+
+    def test_keys_error(self) -> None:
+        with pytest.raises(TypeError, match=r'Missing keys \[\'cast\'\]'):
+            Introspector(Movie, {'title': 'a'}).inspect()
+
+        with pytest.raises(TypeError, match=r'Unexpected keys \[\'x\'\]'):
+            Introspector(Movie, {'title': 'a', 'cast': [], 'x': 1}).inspect()
+
+    def test_plan_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        validator: Any = compile_type(Point)
+        validator.check(Point(1, 2))
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError('The type hints must not be resolved.')
+
+        monkeypatch.setattr(
+            'src.introspector.validator.get_type_hints',
+            fail,
+        )
+        assert validator.check(Point(3, 4))
+        Introspector(list[Point], [Point(1, 2)]).inspect()
+
+    def test_unresolved(self) -> None:
+        @dataclass
+        class Local:
+            a: 'Unknown'  # noqa: F821
+
+        with pytest.raises(TypeError, match='Unresolved typing'):
+            Introspector(Local, Local(1)).inspect()
@@ -0,0 +1,298 @@
+from types import MappingProxyType, NoneType
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Collection,
+    Container,
+    Hashable,
+    ItemsView,
+    KeysView,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Reversible,
+    Sequence,
+    Sized,
+    TypeVar,
+)
+from collections import OrderedDict, abc, deque
+import pytest
+from src.introspector import validator as validator_module
+from src.introspector.sample import Sample
+from src.introspector.validator import (
+    AbstractClassValidator,
+    AnyValidator,
+    CallableValidator,
+    ClassValidator,
+    CollectionValidator,
+    DictValidator,
+    ListValidator,
+    MappingValidator,
+    SequenceValidator,
+    SetValidator,
+    TupleValidator,
+    UnionValidator,
+    Validator,
+    compile_type,
+    is_instance,
+)
+
+
+class Table(abc.Mapping):
+    def __init__(self, items: dict[Any, Any]) -> None:
+        self._items = items
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._items[key]
+
+    def __iter__(self) -> abc.Iterator[Any]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class Row(abc.Sequence):
+    def __init__(self, *items: Any) -> None:
+        self._items = items
+
+    def __getitem__(self, index: int) -> Any:
+        if isinstance(index, slice):
+            raise TypeError('Slices are not supported.')
+
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class TestCompileType:
+    T = TypeVar('T')
+
+    @pytest.mark.parametrize(
+        'type_, expected',
+        [
+            (int, ClassValidator),
+            (Any, AnyValidator),
+            (T, AnyValidator),
+            (int | None, UnionValidator),
+            (Optional[int], UnionValidator),
+            (Callable[[int], str], CallableValidator),
+            (list[int], ListValidator),
+            (set[int], SetValidator),
+            (tuple[int, str], TupleValidator),
+            (tuple[int, ...], TupleValidator),
+            (dict[str, int], DictValidator),
+            (list, ClassValidator),
+            (frozenset[int], ClassValidator),
+            (Sequence[int], SequenceValidator),
+            (MutableSequence[int], SequenceValidator),
+            (Collection[int], CollectionValidator),
+            (AbstractSet[int], CollectionValidator),
+            (Mapping[str, int], MappingValidator),
+            (abc.MutableMapping[str, int], MappingValidator),
+            (Sequence, SequenceValidator),
+            (KeysView[str], CollectionValidator),
+            (ItemsView[str, int], CollectionValidator),
+            (Container[int], AbstractClassValidator),
+            (Hashable, AbstractClassValidator),
+            (abc.Awaitable, AbstractClassValidator),
+        ],
+    )
+    def test_compile_type(self, type_: TypeVar, expected: type) -> None:
+        assert type(compile_type(type_)) is expected
+
+    def test_compile_type_cache(self) -> None:
+        validator: Validator = compile_type(dict[str, list[int | None]])
+
+        assert compile_type(dict[str, list[int | None]]) is validator
+        assert compile_type(list[int | None]) is validator._val
+
+    @pytest.mark.parametrize('type_', [dict[str], abc.Mapping[str]])
+    def test_compile_type_malformed(self, type_: TypeVar) -> None:
+        with pytest.raises(TypeError):
+            compile_type(type_)
+
+    @pytest.mark.parametrize(
+        'type_, value, throwable',
+        [
+            (tuple[int, ...], (), None),
+            (tuple[int, ...], (1, 2, 3), None),
+            (tuple[int, ...], (1, 'a', 3), TypeError),
+            (tuple[int | str, ...], (1, 'a', 3), None),
+        ],
+    )
+    def test_validate(
+        self,
+        type_: TypeVar,
+        value: Any,
+        throwable: TypeError | None,
+    ) -> None:
+        validator: Validator = compile_type(type_)
+
+        if throwable:
+            with pytest.raises(throwable):
+                validator.validate(value)
+        else:
+            validator.validate(value)
+
+    @pytest.mark.parametrize(
+        'type_, value, expected',
+        [
+            (int, 1, True),
+            (int, None, True),
+            (int, True, False),
+            (int | float | str | None, 'a', True),
+            (int | float | str | None, b'a', False),
+            (list[int] | list[str], ['a', 'b'], True),
+            (list[int] | list[str], [1, 'b'], False),
+            (list[int] | Callable, print, True),
+            (list[int] | Any, b'a', True),
+            (tuple[int, str], (1, 'a'), True),
+            (tuple[int, str], (1, 'a', 2), False),
+            (dict[str, list[int | None]], {'a': [1, None]}, True),
+            (dict[str, list[int | None]], {'a': [1, 'b']}, False),
+            (Sequence[int], [1, 2], True),
+            (Sequence[int], (1, 2), True),
+            (Sequence[int], deque([1, 'a']), False),
+            (Sequence[int], Row(1, 2), True),
+            (Sequence[int], {1, 2}, False),
+            (Sequence[str], 'ab', True),
+            (MutableSequence[int], (1, 2), False),
+            (AbstractSet[int], frozenset((1, 2)), True),
+            (Collection[int], {1: 'a'}, True),
+            (Mapping[str, int], Table({'a': 1}), True),
+            (Mapping[str, int], Table({'a': 'b'}), False),
+            (Mapping[str, int], OrderedDict(a=1), True),
+            (Mapping[str, int], MappingProxyType({'a': 1}), True),
+            (Mapping[str, int], [('a', 1)], False),
+            (MutableMapping[str, int], MappingProxyType({'a': 1}), False),
+            (int | Sequence[int], (1, 2), True),
+            (int | Mapping[str, int], Table({'a': 'b'}), False),
+            (Container[int], [1], True),
+            (Container[int], 1, False),
+            (Sized, 'ab', True),
+            (Hashable, (1, 2), True),
+            (Hashable, [1, 2], False),
+            (Reversible[int], range(3), True),
+            (KeysView[str], {'a': 1}.keys(), True),
+            (KeysView[str], {1: 'a'}.keys(), False),
+            (KeysView[str], {'a': 1}.values(), False),
+            (ItemsView[str, int], {'a': 1}.items(), True),
+            (ItemsView[str, int], {'a': 'b'}.items(), False),
+        ],
+    )
+    def test_check(self, type_: TypeVar, value: Any, expected: bool) -> None:
+        assert compile_type(type_).check(value) is expected
+
+    def test_union_dispatch(self) -> None:
+        validator: UnionValidator = compile_type(
+            int | str | list[int] | list[str] | Callable
+        )
+
+        assert validator._leaves == {int, str, NoneType}
+        assert validator._dispatch[list] == (
+            compile_type(list[int]),
+            compile_type(list[str]),
+        )
+        assert validator._fallbacks == (compile_type(Callable),)
+
+    @pytest.mark.parametrize(
+        'type_, values, expected',
+        [
+            (int, [1, 2, None], True),
+            (int, [1, 2, True], False),
+            (int | str, (1, 'a', None), True),
+            (int | str, iter([1, 'a', 2.5]), False),
+            (int | list[int], [1, [2, 3]], True),
+            (int | list[int], [1, [2, 'a']], False),
+            (list[int], [[1], [2, 3]], True),
+            (list[int], [[1], [2, 'a']], False),
+            (Any, [1, 'a'], True),
+            (dict[str, int | None], [{'a': 1}, {}, None, {'b': None}], True),
+            (dict[str, int | None], [{'a': 1}, {'b': 'c'}], False),
+            (dict[str, int | None], [{'a': 1}, {2: 3}], False),
+            (dict[str, int], [{'a': 1}, [('b', 2)]], False),
+            (dict[str, int], iter([{'a': 1}, {'b': 2}]), True),
+            (dict[str, list[int]], [{'a': [1]}, {'b': ['c']}], False),
+            (tuple[int, str], [(1, 'a'), None, (2, 'b')], True),
+            (tuple[int, str], [(1, 'a'), (2, 3)], False),
+            (tuple[int, str], [(1, 'a'), (2, 'b', 3)], False),
+            (tuple[int, str], [(1, 'a'), ()], False),
+            (tuple[int, str], [(1, 'a'), [2, 'b']], False),
+            (tuple[()], [(), ()], True),
+            (tuple[int, ...], [(1, 2), (), (3,)], True),
+            (tuple[int, ...], [(1, 2), ('a',)], False),
+        ],
+    )
+    def test_check_many(
+        self,
+        type_: TypeVar,
+        values: Any,
+        expected: bool,
+    ) -> None:
+        assert compile_type(type_).check_many(values) is expected
+
+    @pytest.mark.parametrize(
+        'type_, value, path',
+        [
+            (list[dict[str, int]], [{'a': 1}] * 5 + [{'a': 'b'}], "[5]['a']"),
+            (list[tuple[int, str]], [(1, 'a')] * 5 + [(2, 3)], '[5][1]'),
+        ],
+    )
+    def test_columns_path(self, type_: TypeVar, value: Any, path: str) -> None:
+        assert compile_type(type_).report(value).mismatches[0].path == path
+
+    def test_abstract_sample(self) -> None:
+        validator: Validator = compile_type(Sequence[int], Sample.first(2))
+
+        assert validator.check(Row(1, 2, 'a'))
+        assert not validator.check(Row(1, 'a', 2))
+
+    @pytest.mark.parametrize(
+        'type_, value, path',
+        [
+            (Sequence[int], Row(1, 'a'), '[1]'),
+            (Mapping[str, int], Table({'a': 'b'}), "['a']"),
+        ],
+    )
+    def test_abstract_path(
+        self,
+        type_: TypeVar,
+        value: Any,
+        path: str,
+    ) -> None:
+        assert compile_type(type_).report(value).mismatches[0].path == path
+
+    def test_is_instance(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(validator_module, '_INSTANCES', {})
+
+        assert is_instance(Row(), abc.Sequence)
+        assert not is_instance(Table({}), abc.Sequence)
+        assert validator_module._INSTANCES == {
+            (abc.Sequence, Row): True,
+            (abc.Sequence, Table): False,
+        }
+
+        monkeypatch.setattr(validator_module, 'isinstance', None, False)
+        assert is_instance(Row(1), abc.Sequence)
+
+    def test_is_instance_bounded(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(validator_module, '_INSTANCES', {})
+        monkeypatch.setattr(validator_module, '_MAX_INSTANCES', 2)
+
+        for index in range(5):
+            row: type = type(f'Row{index}', (Row,), {})
+            assert is_instance(row(), abc.Sequence)
+            assert len(validator_module._INSTANCES) <= 2
+
+        assert (abc.Sequence, row) in validator_module._INSTANCES
+
+    def test_validate_error(self) -> None:
+        with pytest.raises(TypeError, match='Expected <class \'int\'>'):
+            compile_type(dict[str, list[int]]).validate({'a': [1, 'b']})
@@ -0,0 +1,205 @@
+from dataclasses import dataclass
+from typing import Annotated, Any, Callable, Iterable, Optional, TypedDict
+import pytest
+from src.introspector import walker
+from src.introspector.arrays import Ndim
+from src.introspector.introspector import Introspector
+from src.introspector.sample import Sample
+from src.introspector.validator import compile_type
+from src.introspector.walker import Budget, IterativeValidator
+
+
+@dataclass
+class Link:
+    value: int
+    next: Optional['Link'] = None
+
+
+class Tree(TypedDict):
+    name: str
+    children: list['Tree']
+
+
+def chain(depth: int, tail: Any = None) -> Link:
+    link: Link | None = tail
+
+    for value in range(depth):
+        link = Link(value, link)
+
+    return link
+
+
+def tree(depth: int, leaf: Any = 'leaf') -> Tree:
+    node: Tree = {'name': leaf, 'children': []}
+
+    for _ in range(depth):
+        node = {'name': 'node', 'children': [node]}
+
+    return node
+
+
+class TestWalker:
+    @pytest.mark.parametrize(
+        'type_, value',
+        [
+            (int, 1),
+            (int, True),
+            (int, None),
+            (Any, object()),
+            (list[int], [1, 2, 3]),
+            (list[int], [1, 'a', 3]),
+            (list[int], (1, 2)),
+            (list[list[int]], [[1], [2, 3], []]),
+            (list[list[int]], [[1], [2, 'a']]),
+            (set[str], {'a', 'b'}),
+            (set[str], {'a', 1}),
+            (tuple[int, str], (1, 'a')),
+            (tuple[int, str], (1, 'a', 2)),
+            (tuple[int, str], (1, 2)),
+            (tuple[list[int], ...], ([1], [2])),
+            (tuple[list[int], ...], ([1], ['b'])),
+            (dict[str, list[int]], {'a': [1], 'b': []}),
+            (dict[str, list[int]], {'a': [1], 'b': ['c']}),
+            (dict[str, int], {1: 1}),
+            (int | str, 'a'),
+            (int | str, 1.5),
+            (list[int] | list[str], ['a', 'b']),
+            (list[int] | list[str], [1, 'b']),
+            (list[int] | dict[str, int], {'a': 1}),
+            (list[int] | dict[str, int], {'a': 'b'}),
+            (Optional[list[int]], None),
+            (Iterable[int], [1, 2]),
+            (Iterable[int], ['a']),
+            (Iterable[int], 1),
+            (Callable[[int], int], len),
+            (Callable[[int], int], 1),
+            (Annotated[list[int], Ndim(1)], [1, 2]),
+            (Annotated[list[int], Ndim(1)], [1, 'a']),
+            (Link, chain(3)),
+            (Link, chain(3, Link('a'))),
+            (Link, Link(1, 2)),
+            (Tree, tree(3)),
+            (Tree, tree(3, 1)),
+            (Tree, {'name': 'a'}),
+        ],
+    )
+    def test_parity(self, type_: Any, value: Any) -> None:
+        validator: Any = compile_type(type_)
+        expected: TypeError | None = None
+
+        try:
+            validator.validate(value)
+        except TypeError as e:
+            expected = e
+
+        assert walker.check(validator, value) is (expected is None)
+
+        if expected is None:
+            walker.validate(validator, value)
+        else:
+            with pytest.raises(TypeError):
+                walker.validate(validator, value)
+
+    @pytest.mark.parametrize(
+        'type_, value, message',
+        [
+            (list[list[int]], [[1], [2, 'a']], 'Mismatch on <class \'str\'>'),
+            (tuple[int, str], (1, 'a', 2), 'Tuple sizes doesn\'t matches.'),
+            (Tree, {'name': 'a'}, r'Missing keys \[\'children\'\]'),
+            (Link, chain(3, Link('a')), 'Mismatch on <class \'str\'>'),
+        ],
+    )
+    def test_message(self, type_: Any, value: Any, message: str) -> None:
+        with pytest.raises(TypeError, match=message):
+            walker.validate(compile_type(type_), value)
+
+    @pytest.mark.parametrize('engine', ['auto', 'iterative'])
+    @pytest.mark.parametrize(
+        'type_, value, throwable',
+        [
+            (Link, chain(5_000), None),
+            (Link, chain(5_000, Link('a')), TypeError),
+            (Tree, tree(2_000), None),
+            (Tree, tree(2_000, 1), TypeError),
+            (list[Link], [chain(5_000), chain(10)], None),
+        ],
+    )
+    def test_deep(
+        self,
+        type_: Any,
+        value: Any,
+        throwable: TypeError | None,
+        engine: str,
+    ) -> None:
+        if throwable:
+            with pytest.raises(throwable):
+                Introspector(type_, value, engine=engine).inspect()
+        else:
+            Introspector(type_, value, engine=engine).inspect()
+
+    def test_recursive_engine(self) -> None:
+        with pytest.raises(RecursionError):
+            compile_type(Link).validate(chain(5_000))
+
+    def test_sample(self) -> None:
+        validator: Any = compile_type(list[list[int]], Sample.first(2))
+
+        assert walker.check(validator, [[1], [2], ['a']])
+        assert not walker.check(validator, [[1], ['a'], [3]])
+
+    def test_iterative_validator(self) -> None:
+        validator: IterativeValidator = IterativeValidator(
+            compile_type(Link)
+        )
+
+        validator.validate(chain(5_000))
+        assert validator.check(chain(5_000))
+        assert not validator.check(chain(5_000, Link('a')))
+
+        with pytest.raises(TypeError):
+            validator.validate(chain(5_000, Link('a')))
+
+    def test_engine_value(self) -> None:
+        with pytest.raises(ValueError):
+            Introspector(int, 1, engine='threaded')
+
+    @pytest.mark.parametrize(
+        'nodes, value, expected',
+        [
+            (4, [[1], [2], ['a']], True),
+            (5, [[1], [2], ['a']], False),
+            (100, [[1], ['a'], [3]], False),
+            (0, [['a']], True),
+        ],
+    )
+    def test_budget_nodes(
+        self,
+        nodes: int,
+        value: Any,
+        expected: bool,
+    ) -> None:
+        budget: Budget = Budget(nodes=nodes)
+        node: Any = walker.walk(compile_type(list[list[int]]), value, budget)
+
+        assert (node is None) is expected
+        assert budget.exhausted is (expected and nodes < 100)
+
+    def test_budget_time(self) -> None:
+        budget: Budget = Budget(time_us=0)
+        value: list[list[Any]] = [[1]] * 1_000 + [['a']]
+
+        walker.validate(compile_type(list[list[int]]), value, budget)
+        assert budget.exhausted
+
+        with pytest.raises(TypeError):
+            walker.validate(
+                compile_type(list[list[int]]),
+                value,
+                Budget(time_us=10**9),
+            )
+
+    def test_budget_stride(self) -> None:
+        budget: Budget = Budget(time_us=0)
+
+        assert all(budget.spend() for _ in range(Budget.STRIDE - 1))
+        assert not budget.spend()